@@ -1,121 +1,80 @@
 # 01_pull_prizepicks_nfl.py
+import argparse
 import json
-import pandas as pd
 from datetime import datetime, timezone
 from pathlib import Path
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+except ImportError:  # --replay runs without Playwright
+    sync_playwright = PWTimeout = None
+
+from board_parser import loads, parse_projections
+from board_store import save_board
+from payload_archive import ARCHIVE_DIR, archive_payload, replay
 
 API_URL = "https://api.prizepicks.com/projections?per_page=2500&state_code=IL"
 APP_URL = "https://app.prizepicks.com/"
 PROFILE_DIR = Path(".pp_profile")  # persistent storage for cookies/localStorage
 
-def clean_player(name: str) -> str:
-    return (
-        str(name).upper()
-        .replace(".", "")
-        .replace("-", " ")
-        .replace("'", "")
-        .replace(",", "")
-        .strip()
+def capture(raw):
+    """Decode a /projections response, archive the raw bytes, and parse it.
+
+    Raises json.JSONDecodeError if `raw` isn't JSON (nothing is archived then).
+    Returns (board, captured_at).
+    """
+    data = loads(raw)
+    captured_at = datetime.now(timezone.utc)
+    archive_payload(raw, captured_at)
+    return parse_projections(data), captured_at
+
+def launch_context(p, headless: bool = False, profile_dir: Path = PROFILE_DIR):
+    # persistent profile helps PerimeterX tokens survive between runs
+    return p.chromium.launch_persistent_context(
+        user_data_dir=str(profile_dir),
+        headless=headless,  # set True once it’s stable for you
+        viewport={"width": 1280, "height": 900},
+        args=[
+            "--no-sandbox",
+            "--disable-blink-features=AutomationControlled",
+            "--disable-dev-shm-usage",
+        ],
     )
 
-def clean_prop(name: str) -> str:
-    n = str(name).upper().strip()
-    n = n.replace("YDS", "YARDS")
-    n = n.replace("REC", "RECEPTIONS")
-    n = n.replace("PASS YARDS", "PASSING YARDS")
-    n = n.replace("RUSH YARDS", "RUSHING YARDS")
-    n = n.replace("PASS ATT", "PASS ATTEMPTS").replace("ATT", "ATTEMPTS")
-    return n
-
-def parse_json_to_rows(result: dict):
-    # Build maps
-    player_info = {}
-    leagues = {}
-
-    for inc in result.get("included", []):
-        t = inc.get("type", "")
-        if t in ("players", "new_players", "new_player"):
-            pid = inc.get("id")
-            attrs = inc.get("attributes", {})
-            name = attrs.get("name") or attrs.get("display_name") or attrs.get("full_name") or "UNKNOWN"
-            team = attrs.get("team", "N/A")
-            player_info[pid] = {"name": name, "team": team}
-        elif "league" in t:
-            leagues[inc.get("id")] = inc.get("attributes", {}).get("name")
-
-    rows = []
-    for prop in result.get("data", []):
-        attrs = prop.get("attributes", {})
-        rel   = prop.get("relationships", {})
-
-        # only NFL
-        league_id = rel.get("league", {}).get("data", {}).get("id")
-        league_name = leagues.get(league_id, "")
-        if league_name != "NFL":
-            continue
-
-        rel_data = rel.get("new_player") or rel.get("player")
-        if not rel_data:
-            continue
-        player_id = rel_data.get("data", {}).get("id")
-        pinfo = player_info.get(player_id, {})
-
-        rows.append(
-            {
-                "player": pinfo.get("name", "UNKNOWN"),
-                "team": pinfo.get("team", "N/A"),
-                "prop": attrs.get("stat_type", "UNKNOWN"),
-                "pp_line": attrs.get("line_score", "N/A"),
-                "projection_id": prop.get("id"),
-                "kickoff": attrs.get("start_time"),
-                "player_clean": clean_player(pinfo.get("name", "UNKNOWN")),
-                "prop_clean": clean_prop(attrs.get("stat_type", "UNKNOWN")),
-            }
+def warm_up(browser, app_url: str = APP_URL):
+    """Open the app tab so PX cookies get set; returns the page."""
+    page = browser.new_page()
+
+    # Make navigator.webdriver = undefined (simple stealth)
+    page.add_init_script("""
+        Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    """)
+
+    try:
+        page.goto(app_url, wait_until="domcontentloaded", timeout=60000)
+        page.wait_for_timeout(4000)
+        # Scroll a bit to trigger app requests
+        for _ in range(5):
+            page.mouse.wheel(0, 1500)
+            page.wait_for_timeout(400)
+    except PWTimeout:
+        print("⚠️ App page load took too long, continuing...")
+    return page
+
+def main(store: str = "csv"):
+    if sync_playwright is None:
+        raise RuntimeError(
+            "Playwright is not installed. Install it (pip install playwright && playwright install chromium) "
+            "or rebuild boards from archived payloads with --replay."
         )
-    return rows
-
-def save_rows(rows):
-    df = pd.DataFrame(rows)
-    stamp = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H%M%SUTC")
-    out = f"pp_nfl_board_{stamp}.csv"
-    df.to_csv(out, index=False)
-    print(f"✅ Saved {len(df)} NFL lines to {out}")
-
-def main():
     PROFILE_DIR.mkdir(exist_ok=True)
-    rows = []
+    board = None
+    captured_at = None
 
     with sync_playwright() as p:
-        # persistent profile helps PerimeterX tokens survive between runs
-        browser = p.chromium.launch_persistent_context(
-            user_data_dir=str(PROFILE_DIR),
-            headless=False,  # set True once it’s stable for you
-            viewport={"width": 1280, "height": 900},
-            args=[
-                "--no-sandbox",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-            ],
-        )
-
-        page = browser.new_page()
-
-        # Make navigator.webdriver = undefined (simple stealth)
-        page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-        """)
+        browser = launch_context(p)
 
         # 1) Visit the app first so PX cookies get set
-        try:
-            page.goto(APP_URL, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(4000)
-            # Scroll a bit to trigger app requests
-            for _ in range(5):
-                page.mouse.wheel(0, 1500)
-                page.wait_for_timeout(400)
-        except PWTimeout:
-            print("⚠️ App page load took too long, continuing...")
+        page = warm_up(browser)
 
         # 2) Try to hit the API directly in SAME CONTEXT (cookies should carry)
         try:
@@ -130,15 +89,13 @@ def main():
                 except Exception:
                     pass
                 try:
-                    data = json.loads(text)
-                    rows = parse_json_to_rows(data)
+                    board, captured_at = capture(text)
                 except json.JSONDecodeError:
                     # Sometimes the API may render JSON as plain text without proper MIME; try extracting from <pre>
                     try:
                         pre = api_page.locator("pre").first
                         text2 = pre.inner_text(timeout=3000)
-                        data = json.loads(text2)
-                        rows = parse_json_to_rows(data)
+                        board, captured_at = capture(text2)
                     except Exception:
                         pass
             else:
@@ -147,7 +104,7 @@ def main():
             print("⚠️ API direct request timed out")
 
         # 3) Fallback: listen on the app tab for a /projections response
-        if not rows:
+        if board is None or board.empty:
             try:
                 with page.expect_response(
                     lambda r: ("projections" in r.url) and (200 <= r.status < 300),
@@ -157,11 +114,7 @@ def main():
                     page.reload(wait_until="domcontentloaded")
                     page.wait_for_timeout(4000)
                 resp = resp_wait.value
-                try:
-                    data = resp.json()
-                except Exception:
-                    data = json.loads(resp.text())
-                rows = parse_json_to_rows(data)
+                board, captured_at = capture(resp.body())
             except PWTimeout:
                 print("⚠️ Did not capture /projections on the app page")
 
@@ -171,10 +124,24 @@ def main():
         except Exception:
             pass
 
-    if rows:
-        save_rows(rows)
+    if board is not None and not board.empty:
+        save_board(board, store=store, captured_at=captured_at)
     else:
         print("❌ No data captured. (PX may still be blocking — try running once with headless=False and keep the window focused for ~10s.)")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Pull the PrizePicks NFL board.")
+    parser.add_argument(
+        "--store", choices=["csv", "parquet"], default="csv",
+        help="csv: timestamped pp_nfl_board_*.csv (default); parquet: board_store/ snapshot",
+    )
+    parser.add_argument(
+        "--replay", nargs="*", metavar="PAYLOAD",
+        help=f"rebuild boards from archived payloads (files or dirs; default {ARCHIVE_DIR}/) without a browser",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="process pool size for --replay")
+    args = parser.parse_args()
+    if args.replay is not None:
+        replay(args.replay or [ARCHIVE_DIR], store=args.store, workers=args.workers)
+    else:
+        main(store=args.store)
\ No newline at end of file
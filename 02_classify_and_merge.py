@@ -3,102 +3,103 @@ import glob
 import os
 import numpy as np
 
+from board_schema import LADDER_COLUMNS
+from normalize import SUPPORTED_PROPS, clean_players, clean_props
+from odds_index import ODDS_INDEX, LineLadder, OddsIndex
+from player_index import PlayerIndex
+from pricing import price
+
 # ---------- Helpers ----------
-def clean_player(name: str) -> str:
-    return (
-        str(name).upper()
-        .replace(".", "")
-        .replace("-", " ")
-        .replace("'", "")
-        .replace(",", "")
-        .strip()
-    )
-
-def clean_prop(name: str) -> str:
-    n = str(name).upper().strip()
-    mapping = {
-        # Passing
-        "PASS YARDS": "PASSING YARDS",
-        "PASSING YARDS": "PASSING YARDS",
-        "PLAYER_PASS_YDS": "PASSING YARDS",
-        "PASS ATTEMPTS": "PASS ATTEMPTS",
-        "PLAYER_PASS_ATTEMPTS": "PASS ATTEMPTS",
-        "PLAYER_PASS_ATT": "PASS ATTEMPTS",
-        "PASS COMPLETIONS": "PASS COMPLETIONS",
-        "PLAYER_PASS_COMPLETIONS": "PASS COMPLETIONS",
-        "PLAYER_PASS_COMP": "PASS COMPLETIONS",
-        # Rushing
-        "RUSH YARDS": "RUSHING YARDS",
-        "RUSHING YARDS": "RUSHING YARDS",
-        "PLAYER_RUSH_YDS": "RUSHING YARDS",
-        "RUSH ATTEMPTS": "RUSH ATTEMPTS",
-        "PLAYER_RUSH_ATTEMPTS": "RUSH ATTEMPTS",
-        "PLAYER_RUSH_ATT": "RUSH ATTEMPTS",
-        # Receiving
-        "RECEIVING YARDS": "RECEIVING YARDS",
-        "PLAYER_RECEPTION_YDS": "RECEIVING YARDS",
-        "PLAYER_RECEIV_YDS": "RECEIVING YARDS",
-        "RECEPTIONS": "RECEPTIONS",
-        "PLAYER_RECEPTIONS": "RECEPTIONS",
-        # Combo
-        "RECEIVING + RUSH YARDS": "RECEIVING + RUSH YARDS",
-        "PLAYER_RUSH_RECEPTION_YDS": "RECEIVING + RUSH YARDS",
-        # Kicking
-        "KICKING POINTS": "KICKING POINTS",
-        "PLAYER_KICKING_POINTS": "KICKING POINTS",
-        "FIELD GOALS": "FIELD GOALS",
-        "PLAYER_FIELD_GOALS": "FIELD GOALS",
-    }
-    return mapping.get(n, n)
-
-def summarize_line(group: pd.DataFrame) -> pd.Series:
-    """Pick the most favored (most negative) Over/Under odds for this (player, prop, line)."""
-    over = group[group["Label"].str.upper() == "OVER"]
-    under = group[group["Label"].str.upper() == "UNDER"]
-
-    # Most favored means most negative (min) American odds
-    over_best = np.nan
-    under_best = np.nan
-    if not over.empty:
-        over_best = over["Odds"].min()
-    if not under.empty:
-        under_best = under["Odds"].min()
-
-    # Determine which side is favored at this line
-    # (more negative number = more favored)
-    over_favored = False
-    under_favored = False
-    if not np.isnan(over_best) and not np.isnan(under_best):
-        if over_best < under_best:
-            over_favored = True
-        elif under_best < over_best:
-            under_favored = True
-
-    return pd.Series({
-        "Over_Odds": over_best if not np.isnan(over_best) else None,
-        "Under_Odds": under_best if not np.isnan(under_best) else None,
-        "Over_Favored": over_favored,
-        "Under_Favored": under_favored
+def summarize_lines(odds: pd.DataFrame) -> pd.DataFrame:
+    """Most favored (most negative) Over/Under odds for every (player, prop, line) at once."""
+    return OddsIndex.build(odds).most_favored()
+
+MATCH_COLUMNS = ["Player", "Prop", "PrizePicks_Line", "Over_Odds", "Under_Odds"]
+
+def match_lines(pp: pd.DataFrame, odds_grouped: pd.DataFrame, ladder: LineLadder = None) -> pd.DataFrame:
+    """Join the PP board to grouped sportsbook lines in a few keyed merges.
+
+    Priority per board row: exact line, then book line +0.5 with the Over
+    favored, then book line -0.5 with the Under favored. Rows with no
+    acceptable match are dropped. Output keeps the board's row order and
+    carries the board's projection_id and team (as Team) when it has them,
+    plus any extra per-line columns of `odds_grouped` (e.g. OddsIndex.summary()).
+
+    With a `ladder`, board rows left unmatched take a fair Over probability
+    from the book lines around them (Ladder_Over/Low/High); those rows have
+    no Over/Under odds of their own.
+    """
+    id_cols = [c for c in ("projection_id", "team") if c in pp.columns]
+    board = pp[["player", "player_clean", "prop_clean", "pp_line"] + id_cols].copy()
+    board["_row"] = np.arange(len(board))
+    keys = ["player_clean", "prop_clean", "Line"]
+    flags = ["Over_Favored", "Under_Favored"]
+    extra = [c for c in odds_grouped.columns if c not in keys + flags + ["Over_Odds", "Under_Odds"]]
+    odds_cols = keys + ["Over_Odds", "Under_Odds"] + extra
+
+    # (line offset, required favored flag, priority)
+    passes = [
+        (0.0, None, 0),
+        (0.5, "Over_Favored", 1),
+        (-0.5, "Under_Favored", 2),
+    ]
+    hits = []
+    for offset, flag, priority in passes:
+        cand = odds_grouped
+        if flag is not None:
+            cand = cand[cand[flag] == True]
+        board["Line"] = board["pp_line"] + offset
+        hit = board.merge(cand[odds_cols], on=keys, how="inner")
+        hit["_priority"] = priority
+        hits.append(hit)
+
+    columns = MATCH_COLUMNS + ["Team" if c == "team" else c for c in id_cols] + extra
+    matched = pd.concat(hits, ignore_index=True)
+
+    # Keep only the best priority available for each board row
+    best = matched.groupby("_row")["_priority"].transform("min")
+    matched = matched[matched["_priority"] == best]
+
+    # Last resort: interpolate along the book's alt-line ladder
+    if ladder is not None:
+        columns = columns + LADDER_COLUMNS
+        rest = board[~board["_row"].isin(matched["_row"])].drop(columns="Line")
+        prob, low, high = ladder.lookup(rest["player_clean"], rest["prop_clean"], rest["pp_line"])
+        found = ~np.isnan(prob)
+        matched = pd.concat([matched, rest[found].assign(
+            Ladder_Over=prob[found], Ladder_Low=low[found], Ladder_High=high[found], _priority=3,
+        )], ignore_index=True)
+
+    if matched.empty:
+        return pd.DataFrame(columns=columns)
+    matched = matched.sort_values(["_row", "Line"], kind="stable")
+
+    out = matched.rename(columns={
+        "player": "Player",
+        "prop_clean": "Prop",
+        "pp_line": "PrizePicks_Line",
+        "team": "Team",
     })
-
-# ---------- Main ----------
-def main(pp_csv, odds_folder, out_csv="nfl_regular.csv"):
-    # Load PrizePicks board
-    pp = pd.read_csv(pp_csv)
-    pp["player_clean"] = pp["player"].apply(clean_player)
-    pp["prop_clean"]  = pp["prop"].apply(clean_prop)
+    return out[columns].reset_index(drop=True)
+
+# ---------- Loaders ----------
+def load_board(pp_csv) -> pd.DataFrame:
+    """Load and normalize a PP board (CSV path, board_store Parquet path, or a frame)."""
+    if isinstance(pp_csv, pd.DataFrame):
+        pp = pp_csv.copy()
+    elif str(pp_csv).endswith(".parquet"):
+        import board_store
+        pp = board_store.read_snapshot(pp_csv)
+    else:
+        pp = pd.read_csv(pp_csv)
+    pp["player_clean"] = clean_players(pp["player"])
+    pp["prop_clean"]  = clean_props(pp["prop"])
     pp["pp_line"]     = pd.to_numeric(pp["pp_line"], errors="coerce")
 
-    valid_props = {
-        "PASSING YARDS", "PASS ATTEMPTS", "PASS COMPLETIONS",
-        "RUSHING YARDS", "RUSH ATTEMPTS",
-        "RECEIVING YARDS", "RECEPTIONS",
-        "RECEIVING + RUSH YARDS",
-        "KICKING POINTS", "FIELD GOALS",
-    }
-    pp = pp[pp["prop_clean"].isin(valid_props)].dropna(subset=["pp_line"]).copy()
+    return pp[pp["prop_clean"].isin(SUPPORTED_PROPS)].dropna(subset=["pp_line"]).copy()
 
-    # Load sportsbook odds
+def load_odds(odds_folder) -> pd.DataFrame:
+    """Load every 'NFL - *.csv' sportsbook file in `odds_folder` into one normalized frame."""
     all_odds = []
     for file in glob.glob(os.path.join(odds_folder, "NFL - *.csv")):
         df = pd.read_csv(file)
@@ -115,8 +116,8 @@ def main(pp_csv, odds_folder, out_csv="nfl_regular.csv"):
             "bookmaker": "Book",
         }, inplace=True)
 
-        df["player_clean"] = df["Player"].apply(clean_player)
-        df["prop_clean"]   = df["Prop"].apply(clean_prop)
+        df["player_clean"] = clean_players(df["Player"])
+        df["prop_clean"]   = clean_props(df["Prop"])
         df["Line"]         = pd.to_numeric(df["Line"], errors="coerce")
         df["Odds"]         = pd.to_numeric(df["Odds"], errors="coerce")  # ensure numeric
         all_odds.append(df)
@@ -125,59 +126,68 @@ def main(pp_csv, odds_folder, out_csv="nfl_regular.csv"):
         raise FileNotFoundError("No sportsbook odds files found matching 'NFL - *.csv'")
 
     odds = pd.concat(all_odds, ignore_index=True)
-    odds = odds.dropna(subset=["player_clean", "prop_clean", "Line", "Odds"])
-
-    # Group by player+prop+line and compute most favored Over/Under odds
-    odds_grouped = (
-        odds.groupby(["player_clean", "prop_clean", "Line"], as_index=False)
-            .apply(summarize_line)
-            .reset_index(drop=True)
-    )
-
-    # Merge PP with sportsbook lines using exact or directional wiggle
-    rows = []
-    for _, r in pp.iterrows():
-        sub = odds_grouped[
-            (odds_grouped["player_clean"] == r["player_clean"]) &
-            (odds_grouped["prop_clean"]  == r["prop_clean"])
-        ]
-        if sub.empty:
-            continue
-
-        exact = sub[sub["Line"] == r["pp_line"]]
-
-        # Directional wiggle checks
-        wiggle_up   = sub[(sub["Line"] == r["pp_line"] + 0.5) & (sub["Over_Favored"]  == True)]
-        wiggle_down = sub[(sub["Line"] == r["pp_line"] - 0.5) & (sub["Under_Favored"] == True)]
-
-        use = None
-        if not exact.empty:
-            use = exact
-        elif not wiggle_up.empty:
-            use = wiggle_up
-        elif not wiggle_down.empty:
-            use = wiggle_down
-        else:
-            # No acceptable match → drop
-            continue
-
-        for _, s in use.iterrows():
-            rows.append({
-                "Player": r["player"],
-                "Prop": r["prop_clean"],
-                "PrizePicks_Line": r["pp_line"],
-                "Over_Odds": s["Over_Odds"],
-                "Under_Odds": s["Under_Odds"],
-            })
-
-    out = pd.DataFrame(rows)
+    return odds.dropna(subset=["player_clean", "prop_clean", "Line", "Odds"])
+
+def link_players(pp: pd.DataFrame, odds: pd.DataFrame, report: bool = True):
+    """Re-key player_clean on both sides to the odds' canonical player ids.
+
+    Board names that don't resolve keep their cleaned name (and simply won't match).
+    """
+    index = PlayerIndex.build(odds["Player"])
+    odds = odds.assign(player_clean=index.resolve(odds["Player"]))
+    ids = index.resolve(pp["player"])
+    if report:
+        index.report(ids, "board players")
+    pp = pp.assign(player_clean=ids.fillna(pp["player_clean"]))
+    return pp, odds
+
+# ---------- Main ----------
+def match_and_price(pp: pd.DataFrame, odds: pd.DataFrame, index_path=ODDS_INDEX) -> pd.DataFrame:
+    """Index `odds`, match `pp` against it and price the matches (the whole of stage 02 after loading).
+
+    The index is saved to `index_path` for the app; pass None to skip that.
+    """
+    # Index every book's price per player+prop+line once
+    index = OddsIndex.build(odds)
+    if index_path is not None:
+        index.save(index_path)
+        print(f"📈 Indexed {len(index.keys)} lines x {len(index.books)} books → {index_path}")
+
+    # Merge PP with the most favored Over/Under odds (plus best price and
+    # consensus) using exact or directional wiggle, then the alt-line ladder
+    out = match_lines(pp, index.summary(), index.ladder())
+
+    # No-vig fair probability and PrizePicks entry EV for every matched row
+    return price(out)
+
+def main(pp_csv, odds_folder, out_csv="nfl_regular.csv"):
+    # Load PrizePicks board and sportsbook odds, keyed on the same player ids
+    pp, odds = link_players(load_board(pp_csv), load_odds(odds_folder))
+
+    out = match_and_price(pp, odds)
     out.to_csv(out_csv, index=False)
     print(f"✅ Saved {len(out)} regular matched rows to {out_csv}")
 
-if __name__ == "__main__":
+def latest_board():
+    """Newest board: the latest pp_nfl_board_*.csv or board_store snapshot, whichever is newer."""
     files = glob.glob("pp_nfl_board_*.csv")
-    if not files:
+    latest_csv = max(files, key=os.path.getctime) if files else None
+
+    snap_ts = None
+    if os.path.isdir("board_store"):
+        import board_store
+        snap_ts = board_store.latest_captured_at()
+
+    if snap_ts is not None and (
+        latest_csv is None or snap_ts.timestamp() >= os.path.getctime(latest_csv)
+    ):
+        latest_snap = board_store.list_snapshots()["path"].iloc[-1]
+        print(f"📂 Using latest board_store snapshot: {latest_snap}")
+        return str(latest_snap)
+    if latest_csv is None:
         raise FileNotFoundError("No PrizePicks NFL CSVs found. Run 01_pull_prizepicks_nfl.py first.")
-    latest_pp = max(files, key=os.path.getctime)
-    print(f"📂 Using latest PrizePicks file: {latest_pp}")
-    main(latest_pp, ".")
\ No newline at end of file
+    print(f"📂 Using latest PrizePicks file: {latest_csv}")
+    return latest_csv
+
+if __name__ == "__main__":
+    main(latest_board(), ".")
\ No newline at end of file
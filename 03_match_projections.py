@@ -3,83 +3,11 @@ import glob
 import os
 from typing import Optional
 
-# ----------------- Helpers -----------------
-SUPPORTED_PROPS = {
-    "PASSING YARDS",
-    "PASS ATTEMPTS",
-    "PASS COMPLETIONS",
-    "RUSHING YARDS",
-    "RUSH ATTEMPTS",
-    "RECEIVING YARDS",
-    "RECEPTIONS",
-    "RECEIVING + RUSH YARDS",
-    "KICKING POINTS",
-    "FIELD GOALS",
-}
-
-def clean_player(name: str) -> str:
-    s = (
-        str(name)
-        .upper()
-        .replace(".", "")
-        .replace("-", " ")
-        .replace("'", "")
-        .replace(",", " ")
-        .strip()
-    )
-    # collapse multiple spaces
-    s = " ".join(s.split())
-    return s
-
-def flip_name_if_comma_style(s: str) -> str:
-    # "BROWN AJ" <-> "AJ BROWN" helper
-    parts = s.split()
-    if len(parts) >= 2:
-        # Heuristic: if original had comma style, flipping will match some sources
-        last_first = " ".join(parts[1:] + [parts[0]])
-        return last_first
-    return s
-
-def clean_prop(raw: str) -> str:
-    n = str(raw).upper().strip()
-    mapping = {
-        # Passing
-        "PASS YARDS": "PASSING YARDS",
-        "PASSING YARDS": "PASSING YARDS",
-        "PLAYER_PASS_YDS": "PASSING YARDS",
-        "PASS ATT": "PASS ATTEMPTS",
-        "PASS ATTEMPTS": "PASS ATTEMPTS",
-        "PLAYER_PASS_ATTEMPTS": "PASS ATTEMPTS",
-        "PLAYER_PASS_ATT": "PASS ATTEMPTS",
-        "PASS COMP": "PASS COMPLETIONS",
-        "PASS COMPLETIONS": "PASS COMPLETIONS",
-        "PLAYER_PASS_COMPLETIONS": "PASS COMPLETIONS",
-        "PLAYER_PASS_COMP": "PASS COMPLETIONS",
-        # Rushing
-        "RUSH YARDS": "RUSHING YARDS",
-        "RUSHING YARDS": "RUSHING YARDS",
-        "PLAYER_RUSH_YDS": "RUSHING YARDS",
-        "RUSH ATT": "RUSH ATTEMPTS",
-        "RUSH ATTEMPTS": "RUSH ATTEMPTS",
-        "PLAYER_RUSH_ATTEMPTS": "RUSH ATTEMPTS",
-        "PLAYER_RUSH_ATT": "RUSH ATTEMPTS",
-        # Receiving
-        "RECEIVING YARDS": "RECEIVING YARDS",
-        "PLAYER_RECEPTION_YDS": "RECEIVING YARDS",
-        "PLAYER_RECEIV_YDS": "RECEIVING YARDS",
-        "RECEPTIONS": "RECEPTIONS",
-        "PLAYER_RECEPTIONS": "RECEPTIONS",
-        # Combo
-        "RECEIVING + RUSH YARDS": "RECEIVING + RUSH YARDS",
-        "PLAYER_RUSH_RECEPTION_YDS": "RECEIVING + RUSH YARDS",
-        # Kicking
-        "KICKING POINTS": "KICKING POINTS",
-        "PLAYER_KICKING_POINTS": "KICKING POINTS",
-        "FIELD GOALS": "FIELD GOALS",
-        "PLAYER_FIELD_GOALS": "FIELD GOALS",
-    }
-    return mapping.get(n, n)
+from normalize import SUPPORTED_PROPS, clean_players, clean_props
+from board_schema import PASSTHROUGH_COLUMNS, PROJ_COLUMNS
+from player_index import PlayerIndex
 
+# ----------------- Helpers -----------------
 def coalesce_columns(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
     """Return the first existing column name from the candidates list."""
     for c in candidates:
@@ -87,27 +15,9 @@ def coalesce_columns(df: pd.DataFrame, candidates: list[str]) -> Optional[str]:
             return c
     return None
 
-# ----------------- Main -----------------
-def main(
-    board_csv: str = "nfl_regular.csv",
-    projections_folder: str = "projections",
-    out_csv: str = "nfl_regular_with_proj.csv",
-):
-    # 1) Load the matched regular lines produced by script 02
-    if not os.path.exists(board_csv):
-        raise FileNotFoundError(
-            f"'{board_csv}' not found. Run 02_match_regular_lines.py first."
-        )
-    board = pd.read_csv(board_csv)
-
-    # Normalize on load
-    board["player_clean"] = board["Player"].apply(clean_player)
-    board["prop_clean"] = board["Prop"].apply(clean_prop)
-
-    # Limit to our supported set (safety)
-    board = board[board["prop_clean"].isin(SUPPORTED_PROPS)].copy()
-
-    # 2) Find latest projections file in /projections
+# ----------------- Steps -----------------
+def load_projections(projections_folder: str = "projections") -> pd.DataFrame:
+    """Newest projections CSV in `projections_folder`, normalized to player_clean/prop_clean/Projection."""
     pattern = os.path.join(projections_folder, "*.csv")
     files = glob.glob(pattern)
     if not files:
@@ -118,7 +28,6 @@ def main(
     latest_proj = max(files, key=os.path.getctime)
     print(f"📂 Using projections file: {latest_proj}")
 
-    # 3) Load and normalize projections
     proj = pd.read_csv(latest_proj)
 
     # Try to detect key columns (player, prop, projection value)
@@ -139,46 +48,66 @@ def main(
             "Try renaming columns to: player, prop, projection."
         )
 
+    # Player identity index for this file (built once, cached on disk)
+    index = PlayerIndex.for_file(latest_proj, player_col)
+
     proj = proj.rename(columns={player_col: "PlayerRaw", prop_col: "PropRaw", value_col: "Projection"})
-    proj["player_clean"] = proj["PlayerRaw"].apply(clean_player)
-    proj["prop_clean"] = proj["PropRaw"].apply(clean_prop)
+    proj["player_clean"] = clean_players(proj["PlayerRaw"])
+    proj["player_id"] = index.resolve(proj["PlayerRaw"])
+    proj["prop_clean"] = clean_props(proj["PropRaw"])
 
     # Keep only supported props (drop everything else)
     proj = proj[proj["prop_clean"].isin(SUPPORTED_PROPS)].copy()
+    proj.attrs["player_index"] = index
+    return proj
+
+def attach_projections(board: pd.DataFrame, proj: pd.DataFrame) -> pd.DataFrame:
+    """Join matched board rows (02 output) to projections; rows without one are dropped."""
+    board = board.copy()
+
+    # Normalize on load
+    board["player_clean"] = clean_players(board["Player"])
+    board["prop_clean"] = clean_props(board["Prop"])
+
+    # Limit to our supported set (safety)
+    board = board[board["prop_clean"].isin(SUPPORTED_PROPS)].copy()
+
+    # Resolve board names through the projections' identity index, then join on ids
+    index = proj.attrs.get("player_index") or PlayerIndex.build(proj["PlayerRaw"])
+    board["player_id"] = index.resolve(board["Player"])
+    index.report(board["player_id"], "board players")
 
-    # 4) Primary exact merge on (player_clean, prop_clean)
     merged = board.merge(
-        proj[["player_clean", "prop_clean", "Projection"]],
-        on=["player_clean", "prop_clean"],
+        proj[["player_id", "prop_clean", "Projection"]].dropna(subset=["player_id"]),
+        on=["player_id", "prop_clean"],
         how="left",
     )
 
-    # 5) Try a light fallback for unmatched rows: flip "LAST FIRST" ↔ "FIRST LAST"
-    unmatched_mask = merged["Projection"].isna()
-    if unmatched_mask.any():
-        need = merged[unmatched_mask].copy()
-        need["player_clean_alt"] = need["player_clean"].apply(flip_name_if_comma_style)
-
-        # Build alt lookup table
-        proj_alt = proj.copy()
-        proj_alt["player_clean_alt"] = proj_alt["player_clean"].apply(flip_name_if_comma_style)
-        alt_join = need.merge(
-            proj_alt[["player_clean_alt", "prop_clean", "Projection"]],
-            left_on=["player_clean_alt", "prop_clean"],
-            right_on=["player_clean_alt", "prop_clean"],
-            how="left",
-            suffixes=("", "_alt"),
-        )
+    # Final tidy output: same schema as 04_nfl_merge (core columns, then whatever 02 carried)
+    out = merged.drop(columns="Prop").rename(columns={"prop_clean": "Prop"})
+    out = out[PROJ_COLUMNS + [c for c in PASSTHROUGH_COLUMNS if c in out.columns]]
+
+    # Drop rows where we still don't have a projection (keep the file clean)
+    return out.dropna(subset=["Projection"]).reset_index(drop=True)
 
-        # Fill where Projection is NA with alt match
-        merged.loc[unmatched_mask, "Projection"] = alt_join["Projection"]
+# ----------------- Main -----------------
+def main(
+    board_csv: str = "nfl_regular.csv",
+    projections_folder: str = "projections",
+    out_csv: str = "nfl_regular_with_proj.csv",
+):
+    # 1) Load the matched regular lines produced by script 02
+    if not os.path.exists(board_csv):
+        raise FileNotFoundError(
+            f"'{board_csv}' not found. Run 02_match_regular_lines.py first."
+        )
+    board = pd.read_csv(board_csv)
 
-    # 6) Final tidy output: only what you asked for
-    out = merged[["Player", "prop_clean", "PrizePicks_Line", "Over_Odds", "Under_Odds", "Projection"]].copy()
-    out = out.rename(columns={"prop_clean": "Prop"})
+    # 2) Find, load and normalize the latest projections file in /projections
+    proj = load_projections(projections_folder)
 
-    # Drop rows where we still don't have a projection (keep the file clean)
-    out = out.dropna(subset=["Projection"]).reset_index(drop=True)
+    # 3) Join on player identity (suffix / team-code / first-last aliases)
+    out = attach_projections(board, proj)
 
     out.to_csv(out_csv, index=False)
     print(f"✅ Saved {len(out)} rows to {out_csv}")
@@ -1,5 +1,17 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
+from pathlib import Path
+
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
 
 POSITIONS = {
     "QB": "https://www.fantasypros.com/nfl/projections/qb.php?week={week}",
@@ -10,56 +22,219 @@ POSITIONS = {
     "DST":"https://www.fantasypros.com/nfl/projections/dst.php?week={week}",
 }
 
-def scrape_fantasypros(week: int = 1):
-    all_dfs = []
-
-    for pos, url in POSITIONS.items():
-        full_url = url.format(week=week)
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+TIMEOUT = 30  # seconds per request
+CACHE_DIR = Path(".http_cache")
+STORE_DIR = Path("projections_store")
+
+# The projections grid is <table id="data" ...>; slice it out so read_html
+# doesn't parse every other table on the page
+TABLE_RE = re.compile(r"<table[^>]*\bid=[\"']data[\"'][^>]*>.*?</table>", re.S | re.I)
+
+def make_session(pool_size: int = len(POSITIONS)) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+# ---------- On-disk HTTP cache (ETag / Last-Modified) ----------
+def _cache_paths(url: str, cache_dir: Path):
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return cache_dir / f"{key}.json", cache_dir / f"{key}.parquet"
+
+def parse_projection_table(html: str) -> pd.DataFrame:
+    """Parse only the projections table and flatten its two header rows."""
+    m = TABLE_RE.search(html)
+    if not m:
+        # Never fall back to some other table on the page (ads, rankings, ...)
+        raise ValueError("No table found")
+    df = pd.read_html(StringIO(m.group(0)), header=[0, 1])[0]  # Multi-index headers
+
+    # Flatten multi-level headers into single strings
+    df.columns = [
+        " ".join(col).strip() if isinstance(col, tuple) else str(col)
+        for col in df.columns
+    ]
+    return df
+
+def fetch_table(session: requests.Session, url: str, cache_dir: Path = CACHE_DIR) -> pd.DataFrame:
+    """GET `url` conditionally; a 304 reuses the table parsed on the previous download."""
+    meta_path, table_path = _cache_paths(url, cache_dir)
+    meta = {}
+    if meta_path.exists() and table_path.exists():
+        meta = json.loads(meta_path.read_text())
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = session.get(url, headers=headers, timeout=TIMEOUT)
+    if resp.status_code == 304 and meta:
+        return pd.read_parquet(table_path)
+    resp.raise_for_status()
+
+    df = parse_projection_table(resp.text)
+
+    validators = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+    }
+    if any(validators.values()):
+        cache_dir.mkdir(exist_ok=True)
+        df.to_parquet(table_path, index=False)
+        meta_path.write_text(json.dumps({"url": url, **validators}))
+    return df
+
+def scrape_fantasypros(week: int = 1, session: requests.Session = None, cache_dir: Path = CACHE_DIR,
+                       positions: dict = POSITIONS):
+    session = session or make_session(max(len(positions), 1))
+
+    def scrape(item):
+        pos, url = item
         print(f"📄 Scraping {pos} projections (Week {week})...")
-
-        resp = requests.get(full_url, headers={"User-Agent": "Mozilla/5.0"})
-        resp.raise_for_status()
-
-        # Parse all tables
-        tables = pd.read_html(resp.text, header=[0,1])  # Multi-index headers
-        if not tables:
+        try:
+            df = fetch_table(session, url.format(week=week), cache_dir)
+        except ValueError:
             print(f"⚠️ No table found for {pos}")
-            continue
-
-        df = tables[0]
-
-        # Flatten multi-level headers into single strings
-        df.columns = [
-            " ".join(col).strip() if isinstance(col, tuple) else str(col)
-            for col in df.columns
-        ]
-
+            return None
+        except requests.RequestException as e:
+            print(f"⚠️ {pos} request failed: {e}")
+            return None
         # Insert position column
         df["POS"] = pos
+        return df
 
-        all_dfs.append(df)
+    # All pages at once over the pooled session; results keep POSITIONS order
+    with ThreadPoolExecutor(max_workers=max(len(positions), 1)) as pool:
+        all_dfs = [df for df in pool.map(scrape, positions.items()) if df is not None]
 
-    # Combine
-    final_df = pd.concat(all_dfs, ignore_index=True)
+    # Combine (empty when every page failed)
+    if not all_dfs:
+        return pd.DataFrame()
+    return clean_columns(pd.concat(all_dfs, ignore_index=True))
 
+def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     # Clean column names: remove Unnamed & extra spaces
-    final_df.columns = [
+    df.columns = [
         col.replace("Unnamed: 0_level_0 ", "").replace("Unnamed: 1_level_0 ", "").strip()
-        for col in final_df.columns
+        for col in df.columns
     ]
-
-    return final_df
+    return df
+
+# ---------- Multi-week backfill ----------
+def unit_path(season: int, week: int, pos: str, store_dir: Path = STORE_DIR) -> Path:
+    return Path(store_dir) / f"season={season}" / f"week={week:02d}" / f"pos={pos}.parquet"
+
+class Pacer:
+    """Spaces request starts at least `delay` seconds apart across all workers."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.delay
+        if start > now:
+            time.sleep(start - now)
+
+def backfill(seasons, weeks, workers: int = 3, delay: float = 1.0, store_dir: Path = STORE_DIR,
+             cache_dir: Path = CACHE_DIR, positions: dict = POSITIONS) -> dict:
+    """Scrape every (season, week, position) into the partitioned projections store.
+
+    Each unit is written atomically to its own Parquet file, which doubles as
+    its checkpoint: units already on disk are skipped, so a crashed run
+    resumes where it stopped and a finished backfill does no work.
+    """
+    units = [
+        (season, week, pos)
+        for season in seasons for week in weeks for pos in positions
+        if not unit_path(season, week, pos, store_dir).exists()
+    ]
+    total = len(seasons) * len(weeks) * len(positions)
+    print(f"🗂️ Backfill: {total - len(units)}/{total} units already done, {len(units)} to scrape")
+    if not units:
+        return {"done": 0, "failed": 0, "skipped": total}
+
+    session = make_session(workers)
+    pacer = Pacer(delay)
+
+    def scrape_unit(season, week, pos):
+        pacer.wait()
+        url = positions[pos].format(week=week) + f"&year={season}"
+        df = fetch_table(session, url, cache_dir)
+        df["POS"] = pos
+        df["season"] = season
+        df["week"] = week
+        path = unit_path(season, week, pos, store_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        clean_columns(df).to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        return len(df)
+
+    done = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(scrape_unit, *u): u for u in units}
+        for fut in as_completed(futures):
+            season, week, pos = futures[fut]
+            try:
+                n = fut.result()
+                done += 1
+                print(f"✅ {season} week {week} {pos}: {n} rows")
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ {season} week {week} {pos} failed: {e}")
+    print(f"🗂️ Backfill finished: {done} scraped, {failed} failed" + (" (re-run to retry)" if failed else ""))
+    return {"done": done, "failed": failed, "skipped": total - len(units)}
+
+def read_projections_store(season=None, week=None, store_dir: Path = STORE_DIR) -> pd.DataFrame:
+    """Load projections from the store, optionally limited to one season and/or week."""
+    pattern = f"season={season if season is not None else '*'}/week={f'{week:02d}' if week is not None else '*'}/pos=*.parquet"
+    files = sorted(Path(store_dir).glob(pattern))
+    if not files:
+        return pd.DataFrame()
+    return pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+
+def _week_range(spec: str) -> list[int]:
+    """'1-18' or '1,3,5' -> list of weeks."""
+    weeks = []
+    for part in spec.split(","):
+        lo, _, hi = part.partition("-")
+        weeks.extend(range(int(lo), int(hi or lo) + 1))
+    return weeks
 
 
 def main():
     week = 1
     df = scrape_fantasypros(week)
+    output_file = f"fantasypros_week{week}_projections_clean.csv"
+    if df.empty:
+        # Keep last week's file rather than overwrite it with nothing
+        raise SystemExit(f"❌ No projection tables scraped; {output_file} left unchanged")
 
     # Save cleaned output
-    output_file = f"fantasypros_week{week}_projections_clean.csv"
     df.to_csv(output_file, index=False)
     print(f"✅ Saved {output_file} with {len(df)} rows and {len(df.columns)} columns")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scrape FantasyPros weekly projections.")
+    parser.add_argument("--backfill", action="store_true",
+                        help=f"scrape a range of seasons/weeks into {STORE_DIR}/ (resumable)")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[2025])
+    parser.add_argument("--weeks", default="1-18", help="e.g. 1-18 or 1,2,5")
+    parser.add_argument("--workers", type=int, default=3, help="concurrent requests during backfill")
+    parser.add_argument("--delay", type=float, default=1.0, help="min seconds between request starts")
+    args = parser.parse_args()
+    if args.backfill:
+        backfill(args.seasons, _week_range(args.weeks), workers=args.workers, delay=args.delay)
+    else:
+        main()
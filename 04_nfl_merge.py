@@ -1,5 +1,8 @@
 import pandas as pd
 
+from board_schema import PASSTHROUGH_COLUMNS, PROJ_COLUMNS
+from player_index import PlayerIndex
+
 # Map PrizePicks props to FantasyPros columns
 prop_map = {
     "PASSING YARDS": "PASSING YDS",
@@ -11,50 +14,43 @@ prop_map = {
     "RECEPTIONS": "RECEIVING REC"
 }
 
+PROJECTIONS_CSV = "fantasypros_week1_projections_clean.csv"
+
 def main():
     # PrizePicks + odds
     pp = pd.read_csv("nfl_regular.csv")
     
     # FantasyPros projections
-    proj = pd.read_csv("fantasypros_week1_projections_clean.csv")
+    proj = pd.read_csv(PROJECTIONS_CSV)
     
     # Keep only the relevant projection columns
     keep_cols = ["Player"] + list(prop_map.values())
     proj = proj[[c for c in proj.columns if c in keep_cols]].copy()
 
-    # Clean player names (remove team codes like "PHI", "DAL")
-    proj["Player"] = proj["Player"].str.replace(r"\s[A-Z]{2,}$", "", regex=True).str.strip()
+    # Resolve names on both sides through the projections' identity index
+    # (handles team-code tails like "Jalen Hurts PHI" and suffixes like "Sr.")
+    index = PlayerIndex.for_file(PROJECTIONS_CSV, "Player")
+    proj["player_id"] = index.resolve(proj["Player"])
     pp["Player"] = pp["Player"].str.strip()
-
-    merged = []
-    for _, row in pp.iterrows():
-        player = row["Player"]
-        prop = row["Prop"]
-
-        # Skip if prop not in our map
-        if prop not in prop_map:
-            continue
-
-        col = prop_map[prop]
-        match = proj[proj["Player"].str.lower() == player.lower()]
-
-        if not match.empty and col in match.columns:
-            projection = match.iloc[0][col]
-        else:
-            projection = None  # no projection available
-
-        merged.append({
-            "Player": player,
-            "Prop": prop,
-            "PrizePicks_Line": row["PrizePicks_Line"],
-            "Over_Odds": row["Over_Odds"],
-            "Under_Odds": row["Under_Odds"],
-            "Projection": projection
-        })
-
-    final = pd.DataFrame(merged)
+    pp["player_id"] = index.resolve(pp["Player"])
+
+    # Skip props not in our map
+    pp = pp[pp["Prop"].isin(prop_map)]
+    index.report(pp["player_id"], "board players")
+
+    # One (player_id, Prop) -> projection table; first projection row per player wins
+    value_cols = [c for c in prop_map.values() if c in proj.columns]
+    long = (
+        proj.dropna(subset=["player_id"])
+            .drop_duplicates("player_id")
+            .melt(id_vars="player_id", value_vars=value_cols, var_name="proj_col", value_name="Projection")
+    )
+    long["Prop"] = long["proj_col"].map({v: k for k, v in prop_map.items()})
+
+    final = pp.merge(long[["player_id", "Prop", "Projection"]], on=["player_id", "Prop"], how="left")
+    final = final[PROJ_COLUMNS + [c for c in PASSTHROUGH_COLUMNS if c in final.columns]]
     final.to_csv("nfl_regular_with_proj.csv", index=False)
     print("✅ Saved nfl_regular_with_proj.csv with", len(final), "rows")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
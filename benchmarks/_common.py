@@ -0,0 +1,18 @@
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from stage_loader import load_stage as load_script  # noqa: E402
+
+def best_of(fn, repeat: int = 5) -> float:
+    """Best wall time in seconds over `repeat` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
@@ -0,0 +1,94 @@
+# Benchmark: per-session board loading (read_csv + df.copy() on every rerun)
+# vs the process-wide, mtime-keyed shared frame now used by app.py.
+# 50 simulated sessions rerun concurrently (one thread each, as Streamlit
+# runs them); every session holds its frames until all have loaded, which
+# is the worst case for RSS. Also times real app.py reruns via AppTest.
+# Usage: python benchmarks/bench_app_sessions.py [sessions] [scale]
+#   scale tiles the board file to model a bigger slate (default 1).
+import gc
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import psutil
+
+from _common import ROOT
+
+BOARD = "nfl_regular_with_proj.csv"
+
+def value_props_view(df: pd.DataFrame) -> pd.DataFrame:
+    """The filtering a Value Props rerun does on top of the loaded board."""
+    view = df.assign(Prop_LC=df["Prop"].str.lower())
+    view = view[view["Projection"] > view["PrizePicks_Line"]]
+    return view.assign(Edge=view["Projection"] - view["PrizePicks_Line"])
+
+def per_session(path: str) -> pd.DataFrame:
+    return pd.read_csv(path).copy()
+
+_shared = {}
+def shared(path: str) -> pd.DataFrame:
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key not in _shared:
+        _shared[key] = pd.read_csv(path)
+    return _shared[key]
+
+def simulate(load, path: str, sessions: int):
+    """(mean rerun ms, RSS growth MB) with every session's frames alive at once."""
+    proc = psutil.Process()
+    gc.collect()
+    rss0 = proc.memory_info().rss
+    barrier = threading.Barrier(sessions + 1)
+    held, times = [], []
+    lock = threading.Lock()
+
+    def rerun():
+        t0 = time.perf_counter()
+        df = load(path)
+        view = value_props_view(df)
+        with lock:
+            times.append(time.perf_counter() - t0)
+            held.append((df, view))
+        barrier.wait()
+
+    threads = [threading.Thread(target=rerun) for _ in range(sessions)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    rss = proc.memory_info().rss - rss0
+    for t in threads:
+        t.join()
+    held.clear()
+    return sum(times) / len(times) * 1000, rss / 2**20
+
+def app_reruns(workdir: Path, sessions: int) -> float:
+    """Mean wall ms for a Value Props rerun of the real app.py, one AppTest per session."""
+    from streamlit.testing.v1 import AppTest
+    os.chdir(workdir)
+    apps = []
+    for _ in range(sessions):
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+        at.session_state["_nfl_sub_option"] = "Value Props"
+        at.run()
+        apps.append(at)
+    t0 = time.perf_counter()
+    for at in apps:
+        at.run()
+    return (time.perf_counter() - t0) / sessions * 1000
+
+if __name__ == "__main__":
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    scale = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    board = pd.read_csv(ROOT / BOARD)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / BOARD)
+        pd.concat([board] * scale, ignore_index=True).to_csv(path, index=False)
+        print(f"sessions={sessions} board rows={len(board) * scale} ({os.path.getsize(path) / 2**20:.1f} MB csv)")
+        for label, load in [("per-session read+copy", per_session), ("shared cached frame", shared)]:
+            ms, mb = simulate(load, path, sessions)
+            print(f"{label:>22}: rerun mean {ms:7.2f} ms, RSS +{mb:6.1f} MB")
+        print(f"{'app.py (AppTest)':>22}: rerun mean {app_reruns(Path(tmp), sessions):7.2f} ms")
@@ -0,0 +1,58 @@
+# Benchmark: app cold start per page. Each page is measured in a fresh
+# interpreter: streamlit import, first render (imports + data load + page),
+# a warm rerun, and which optional heavy modules ended up imported.
+# The news page reads a local feed file so no network is involved.
+# Usage: python benchmarks/bench_app_startup.py [path/to/app.py]
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from _common import ROOT
+
+PAGES = {
+    "Sports News": {"active_page": "Sports News"},
+    "NFL / Player Search": {"active_page": "NFL", "_nfl_sub_option": "Player Search"},
+    "NFL / Value Props": {"active_page": "NFL", "_nfl_sub_option": "Value Props"},
+}
+HEAVY = ["thefuzz", "feedparser", "streamlit_autorefresh", "requests", "pyarrow", "value_rules"]
+
+FEED = """<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><title>Local headline</title><link>http://example.com/1</link>
+<pubDate>Thu, 11 Sep 2025 17:24:00 +0000</pubDate></item></channel></rss>"""
+
+CHILD = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t_import = time.perf_counter() - t0
+state = {state!r}
+if state["active_page"] == "Sports News":
+    import news_feed
+    news_feed.FEEDS[:] = [{feed!r}]
+at = AppTest.from_file({app!r}, default_timeout=120)
+for k, v in state.items():
+    at.session_state[k] = v
+t0 = time.perf_counter(); at.run(); t_first = time.perf_counter() - t0
+t0 = time.perf_counter(); at.run(); t_rerun = time.perf_counter() - t0
+print(json.dumps({{"import": t_import, "first": t_first, "rerun": t_rerun, "error": bool(at.exception),
+                  "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def measure(app: str, state: dict, feed: str) -> dict:
+    code = CHILD.format(root=str(ROOT), state=state, feed=feed, app=app, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    app = str(Path(sys.argv[1]).resolve()) if len(sys.argv) > 1 else str(ROOT / "app.py")
+    with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as f:
+        f.write(FEED)
+    print(f"app={app}")
+    for page, state in PAGES.items():
+        r = measure(app, state, f.name)
+        print(f"{page:>20}: streamlit import {r['import'] * 1000:6.0f} ms, first render {r['first'] * 1000:6.0f} ms, "
+              f"rerun {r['rerun'] * 1000:5.0f} ms{' ERROR' if r['error'] else ''}  loaded={','.join(r['loaded']) or '-'}")
+    Path(f.name).unlink()
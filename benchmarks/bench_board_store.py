@@ -0,0 +1,56 @@
+# Benchmark: board_store reads over one day of 5-minute pulls (288 snapshots of
+# the repo's newest board), per-pull files vs the compacted day file: a full-day
+# read_range, a one-hour read_range (pushdown to the day file's row groups),
+# read_latest, and list_snapshots.
+# Usage: python benchmarks/bench_board_store.py [pulls]
+import shutil
+import sys
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from _common import ROOT, best_of
+import board_store
+
+COLUMNS = ["player_clean", "prop_clean", "pp_line", "captured_at"]
+
+def newest_board() -> pd.DataFrame:
+    boards = sorted(ROOT.glob("pp_nfl_board_*.csv"))
+    return pd.read_csv(boards[-1])
+
+def fill(root: Path, board: pd.DataFrame, day: pd.Timestamp, pulls: int) -> None:
+    for i in range(pulls):
+        board_store.write_snapshot(board, (day + timedelta(minutes=5 * i)).to_pydatetime(), root)
+
+def timings(root: Path, day: pd.Timestamp) -> dict:
+    hour = (day + timedelta(hours=12), day + timedelta(hours=13) - timedelta(microseconds=1))
+    return {
+        "read_range (day)": best_of(lambda: board_store.read_range(columns=COLUMNS, root=root), 3),
+        "read_range (1 hour)": best_of(lambda: board_store.read_range(*hour, columns=COLUMNS, root=root)),
+        "read_latest": best_of(lambda: board_store.read_latest(root=root)),
+        "list_snapshots": best_of(lambda: board_store.list_snapshots(root)),
+    }
+
+if __name__ == "__main__":
+    pulls = int(sys.argv[1]) if len(sys.argv) > 1 else 288
+    board = newest_board()
+    day = pd.Timestamp("2025-09-14", tz="UTC")
+    tmp = Path(tempfile.mkdtemp(prefix="bench_board_store_"))
+    try:
+        fill(tmp, board, day, pulls)
+        per_file = timings(tmp, day)
+        before = board_store.read_range(columns=COLUMNS, root=tmp)
+        board_store.compact_day(tmp / f"date={day:%Y-%m-%d}")
+        compacted = timings(tmp, day)
+        after = board_store.read_range(columns=COLUMNS, root=tmp)
+        pd.testing.assert_frame_equal(before.astype({c: object for c in COLUMNS[:2]}),
+                                      after.astype({c: object for c in COLUMNS[:2]}))
+    finally:
+        shutil.rmtree(tmp)
+
+    print(f"{pulls} pulls x {len(board)} lines, columns {COLUMNS}")
+    print(f"{'':22s}{'per-pull files':>16s}{'day file':>12s}")
+    for name in per_file:
+        print(f"{name:22s}{per_file[name] * 1e3:13.1f} ms{compacted[name] * 1e3:9.1f} ms")
@@ -0,0 +1,66 @@
+# Benchmark: entry_optimizer.optimize on synthetic slates.
+# Slates have ~2 props per player and 32 teams, with fair probabilities
+# spread like a real board (mostly 0.45-0.62). A small slate is checked
+# against brute-force enumeration of every valid entry first.
+# Usage: python benchmarks/bench_entry_optimizer.py [props] [top_k] [workers]
+import heapq
+import sys
+import time
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+import _common  # noqa: F401  (puts the repo root on sys.path)
+from entry_optimizer import MIN_TEAMS, _ev, _extend, legs_from_board, optimize
+from pricing import PAYOUTS
+
+def synth_slate(props: int, seed: int = 17) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    players = max(2, props // 2)
+    player = rng.integers(0, players, props)
+    return pd.DataFrame({
+        "Player": [f"Player {p}" for p in player],
+        "Team": [f"T{p % 32:02d}" for p in player],
+        "Prop": "RECEPTIONS",
+        "PrizePicks_Line": 2.5,
+        "Fair_Side": "Over",
+        "Fair_Prob": np.clip(rng.normal(0.52, 0.04, props), 0.4, 0.7),
+    })
+
+def brute_force(slate: pd.DataFrame, tiers, k: int):
+    legs = legs_from_board(slate)
+    p, pl, tm = legs["Fair_Prob"].tolist(), legs["Player"].tolist(), legs["Team"].tolist()
+    found = []
+    for tier in tiers:
+        n, payout = PAYOUTS[tier]
+        for combo in combinations(range(len(p)), n):
+            if len({pl[c] for c in combo}) < n or len({tm[c] for c in combo}) < MIN_TEAMS:
+                continue
+            dist = [1.0]
+            for c in combo:
+                dist = _extend(dist, p[c])
+            found.append(_ev(dist, payout))
+    return heapq.nlargest(k, found)
+
+if __name__ == "__main__":
+    props = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    top_k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+
+    small = synth_slate(28, seed=3)
+    tiers = ("2P", "3P", "4P", "5P", "3F", "4F", "5F")
+    got = optimize(small, tiers=tiers, top_k=top_k)["EV"].tolist()
+    want = brute_force(small, tiers, top_k)
+    same = np.allclose(got, want)
+    print(f"28-prop slate, tiers up to 5 legs: matches brute force = {same}")
+
+    slate = synth_slate(props)
+    for w in (1, workers):
+        t0 = time.perf_counter()
+        best = optimize(slate, top_k=top_k, workers=w)
+        dt = time.perf_counter() - t0
+        print(f"props={props} tiers=2-6 power+flex top_k={top_k} workers={w}: {dt:.2f}s  "
+              f"best EV {best['EV'].iloc[0]:+.3f} ({best['Tier'].iloc[0]})")
+    if not same:
+        sys.exit(1)
@@ -0,0 +1,78 @@
+# Benchmark: line_history queries on a synthetic full season polled every minute
+# (18 weeks x 7 days x 1440 pulls). Each week posts ~3000 projection_ids over
+# ~600 player/prop keys; every line moves ~30 times during its week and is
+# pulled after kickoff. Only changes are stored, as ingest() would write them.
+# Usage: python benchmarks/bench_line_history.py [weeks]
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from _common import best_of
+from line_history import LineHistory
+
+MINUTE = 60 * 10**9
+SEASON_START = pd.Timestamp("2025-09-01", tz="UTC").value
+
+def synth_changes(weeks: int = 18, keys: int = 600, ids_per_key: int = 5, moves: int = 30, seed: int = 5):
+    rng = np.random.default_rng(seed)
+    players = [f"PLAYER {i}" for i in range(keys // 3)]
+    props = ["RECEIVING YARDS", "RECEPTIONS", "RUSHING YARDS"]
+    key_player = np.repeat(players, 3)
+    key_prop = np.tile(props, len(players))
+    week_min = 7 * 1440
+    frames = []
+    pid0 = 6_000_000
+    for w in range(weeks):
+        n = keys * ids_per_key
+        pid = pid0 + np.arange(n)
+        pid0 += n
+        key = np.repeat(np.arange(keys), ids_per_key)
+        # moves + 1 (posted) + 1 (pulled) rows per projection_id
+        steps = moves + 2
+        t = np.sort(rng.integers(0, week_min - 1, (n, steps)), axis=1)
+        t[:, -1] = week_min - 1
+        ts = SEASON_START + (w * week_min + t) * MINUTE
+        base = rng.uniform(10, 90, n).round() + 0.5
+        line = base[:, None] + np.cumsum(rng.choice([-1.0, 0.0, 1.0], (n, steps)), axis=1)
+        line[:, -1] = np.nan
+        frames.append(pd.DataFrame({
+            "player_clean": key_player[np.repeat(key, steps)],
+            "prop_clean": key_prop[np.repeat(key, steps)],
+            "projection_id": np.repeat(pid, steps),
+            "captured_at": pd.to_datetime(ts.ravel(), utc=True),
+            "pp_line": line.ravel(),
+        }))
+    pulls = pd.to_datetime(SEASON_START + np.arange(weeks * week_min) * MINUTE, utc=True)
+    return pd.concat(frames, ignore_index=True), pulls
+
+def latency_us(fn, args_list) -> tuple:
+    lat = []
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        lat.append(time.perf_counter() - t0)
+    lat = np.array(lat) * 1e6
+    return np.percentile(lat, 50), np.percentile(lat, 99)
+
+if __name__ == "__main__":
+    weeks = int(sys.argv[1]) if len(sys.argv) > 1 else 18
+    changes, pulls = synth_changes(weeks)
+    t0 = time.perf_counter()
+    hist = LineHistory(changes, pulls)
+    build = time.perf_counter() - t0
+    print(f"pulls={len(pulls)} change rows={len(changes)} keys={len(hist.keys)} index build={build:.2f} s")
+
+    rng = np.random.default_rng(1)
+    keys = [hist.key_list[i] for i in rng.integers(0, len(hist.key_list), 500)]
+    mid = pd.Timestamp(SEASON_START + len(pulls) // 2 * MINUTE, tz="UTC")
+    for name, fn, args in [
+        ("series (arrays)", hist.series, keys),
+        ("history (DataFrame)", hist.history, keys),
+        ("line_at", hist.line_at, [(p, pr, mid) for p, pr in keys]),
+        ("trend", hist.trend, [(p, pr, 50.5) for p, pr in keys]),
+    ]:
+        p50, p99 = latency_us(fn, args)
+        print(f"{name:>20}: p50={p50:8.1f} µs  p99={p99:8.1f} µs")
+    print(f"{'movers (all keys)':>20}: {best_of(lambda: hist.movers(), repeat=3) * 1000:8.1f} ms")
@@ -0,0 +1,63 @@
+# Benchmark: LineLadder.lookup over a large board.
+# Synthetic ladders: `pairs` (player, prop) pairs, each with 4-12 book lines
+# one point apart and a falling Over probability; the board asks for random
+# lines around each ladder (some inside, some off either end).
+# Usage: python benchmarks/bench_line_ladder.py [board_rows] [pairs]
+import sys
+
+import numpy as np
+import pandas as pd
+
+import _common  # noqa: F401  (puts the repo root on sys.path)
+from _common import best_of
+from odds_index import LineLadder
+
+def synth(rows: int, pairs: int, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(4, 13, pairs)
+    code = np.repeat(np.arange(pairs), sizes)
+    start = np.repeat(rng.integers(10, 200, pairs) + 0.5, sizes)
+    step = np.arange(len(code)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    keys = pd.DataFrame({
+        "player_clean": [f"P{c:06d}" for c in code],
+        "prop_clean": "RECEIVING YARDS",
+        "Line": start + step,
+    })
+    prob = 0.75 - 0.04 * step + rng.normal(0, 0.005, len(code))
+
+    ask = rng.integers(0, pairs, rows)
+    mid = start[np.cumsum(sizes) - sizes][ask] + sizes[ask] / 2
+    board = pd.DataFrame({
+        "player_clean": [f"P{c:06d}" for c in ask],
+        "prop_clean": "RECEIVING YARDS",
+        "pp_line": np.round((mid + rng.normal(0, 4, rows)) * 2) / 2,
+    })
+    return keys, prob, board
+
+def naive(ladders: dict, board: pd.DataFrame) -> np.ndarray:
+    """Per-row dict lookup + np.interp, kept only as a baseline."""
+    out = np.full(len(board), np.nan)
+    for i, (p, s, x) in enumerate(zip(board["player_clean"], board["prop_clean"], board["pp_line"])):
+        lad = ladders.get((p, s))
+        if lad is not None and lad[0][0] <= x <= lad[0][-1]:
+            out[i] = np.interp(x, *lad)
+    return out
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    pairs = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    keys, prob, board = synth(rows, pairs)
+    ladder = LineLadder.build(keys, prob)
+    args = (board["player_clean"], board["prop_clean"], board["pp_line"])
+    got, _, _ = ladder.lookup(*args)
+
+    ladders = {k: (g["Line"].to_numpy(), prob[g.index]) for k, g in keys.groupby(["player_clean", "prop_clean"])}
+    want = naive(ladders, board)
+    same = np.allclose(got, want, equal_nan=True)
+    t_new = best_of(lambda: ladder.lookup(*args))
+    t_old = best_of(lambda: naive(ladders, board), repeat=1)
+    print(f"board={rows} ladders={pairs} book lines={len(keys)} covered={np.isfinite(got).mean():.1%}")
+    print(f"per-row interp: {t_old * 1000:8.1f} ms   searchsorted: {t_new * 1000:6.1f} ms "
+          f"({t_new / rows * 1e9:.0f} ns/row, {t_old / t_new:.0f}x)  same={same}")
+    if not same:
+        sys.exit(1)
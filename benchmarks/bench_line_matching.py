@@ -0,0 +1,81 @@
+# Benchmark: vectorized match_lines vs the old per-row iterrows loop in 02.
+# Usage: python benchmarks/bench_line_matching.py [pp_board.csv]
+import sys
+
+import pandas as pd
+
+from _common import ROOT, best_of, load_script
+from normalize import clean_players, clean_props
+
+m02 = load_script("02_classify_and_merge.py")
+
+def legacy_loop(pp: pd.DataFrame, odds_grouped: pd.DataFrame) -> pd.DataFrame:
+    """The original per-row matcher, kept here only as the baseline."""
+    rows = []
+    for _, r in pp.iterrows():
+        sub = odds_grouped[
+            (odds_grouped["player_clean"] == r["player_clean"]) &
+            (odds_grouped["prop_clean"]  == r["prop_clean"])
+        ]
+        if sub.empty:
+            continue
+        exact = sub[sub["Line"] == r["pp_line"]]
+        wiggle_up   = sub[(sub["Line"] == r["pp_line"] + 0.5) & (sub["Over_Favored"]  == True)]
+        wiggle_down = sub[(sub["Line"] == r["pp_line"] - 0.5) & (sub["Under_Favored"] == True)]
+        if not exact.empty:
+            use = exact
+        elif not wiggle_up.empty:
+            use = wiggle_up
+        elif not wiggle_down.empty:
+            use = wiggle_down
+        else:
+            continue
+        for _, s in use.iterrows():
+            rows.append({
+                "Player": r["player"],
+                "Prop": r["prop_clean"],
+                "PrizePicks_Line": r["pp_line"],
+                "Over_Odds": s["Over_Odds"],
+                "Under_Odds": s["Under_Odds"],
+            })
+    return pd.DataFrame(rows)
+
+def load_inputs(pp_csv):
+    pp = pd.read_csv(pp_csv)
+    pp["player_clean"] = clean_players(pp["player"])
+    pp["prop_clean"] = clean_props(pp["prop"])
+    pp["pp_line"] = pd.to_numeric(pp["pp_line"], errors="coerce")
+    pp = pp.dropna(subset=["pp_line"])
+
+    odds = pd.concat([pd.read_csv(f) for f in ROOT.glob("NFL - *.csv")], ignore_index=True)
+    odds = odds.rename(columns={
+        "description": "Player", "market": "Prop", "label": "Label",
+        "price": "Odds", "point": "Line", "bookmaker": "Book",
+    })
+    odds["player_clean"] = clean_players(odds["Player"])
+    odds["prop_clean"] = clean_props(odds["Prop"])
+    odds["Line"] = pd.to_numeric(odds["Line"], errors="coerce")
+    odds["Odds"] = pd.to_numeric(odds["Odds"], errors="coerce")
+    odds_grouped = m02.summarize_lines(odds)
+    return pp, odds_grouped
+
+def main():
+    pp_csv = sys.argv[1] if len(sys.argv) > 1 else str(ROOT / "pp_nfl_board_2025-09-04_221641UTC.csv")
+    pp, odds_grouped = load_inputs(pp_csv)
+
+    old = legacy_loop(pp, odds_grouped)
+    new = m02.match_lines(pp, odds_grouped)
+    pd.testing.assert_frame_equal(
+        old.reset_index(drop=True).astype(float, errors="ignore"),
+        new[m02.MATCH_COLUMNS].astype(float, errors="ignore"),
+        check_dtype=False,
+    )
+
+    t_old = best_of(lambda: legacy_loop(pp, odds_grouped), repeat=3)
+    t_new = best_of(lambda: m02.match_lines(pp, odds_grouped))
+    print(f"board rows: {len(pp)}  grouped odds: {len(odds_grouped)}  matched: {len(new)}")
+    print(f"iterrows loop : {t_old * 1000:8.1f} ms")
+    print(f"match_lines   : {t_new * 1000:8.1f} ms  ({t_old / t_new:.0f}x)")
+
+if __name__ == "__main__":
+    main()
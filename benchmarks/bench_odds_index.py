@@ -0,0 +1,22 @@
+# Benchmark: OddsIndex build and queries as the number of books grows.
+# Extra books are copies of the saved odds with nudged prices (see
+# bench_summarize_lines.scale); time should grow roughly linearly with books.
+# Usage: python benchmarks/bench_odds_index.py
+from _common import best_of
+from bench_summarize_lines import load_odds, scale
+from odds_index import OddsIndex
+
+def main():
+    base = load_odds()
+    for factor in (1, 10, 100):
+        odds = scale(base, factor)
+        index = OddsIndex.build(odds)
+        t_build = best_of(lambda: OddsIndex.build(odds))
+        t_summary = best_of(index.summary)
+        t_disagree = best_of(index.disagreements)
+        print(f"{factor:>4}x  rows={len(odds):>7}  lines={len(index.keys):>4}  books={len(index.books):>4}  "
+              f"build={t_build * 1000:6.1f} ms  summary={t_summary * 1000:6.1f} ms  "
+              f"disagreements={t_disagree * 1000:6.1f} ms")
+
+if __name__ == "__main__":
+    main()
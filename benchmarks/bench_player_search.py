@@ -0,0 +1,65 @@
+# Benchmark: trigram-narrowed Player Search vs process.extract over every player.
+# Reports index build time, per-keystroke p50/p99 latency and top-5 agreement
+# on a synthetic 10k-player universe.
+# Usage: python benchmarks/bench_player_search.py [n_players]
+import random
+import sys
+import time
+
+import numpy as np
+from thefuzz import process
+
+from _common import best_of
+from player_search import PlayerSearchIndex
+
+FIRST = ["Josh", "Jalen", "Patrick", "Justin", "Lamar", "Travis", "Tyreek", "Ja'Marr", "CeeDee", "Amon-Ra",
+         "Christian", "Derrick", "Saquon", "Davante", "Stefon", "Cooper", "Mike", "Chris", "Deebo", "Puka"]
+LAST = ["Allen", "Hurts", "Mahomes", "Jefferson", "Jackson", "Kelce", "Hill", "Chase", "Lamb", "St. Brown",
+        "McCaffrey", "Henry", "Barkley", "Adams", "Diggs", "Kupp", "Evans", "Olave", "Samuel", "Nacua"]
+
+def synth_players(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        first = rng.choice(FIRST) + rng.choice(["", "", "a", "o", "y", "ie"])
+        last = rng.choice(LAST) + rng.choice(["", "", "s", "son", "er", " Jr."])
+        names.add(f"{first} {last}{rng.randint(0, 99) if rng.random() < 0.5 else ''}".strip())
+    return sorted(names)
+
+def typed_queries(players: list, n: int, seed: int = 11) -> list:
+    """Every prefix of some real names, plus a one-character typo, as a user would type them."""
+    rng = random.Random(seed)
+    queries = []
+    for name in rng.sample(players, n):
+        queries.extend(name[:k] for k in range(1, len(name) + 1))
+        i = rng.randrange(len(name))
+        queries.append(name[:i] + name[i + 1:])
+    return queries
+
+def top_scores(query, choices):
+    return [m[1] for m in process.extract(query, choices, limit=5) if m[1] > 60]
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    players = synth_players(n)
+    build = best_of(lambda: PlayerSearchIndex(players), repeat=3)
+    index = PlayerSearchIndex(players)
+    queries = typed_queries(players, 20)
+
+    lat = []
+    for q in queries:
+        t0 = time.perf_counter()
+        index.search(q)
+        lat.append(time.perf_counter() - t0)
+    lat = np.array(lat) * 1000
+
+    sample = queries[::10]
+    t0 = time.perf_counter()
+    # Agreement = same five scores; names may differ only among equal-score ties
+    agree = sum(top_scores(q, index.candidates(q)) == top_scores(q, players) for q in sample)
+    full_ms = (time.perf_counter() - t0) / len(sample) * 1000
+
+    print(f"players={n} build={build * 1000:.1f} ms queries={len(queries)}")
+    print(f"indexed: p50={np.percentile(lat, 50):.2f} ms p99={np.percentile(lat, 99):.2f} ms")
+    print(f"full scan: mean={full_ms:.2f} ms")
+    print(f"top-5 score agreement with full scan: {agree}/{len(sample)}")
@@ -0,0 +1,35 @@
+# Benchmark: pricing.price over a ~100k-row board, for each de-vig method.
+# The matched board is tiled and its odds jittered; ~2% of rows lose a side.
+# Usage: python benchmarks/bench_pricing.py [rows]
+import sys
+
+import numpy as np
+import pandas as pd
+
+from _common import ROOT, best_of
+from pricing import METHODS, price
+
+def synth_board(rows: int, seed: int = 5) -> pd.DataFrame:
+    base = pd.read_csv(ROOT / "nfl_regular_with_proj.csv")
+    board = pd.concat([base] * (rows // len(base) + 1), ignore_index=True).iloc[:rows].copy()
+    rng = np.random.default_rng(seed)
+    over = -110 + rng.integers(-120, 120, rows)
+    under = -110 + rng.integers(-120, 120, rows)
+    # American odds live outside (-100, 100)
+    over = np.where(np.abs(over) < 100, over - 200 * np.sign(over + 0.5), over)
+    under = np.where(np.abs(under) < 100, under - 200 * np.sign(under + 0.5), under)
+    board["Over_Odds"] = over.astype(float)
+    board["Under_Odds"] = under.astype(float)
+    board.loc[rng.random(rows) < 0.02, "Under_Odds"] = np.nan
+    return board
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    board = synth_board(rows)
+    for method in METHODS:
+        priced = price(board, method)
+        fair = priced["Fair_Over"] + priced["Fair_Under"]
+        ok = np.allclose(fair.dropna(), 1.0)
+        t = best_of(lambda: price(board, method), repeat=5)
+        print(f"rows={rows} {method:>14}: {t * 1000:6.1f} ms  "
+              f"priced={int(priced['EV'].notna().sum())} fair_sums_to_1={ok}")
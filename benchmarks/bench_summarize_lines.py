@@ -0,0 +1,88 @@
+# Benchmark: columnar summarize_lines vs the old groupby().apply(summarize_line)
+# at 1x, 10x and 100x the saved odds volume (extra volume = extra books).
+# Usage: python benchmarks/bench_summarize_lines.py
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from _common import ROOT, best_of, load_script
+from normalize import clean_players, clean_props
+
+m02 = load_script("02_classify_and_merge.py")
+
+def summarize_line(group: pd.DataFrame) -> pd.Series:
+    """The original per-group summarizer, kept here only as the baseline."""
+    over = group[group["Label"].str.upper() == "OVER"]
+    under = group[group["Label"].str.upper() == "UNDER"]
+    over_best = np.nan
+    under_best = np.nan
+    if not over.empty:
+        over_best = over["Odds"].min()
+    if not under.empty:
+        under_best = under["Odds"].min()
+    over_favored = False
+    under_favored = False
+    if not np.isnan(over_best) and not np.isnan(under_best):
+        if over_best < under_best:
+            over_favored = True
+        elif under_best < over_best:
+            under_favored = True
+    return pd.Series({
+        "Over_Odds": over_best if not np.isnan(over_best) else None,
+        "Under_Odds": under_best if not np.isnan(under_best) else None,
+        "Over_Favored": over_favored,
+        "Under_Favored": under_favored
+    })
+
+def legacy(odds: pd.DataFrame) -> pd.DataFrame:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return (
+            odds.groupby(["player_clean", "prop_clean", "Line"], as_index=False)
+                .apply(summarize_line)
+                .reset_index(drop=True)
+        )
+
+def load_odds() -> pd.DataFrame:
+    odds = pd.concat([pd.read_csv(f) for f in ROOT.glob("NFL - *.csv")], ignore_index=True)
+    odds = odds.rename(columns={
+        "description": "Player", "market": "Prop", "label": "Label",
+        "price": "Odds", "point": "Line", "bookmaker": "Book",
+    })
+    odds["player_clean"] = clean_players(odds["Player"])
+    odds["prop_clean"] = clean_props(odds["Prop"])
+    return odds
+
+def scale(odds: pd.DataFrame, factor: int, seed: int = 7) -> pd.DataFrame:
+    """Pretend there are `factor` times as many books, each nudging the price."""
+    rng = np.random.default_rng(seed)
+    copies = []
+    for i in range(factor):
+        c = odds.copy()
+        c["Book"] = c["Book"] + f"_{i}"
+        if i:
+            c["Odds"] = c["Odds"] + rng.integers(-15, 16, len(c))
+        copies.append(c)
+    out = pd.concat(copies, ignore_index=True)
+    # Drop a few Unders so the missing-side path is exercised
+    drop = (out["Label"] == "Under") & (out["player_clean"].str.startswith("A"))
+    return out[~drop].reset_index(drop=True)
+
+def main():
+    base = load_odds()
+    for factor in (1, 10, 100):
+        odds = scale(base, factor)
+        old = legacy(odds)
+        new = m02.summarize_lines(odds)
+        pd.testing.assert_frame_equal(
+            old.astype({"Over_Odds": float, "Under_Odds": float}),
+            new.astype({"Over_Odds": float, "Under_Odds": float}),
+        )
+        t_old = best_of(lambda: legacy(odds), repeat=3)
+        t_new = best_of(lambda: m02.summarize_lines(odds))
+        print(f"{factor:>4}x  rows={len(odds):>7}  groups={len(new):>5}  "
+              f"apply={t_old * 1000:8.1f} ms  columnar={t_new * 1000:6.1f} ms  ({t_old / t_new:.0f}x)")
+
+if __name__ == "__main__":
+    main()
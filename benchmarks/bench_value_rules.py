@@ -0,0 +1,92 @@
+# Benchmark: value_rules.top_value_props vs the old row-wise Value Props
+# selection (apply(prop_type_and_threshold) + per-category lambdas), with the
+# old match strings corrected to the canonical prop names so both select alike.
+# The board is tiled to ~100k rows with jittered lines/projections/odds.
+# Usage: python benchmarks/bench_value_rules.py [rows]
+import sys
+
+import numpy as np
+import pandas as pd
+
+from _common import ROOT, best_of
+from value_rules import load_rules, top_value_props
+
+def legacy(df: pd.DataFrame) -> pd.DataFrame:
+    """The old app.py Value Props selection, kept here only as the baseline."""
+    temp = df.copy()
+    temp["Prop_LC"] = temp["Prop"].str.lower()
+    def prop_type_and_threshold(row):
+        prop = row["Prop_LC"]
+        line = row["PrizePicks_Line"]
+        if "completion" in prop or "pass attempt" in prop or "passing yard" in prop:
+            try:
+                over_odds = float(row.get("Over_Odds", 0))
+                under_odds = float(row.get("Under_Odds", 0))
+            except Exception:
+                over_odds, under_odds = 0, 0
+            minimum = 23 if "completion" in prop else 30 if "pass attempt" in prop else 225
+            return (line >= minimum) and not (over_odds < 0 and under_odds < 0)
+        elif "rush attempt" in prop:
+            return line >= 10
+        elif "receiving yards" in prop:
+            return line >= 40
+        elif "receptions" in prop:
+            return line >= 2.5
+        elif "rushing yards" in prop:
+            return line >= 45
+        elif "receiving + rush yards" in prop:
+            return line >= 65
+        return False
+    temp = temp[temp.apply(prop_type_and_threshold, axis=1)]
+    temp = temp[temp["Projection"] > temp["PrizePicks_Line"]]
+    temp["Edge"] = temp["Projection"] - temp["PrizePicks_Line"]
+    temp = temp[temp["Edge"] >= 1.0]
+    categories = {
+        "passing": lambda s: "passing yard" in s or "completion" in s or "pass attempt" in s,
+        "rush_attempts": lambda s: "rush attempt" in s,
+        "receptions": lambda s: "receptions" in s,
+        "receiving_yards": lambda s: "receiving yards" in s,
+    }
+    selected = []
+    for cat, match_fn in categories.items():
+        cat_df = temp[temp["Prop_LC"].apply(match_fn)]
+        if not cat_df.empty:
+            def odds_strength(row):
+                try:
+                    return abs(float(row["Over_Odds"]))
+                except Exception:
+                    return 9999
+            cat_df = cat_df.copy()
+            cat_df["Odds_Strength"] = cat_df.apply(odds_strength, axis=1)
+            cat_df = cat_df.sort_values(["Edge", "Odds_Strength"], ascending=[False, True])
+            selected.append(cat_df.iloc[0])
+    return pd.DataFrame(selected)
+
+def synth_board(rows: int, seed: int = 3) -> pd.DataFrame:
+    base = pd.read_csv(ROOT / "nfl_regular_with_proj.csv")
+    board = pd.concat([base] * (rows // len(base) + 1), ignore_index=True).iloc[:rows]
+    rng = np.random.default_rng(seed)
+    board["Projection"] = board["Projection"] * rng.uniform(0.8, 1.3, rows)
+    board["Over_Odds"] = board["Over_Odds"] + rng.integers(-40, 40, rows)
+    board["Under_Odds"] = board["Under_Odds"] + rng.integers(-40, 40, rows)
+    # A few extra prop kinds so the passing/odds rules get exercised
+    extra = rng.random(rows) < 0.05
+    board.loc[extra, "Prop"] = "PASSING YARDS"
+    board.loc[extra, "PrizePicks_Line"] = rng.uniform(180, 300, extra.sum()).round(1)
+    board.loc[extra, "Projection"] = board.loc[extra, "PrizePicks_Line"] + rng.normal(0, 20, extra.sum())
+    return board
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    board = synth_board(rows)
+    config = load_rules()
+    old = legacy(board)
+    new = top_value_props(board, config)
+    cols = ["Player", "Prop", "PrizePicks_Line", "Projection", "Edge", "Odds_Strength"]
+    same = old[cols].reset_index(drop=True).equals(new[cols].reset_index(drop=True))
+    t_old = best_of(lambda: legacy(board), repeat=1)
+    t_new = best_of(lambda: top_value_props(board, config), repeat=5)
+    print(f"rows={rows} legacy={t_old * 1000:.1f} ms rules={t_new * 1000:.1f} ms "
+          f"speedup={t_old / t_new:.0f}x same_selection={same}")
+    if not same:
+        sys.exit(1)
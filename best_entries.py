@@ -0,0 +1,40 @@
+"""Precomputed best entries: the Value Props "Best Entries" table, computed once per data refresh.
+
+Reads nfl_value_board.parquet, picks the top 2-6 leg entries by no-vig EV
+(entry_optimizer) and re-prices them with correlated legs (entry_sim), and
+writes nfl_best_entries.parquet. The app only reads this file.
+
+Usage: python best_entries.py [value_board] [out_parquet]
+"""
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from entry_optimizer import optimize
+from entry_sim import simulate_entries
+from value_board import VALUE_BOARD
+
+BEST_ENTRIES = "nfl_best_entries.parquet"
+
+def build(board: pd.DataFrame) -> pd.DataFrame:
+    return simulate_entries(board, optimize(board))
+
+def write(entries: pd.DataFrame, out_path=BEST_ENTRIES) -> Path:
+    out_path = Path(out_path)
+    tmp = out_path.with_suffix(".tmp")
+    entries.to_parquet(tmp, index=False)
+    os.replace(tmp, out_path)
+    return out_path
+
+def main(in_path: str = VALUE_BOARD, out_path: str = BEST_ENTRIES):
+    if not os.path.exists(in_path):
+        print(f"❌ Missing {in_path}")
+        sys.exit(1)
+    entries = build(pd.read_parquet(in_path))
+    write(entries, out_path)
+    print(f"✅ Saved {out_path}: {len(entries)} entries")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
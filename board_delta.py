@@ -0,0 +1,153 @@
+"""Incremental (delta) pipeline run keyed on PrizePicks projection_id.
+
+Compares the new board against the board the current outputs were built
+from, re-runs 02 odds matching and 03 projection matching only for rows
+that were added or whose line moved, and patches nfl_regular.csv and
+nfl_regular_with_proj.csv in place. Falls back to a full run when there is
+no usable previous state or the odds/projection inputs changed.
+
+Usage: python board_delta.py [board.csv|snapshot.parquet] [projections_folder]
+"""
+import glob
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from stage_loader import load_stage
+
+STATE_FILE = Path(".board_delta_state.json")
+
+ADDED = "added"
+REMOVED = "removed"
+LINE_MOVED = "line_moved"
+UNCHANGED = "unchanged"
+
+# ---------- Diff ----------
+def diff_boards(prev: pd.DataFrame, curr: pd.DataFrame) -> pd.DataFrame:
+    """Classify every projection_id as added, removed, line_moved or unchanged."""
+    cols = ["projection_id", "pp_line"]
+    a = prev[cols].drop_duplicates("projection_id", keep="last")
+    b = curr[cols].drop_duplicates("projection_id", keep="last")
+    d = a.merge(b, on="projection_id", how="outer", suffixes=("_prev", ""), indicator=True)
+
+    same_line = (d["pp_line_prev"] == d["pp_line"]) | (d["pp_line_prev"].isna() & d["pp_line"].isna())
+    d["change"] = np.select(
+        [d["_merge"] == "right_only", d["_merge"] == "left_only", ~same_line],
+        [ADDED, REMOVED, LINE_MOVED],
+        default=UNCHANGED,
+    )
+    return d.drop(columns="_merge")
+
+def patch(existing: pd.DataFrame, fresh: pd.DataFrame, touched_ids) -> pd.DataFrame:
+    """Drop every row of `existing` whose projection_id was touched, then append `fresh`."""
+    kept = existing[~existing["projection_id"].isin(touched_ids)]
+    if fresh.empty:
+        return kept.reset_index(drop=True)
+    return pd.concat([kept, fresh], ignore_index=True)
+
+# ---------- State ----------
+def _signature(paths) -> list:
+    """Cheap change signature for a set of input files (name, size, mtime)."""
+    sig = []
+    for p in sorted(paths):
+        st = os.stat(p)
+        sig.append([os.path.basename(p), st.st_size, st.st_mtime_ns])
+    return sig
+
+def _load_state(state_file: Path) -> dict:
+    try:
+        return json.loads(Path(state_file).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _has_key(csv_path: str) -> bool:
+    if not os.path.exists(csv_path):
+        return False
+    return "projection_id" in pd.read_csv(csv_path, nrows=0).columns
+
+# ---------- Run ----------
+def run(
+    board,
+    odds_folder: str = ".",
+    projections_folder: str = "projections",
+    regular_csv: str = "nfl_regular.csv",
+    out_csv: str = "nfl_regular_with_proj.csv",
+    state_file: Path = STATE_FILE,
+) -> pd.DataFrame:
+    """Bring `regular_csv`/`out_csv` up to date with `board`; returns the diff (empty on a full run).
+
+    `board` must be a file path (CSV or board_store snapshot): it is recorded
+    as the state the next run diffs against.
+    """
+    if isinstance(board, pd.DataFrame):
+        raise TypeError("board_delta.run() needs a board file path (CSV or board_store snapshot), not a DataFrame")
+    proj_files = glob.glob(os.path.join(projections_folder, "*.csv"))
+    if not proj_files:
+        # Checked up front so a first run doesn't rebuild 02 and then die in 03
+        raise FileNotFoundError(
+            f"No projection CSVs found in '{projections_folder}'. "
+            f"03_match_projections reads the newest *.csv there; pass projections_folder=..."
+        )
+    m02 = load_stage("02_classify_and_merge.py")
+    m03 = load_stage("03_match_projections.py")
+
+    inputs = {
+        "odds": _signature(glob.glob(os.path.join(odds_folder, "NFL - *.csv"))),
+        "projections": _signature(proj_files),
+    }
+    state = _load_state(state_file)
+    prev_board = state.get("board")
+
+    can_patch = (
+        prev_board is not None
+        and os.path.exists(prev_board)
+        and all(state.get(k) == v for k, v in inputs.items())
+        and _has_key(regular_csv)
+        and _has_key(out_csv)
+    )
+
+    if not can_patch:
+        print("🔁 No reusable state for a delta run, doing a full rebuild")
+        m02.main(board, odds_folder, regular_csv)
+        m03.main(regular_csv, projections_folder, out_csv)
+        diff = pd.DataFrame()
+    else:
+        prev = m02.load_board(prev_board)
+        curr = m02.load_board(board)
+        diff = diff_boards(prev, curr)
+        counts = diff["change"].value_counts()
+        print("Δ " + ", ".join(f"{k}={counts.get(k, 0)}" for k in (ADDED, REMOVED, LINE_MOVED, UNCHANGED)))
+
+        touched = diff.loc[diff["change"] != UNCHANGED, "projection_id"]
+        redo = diff.loc[diff["change"].isin([ADDED, LINE_MOVED]), "projection_id"]
+        changed = curr[curr["projection_id"].isin(redo)]
+
+        # Only the changed rows go through odds + projection matching
+        regular_new = pd.DataFrame()
+        with_proj_new = pd.DataFrame()
+        if not changed.empty:
+            changed, odds = m02.link_players(changed, m02.load_odds(odds_folder), report=False)
+            # Same matching + pricing as a full 02 run; the odds (and so the saved index) are unchanged
+            regular_new = m02.match_and_price(changed, odds, index_path=None)
+            if not regular_new.empty:
+                with_proj_new = m03.attach_projections(regular_new, m03.load_projections(projections_folder))
+
+        regular = patch(pd.read_csv(regular_csv), regular_new, touched)
+        with_proj = patch(pd.read_csv(out_csv), with_proj_new, touched)
+        regular.to_csv(regular_csv, index=False)
+        with_proj.to_csv(out_csv, index=False)
+        print(f"✅ Patched {len(redo)} changed lines → {regular_csv} ({len(regular)} rows), "
+              f"{out_csv} ({len(with_proj)} rows)")
+
+    state = {"board": os.fspath(board), **inputs}
+    Path(state_file).write_text(json.dumps(state, indent=2))
+    return diff
+
+if __name__ == "__main__":
+    m02 = load_stage("02_classify_and_merge.py")
+    board_path = sys.argv[1] if len(sys.argv) > 1 else m02.latest_board()
+    run(board_path, projections_folder=sys.argv[2] if len(sys.argv) > 2 else "projections")
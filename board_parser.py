@@ -0,0 +1,67 @@
+# board_parser.py — /projections payload -> PrizePicks board frame
+import json
+
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # stdlib json is fine, just slower on the 2500-projection payload
+    orjson = None
+
+from normalize import clean_players, clean_props
+
+BOARD_COLUMNS = ["player", "team", "prop", "pp_line", "projection_id", "kickoff"]
+PLAYER_TYPES = ("players", "new_players", "new_player")
+
+def loads(raw):
+    """Decode a raw payload, with orjson when it's installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _rel_id(rel: dict, key: str):
+    return ((rel.get(key) or {}).get("data") or {}).get("id")
+
+def parse_projections(result, league: str = "NFL") -> pd.DataFrame:
+    """Build the board for one league from a /projections payload (dict, str or bytes).
+
+    Leagues and players in `included` are indexed once; projections from other
+    leagues are skipped before any row is built, and rows are collected as
+    tuples straight into the frame.
+    """
+    if isinstance(result, (str, bytes, bytearray)):
+        result = loads(result)
+
+    league_ids = set()
+    player_info = {}
+    for inc in result.get("included", []):
+        t = inc.get("type", "")
+        if t in PLAYER_TYPES:
+            attrs = inc.get("attributes", {})
+            name = attrs.get("name") or attrs.get("display_name") or attrs.get("full_name") or "UNKNOWN"
+            player_info[inc.get("id")] = (name, attrs.get("team", "N/A"))
+        elif "league" in t and inc.get("attributes", {}).get("name") == league:
+            league_ids.add(inc.get("id"))
+
+    unknown = ("UNKNOWN", "N/A")
+    records = []
+    for prop in result.get("data", []):
+        rel = prop.get("relationships", {})
+        if _rel_id(rel, "league") not in league_ids:
+            continue
+        rel_data = rel.get("new_player") or rel.get("player")
+        if not rel_data:
+            continue
+        name, team = player_info.get((rel_data.get("data") or {}).get("id"), unknown)
+        attrs = prop.get("attributes", {})
+        records.append((
+            name,
+            team,
+            attrs.get("stat_type", "UNKNOWN"),
+            attrs.get("line_score", "N/A"),
+            prop.get("id"),
+            attrs.get("start_time"),
+        ))
+
+    board = pd.DataFrame.from_records(records, columns=BOARD_COLUMNS)
+    board["player_clean"] = clean_players(board["player"])
+    board["prop_clean"] = clean_props(board["prop"])
+    return board
@@ -0,0 +1,16 @@
+"""Column lists of the matched board files, shared by the stages that write them.
+
+nfl_regular_with_proj.csv has two writers (03_match_projections, 04_nfl_merge):
+the core PROJ_COLUMNS, then whichever optional 02 columns the matched board
+carries (PASSTHROUGH_COLUMNS), in this order.
+"""
+from pricing import PRICE_COLUMNS
+
+# OddsIndex.summary() columns merged onto nfl_regular.csv by 02_classify_and_merge
+SUMMARY_COLUMNS = ["Best_Over", "Best_Over_Book", "Best_Under", "Best_Under_Book",
+                   "Books", "Consensus_Over", "Consensus_Under", "Spread"]
+# LineLadder.lookup() columns for lines no book quotes
+LADDER_COLUMNS = ["Ladder_Over", "Ladder_Low", "Ladder_High"]
+
+PROJ_COLUMNS = ["Player", "Prop", "PrizePicks_Line", "Over_Odds", "Under_Odds", "Projection"]
+PASSTHROUGH_COLUMNS = ["projection_id", "Team", *SUMMARY_COLUMNS, *LADDER_COLUMNS, *PRICE_COLUMNS]
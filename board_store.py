@@ -0,0 +1,233 @@
+"""Date-partitioned Parquet store for PrizePicks board snapshots.
+
+Layout: <root>/date=YYYY-MM-DD/board_<stamp>.parquet, one file per pull, where
+<stamp> is YYYY-MM-DD_HHMMSS[.ffffff]UTC (sub-second, so two pulls in the same
+second never overwrite each other). Text columns are stored
+dictionary-encoded, lines as floats, kickoff and captured_at as UTC
+timestamps.
+
+compact() folds every finished day into <root>/date=YYYY-MM-DD/day.parquet,
+one row group per pull in capture order. A pull keeps its board_<stamp> path
+as its name either way (read_snapshot resolves it). The day's footer and pull
+list are cached per file version, and read_range decodes only the row groups
+of the pulls in range, so an hour out of a compacted day reads 12 row groups,
+not the day. A whole day is still ~1.3M rows to decode; see
+benchmarks/bench_board_store.py.
+
+Usage: python board_store.py [compact]
+"""
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+STORE_DIR = Path("board_store")
+STAMP_FMT = "%Y-%m-%d_%H%M%SUTC"
+STAMP_FMT_US = "%Y-%m-%d_%H%M%S.%fUTC"
+DAY_FILE = "day.parquet"
+PULLS_KEY = b"board_store.pulls"  # day file metadata: JSON list of pull stamps, one per row group
+
+CATEGORY_COLUMNS = ["player", "team", "prop", "player_clean", "prop_clean"]
+
+def format_stamp(captured_at: datetime) -> str:
+    """File-name stamp; sub-second digits only when the time has them (replays keep whole seconds)."""
+    return captured_at.strftime(STAMP_FMT_US if captured_at.microsecond else STAMP_FMT)
+
+def parse_stamp(stamp: str) -> Optional[pd.Timestamp]:
+    for fmt in (STAMP_FMT_US, STAMP_FMT):
+        try:
+            return pd.Timestamp(datetime.strptime(stamp, fmt).replace(tzinfo=timezone.utc))
+        except ValueError:
+            continue
+    return None
+
+def snapshot_path(captured_at: datetime, root: Path = STORE_DIR) -> Path:
+    return Path(root) / f"date={captured_at:%Y-%m-%d}" / f"board_{format_stamp(captured_at)}.parquet"
+
+def to_typed_frame(df: pd.DataFrame, captured_at: datetime) -> pd.DataFrame:
+    """Coerce a raw board (as built by board_parser.parse_projections) to the store's column types."""
+    out = df.copy()
+    for c in CATEGORY_COLUMNS:
+        if c in out.columns:
+            out[c] = out[c].astype("category")
+    if "pp_line" in out.columns:
+        out["pp_line"] = pd.to_numeric(out["pp_line"], errors="coerce")
+    if "projection_id" in out.columns:
+        out["projection_id"] = pd.to_numeric(out["projection_id"], errors="coerce").astype("Int64")
+    if "kickoff" in out.columns:
+        out["kickoff"] = pd.to_datetime(out["kickoff"], utc=True, errors="coerce")
+    out["captured_at"] = pd.Timestamp(captured_at).tz_convert("UTC")
+    return out
+
+def _store_schema(schema: pa.Schema) -> pa.Schema:
+    """One dictionary index width for every pull, so files and row groups share a schema."""
+    return pa.schema([
+        f.with_type(pa.dictionary(pa.int32(), f.type.value_type)) if pa.types.is_dictionary(f.type) else f
+        for f in schema
+    ], metadata=schema.metadata)
+
+def write_snapshot(df: pd.DataFrame, captured_at: Optional[datetime] = None, root: Path = STORE_DIR) -> Path:
+    """Write one board pull as a Parquet file in its date partition."""
+    if captured_at is None:
+        captured_at = datetime.now(timezone.utc)
+    path = snapshot_path(captured_at, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(to_typed_frame(df, captured_at), preserve_index=False)
+    pq.write_table(table.cast(_store_schema(table.schema)), path, compression="zstd", use_dictionary=True)
+    return path
+
+def save_board(df: pd.DataFrame, store: str = "csv", captured_at: Optional[datetime] = None,
+               out_dir: Path = Path(".")) -> Path:
+    """Save a pulled board as <out_dir>/pp_nfl_board_<stamp>.csv (default) or a <out_dir>/board_store snapshot."""
+    if captured_at is None:
+        captured_at = datetime.now(timezone.utc)
+    if store == "parquet":
+        out = write_snapshot(df, captured_at, root=Path(out_dir) / STORE_DIR)
+    else:
+        out = Path(out_dir) / f"pp_nfl_board_{format_stamp(captured_at)}.csv"
+        df.to_csv(out, index=False)
+    print(f"✅ Saved {len(df)} NFL lines to {out}")
+    return out
+
+# ---------- Day compaction ----------
+@lru_cache(maxsize=64)
+def _day_index(path: str, mtime_ns: int, size: int) -> tuple:
+    """A day file's footer and pull stamps in row-group order (cached per file version)."""
+    meta = pq.read_metadata(path)
+    return meta, tuple(json.loads(meta.metadata[PULLS_KEY]))
+
+def _day_file(day_file: Path) -> tuple:
+    st = day_file.stat()
+    return _day_index(str(day_file), st.st_mtime_ns, st.st_size)
+
+def _pulls_of(day_file: Path) -> tuple:
+    return _day_file(day_file)[1]
+
+def _open_day(day_file: Path) -> pq.ParquetFile:
+    return pq.ParquetFile(day_file, metadata=_day_file(day_file)[0])
+
+def compact_day(folder: Path) -> Optional[Path]:
+    """Fold a date partition's per-pull files (and any earlier day file) into one day file.
+
+    The day file replaces the old one before the per-pull files are removed, so
+    a crash in between leaves duplicates (list_snapshots keeps one), never gaps.
+    """
+    folder = Path(folder)
+    day_file = folder / DAY_FILE
+    singles = sorted(folder.glob("board_*.parquet"))
+    if not singles:
+        return None
+    pulls = {}
+    if day_file.exists():
+        pf = _open_day(day_file)
+        for rg, stamp in enumerate(_pulls_of(day_file)):
+            pulls[stamp] = pf.read_row_group(rg)
+    for f in singles:
+        pulls[f.stem[len("board_"):]] = pq.read_table(f)
+    order = sorted((s for s, t in pulls.items() if t.num_rows), key=parse_stamp)
+    if not order:
+        return None
+
+    schema = _store_schema(pulls[order[-1]].schema)
+    schema = schema.with_metadata({**(schema.metadata or {}), PULLS_KEY: json.dumps(order).encode()})
+    tmp = day_file.with_suffix(".tmp")
+    with pq.ParquetWriter(tmp, schema, compression="zstd", use_dictionary=True) as writer:
+        for stamp in order:
+            table = pulls[stamp].cast(schema)
+            writer.write_table(table, row_group_size=table.num_rows)
+    os.replace(tmp, day_file)
+    for f in singles:
+        f.unlink()
+    return day_file
+
+def compact(root: Path = STORE_DIR) -> list[Path]:
+    """Compact every date partition except the newest (still being written by pulls)."""
+    folders = sorted(Path(root).glob("date=*"))
+    done = [out for out in map(compact_day, folders[:-1]) if out is not None]
+    print(f"🗂️ Compacted {len(done)} day(s) under {root}")
+    return done
+
+# ---------- Reader API ----------
+def list_snapshots(root: Path = STORE_DIR) -> pd.DataFrame:
+    """Every stored pull, oldest first: its path (name), capture time, and the file + row group holding it."""
+    rows = []
+    for day_file in Path(root).glob(f"date=*/{DAY_FILE}"):
+        for rg, stamp in enumerate(_pulls_of(day_file)):
+            rows.append((day_file.parent / f"board_{stamp}.parquet", parse_stamp(stamp), day_file, rg))
+    for f in Path(root).glob("date=*/board_*.parquet"):
+        ts = parse_stamp(f.stem[len("board_"):])
+        if ts is not None:
+            rows.append((f, ts, f, 0))
+    if not rows:
+        return pd.DataFrame(columns=["path", "captured_at", "file", "row_group"])
+    snaps = pd.DataFrame(rows, columns=["path", "captured_at", "file", "row_group"])
+    # A pull both in a day file and still on its own (interrupted compaction) is read from the day file
+    return snaps.drop_duplicates("path").sort_values("captured_at", ignore_index=True)
+
+def read_snapshot(path, columns: Optional[list] = None) -> pd.DataFrame:
+    """One pull by its board_<stamp>.parquet path, whether or not its day has been compacted."""
+    path = Path(path)
+    if path.exists():
+        return pq.read_table(path, columns=columns).to_pandas()
+    day_file = path.parent / DAY_FILE
+    stamp = path.stem[len("board_"):]
+    pulls = _pulls_of(day_file) if day_file.exists() else ()
+    if stamp not in pulls:
+        raise FileNotFoundError(f"No board_store snapshot {path}")
+    return _open_day(day_file).read_row_group(pulls.index(stamp), columns=columns).to_pandas()
+
+def _read(snaps: pd.DataFrame, columns: Optional[list] = None) -> pd.DataFrame:
+    """Read the listed pulls: whole per-pull files, and only the listed row groups of day files."""
+    if snaps.empty:
+        return pd.DataFrame(columns=columns or [])
+    tables = []
+    for file, group in snaps.groupby("file", sort=False):
+        if file.name == DAY_FILE:
+            tables.append(_open_day(file).read_row_groups(group["row_group"].tolist(), columns=columns))
+        else:
+            tables.append(pq.read_table(file, columns=columns))
+    schema = _store_schema(tables[-1].schema)
+    return pa.concat_tables([t.cast(schema) for t in tables]).to_pandas()
+
+def read_latest(columns: Optional[list] = None, root: Path = STORE_DIR) -> pd.DataFrame:
+    """Newest snapshot, optionally limited to `columns`."""
+    snaps = list_snapshots(root)
+    if snaps.empty:
+        return pd.DataFrame(columns=columns or [])
+    return read_snapshot(snaps["path"].iloc[-1], columns)
+
+def read_range(start=None, end=None, columns: Optional[list] = None, root: Path = STORE_DIR) -> pd.DataFrame:
+    """All snapshots captured in [start, end], concatenated, optionally limited to `columns`.
+
+    `start`/`end` accept anything pd.Timestamp does; naive values are taken as UTC.
+    Only files holding a pull in range are opened, and in a compacted day only
+    the row groups of those pulls are decoded (looked up in the day's pull list).
+    """
+    snaps = list_snapshots(root)
+    if start is not None:
+        snaps = snaps[snaps["captured_at"] >= _utc(start)]
+    if end is not None:
+        snaps = snaps[snaps["captured_at"] <= _utc(end)]
+    return _read(snaps, columns)
+
+def latest_captured_at(root: Path = STORE_DIR) -> Optional[pd.Timestamp]:
+    snaps = list_snapshots(root)
+    return None if snaps.empty else snaps["captured_at"].iloc[-1]
+
+def _utc(value) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["compact"]:
+        compact()
+    else:
+        snaps = list_snapshots()
+        print(f"✅ {len(snaps)} snapshots in {snaps['file'].nunique()} files under {STORE_DIR}")
@@ -0,0 +1,160 @@
+"""Long-lived PrizePicks capture daemon.
+
+Keeps one warm Chromium persistent context on .pp_profile (launched and
+warmed up once, like 01_pull_prizepicks_nfl) and serves pull requests over a
+local TCP socket, so repeat pulls only cost the /projections fetch itself.
+
+    python capture_daemon.py serve [--headless] [--store parquet]
+    python capture_daemon.py pull          # ask the running daemon for a board
+    python capture_daemon.py stop
+
+Protocol: one JSON line per request ({"cmd": "pull" | "ping" | "stop"}) and one
+JSON line back. --app-url/--api-url point the daemon at a local stand-in
+server that serves a fixture payload; main(fetch=...) swaps the browser for
+any url -> bytes callable (no Playwright needed).
+"""
+import argparse
+import json
+import socket
+import socketserver
+import time
+from typing import Callable, Optional
+
+from board_store import save_board
+from stage_loader import load_stage
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+class CaptureDaemon:
+    """One warm browser context; pull() fetches and saves the board on demand."""
+
+    def __init__(self, api_url: str, app_url: str, store: str = "csv", headless: bool = False,
+                 fetch: Optional[Callable[[str], bytes]] = None):
+        self.api_url = api_url
+        self.app_url = app_url
+        self.store = store
+        self.headless = headless
+        self._fetch = fetch  # url -> payload bytes, in place of the browser
+        self._pw = None
+        self.browser = None
+        self.page = None
+
+    def start(self):
+        if self._fetch is not None:
+            return
+        from playwright.sync_api import sync_playwright
+
+        m01 = load_stage("01_pull_prizepicks_nfl.py")
+        m01.PROFILE_DIR.mkdir(exist_ok=True)
+        self._pw = sync_playwright().start()
+        self.browser = m01.launch_context(self._pw, headless=self.headless)
+        self.page = m01.warm_up(self.browser, self.app_url)
+
+    def fetch(self) -> bytes:
+        """GET the projections endpoint with the context's cookies; re-warm once on a non-2xx."""
+        if self._fetch is not None:
+            return self._fetch(self.api_url)
+        for attempt in range(2):
+            resp = self.browser.request.get(self.api_url, timeout=30000)
+            if resp.ok:
+                return resp.body()
+            if attempt == 0:
+                print(f"⚠️ API status {resp.status}, reloading app page and retrying")
+                self.page.reload(wait_until="domcontentloaded")
+                self.page.wait_for_timeout(2000)
+        raise RuntimeError(f"API status {resp.status}")
+
+    def pull(self) -> dict:
+        m01 = load_stage("01_pull_prizepicks_nfl.py")
+        t0 = time.perf_counter()
+        board, captured_at = m01.capture(self.fetch())
+        if board.empty:
+            return {"ok": False, "error": "no NFL rows in payload"}
+        out = save_board(board, store=self.store, captured_at=captured_at)
+        return {"ok": True, "rows": len(board), "path": str(out),
+                "seconds": round(time.perf_counter() - t0, 3)}
+
+    def close(self):
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+        if self._pw is not None:
+            self._pw.stop()
+
+# ---------- Socket server ----------
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            cmd = json.loads(self.rfile.readline() or b"{}").get("cmd")
+        except json.JSONDecodeError:
+            cmd = None
+        if cmd == "ping":
+            reply = {"ok": True}
+        elif cmd == "pull":
+            try:
+                reply = self.server.daemon.pull()
+            except Exception as e:
+                reply = {"ok": False, "error": str(e)}
+        elif cmd == "stop":
+            reply = {"ok": True}
+            self.server.stopping = True
+        else:
+            reply = {"ok": False, "error": f"unknown command: {cmd!r}"}
+        self.wfile.write((json.dumps(reply) + "\n").encode())
+
+class _Server(socketserver.TCPServer):
+    allow_reuse_address = True
+    stopping = False
+
+def serve(daemon: CaptureDaemon, host: str = HOST, port: int = PORT):
+    daemon.start()
+    with _Server((host, port), _Handler) as server:
+        server.daemon = daemon
+        server.timeout = 0.5
+        print(f"🟢 Capture daemon ready on {host}:{port}")
+        try:
+            # Single-threaded on purpose: Playwright's sync API must stay on one thread
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            daemon.close()
+    print("🛑 Capture daemon stopped")
+
+def request(cmd: str, host: str = HOST, port: int = PORT, timeout: float = 120) -> dict:
+    """Send one command to a running daemon and return its reply."""
+    with socket.create_connection((host, port), timeout=timeout) as s:
+        s.sendall((json.dumps({"cmd": cmd}) + "\n").encode())
+        return json.loads(s.makefile("rb").readline())
+
+def main(argv=None, fetch: Optional[Callable[[str], bytes]] = None):
+    parser = argparse.ArgumentParser(description="Warm-browser PrizePicks capture daemon.")
+    parser.add_argument("cmd", choices=["serve", "pull", "ping", "stop"])
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--store", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--api-url", default=None, help="override API_URL (e.g. a local fixture server)")
+    parser.add_argument("--app-url", default=None, help="override APP_URL")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        m01 = load_stage("01_pull_prizepicks_nfl.py")
+        serve(
+            CaptureDaemon(
+                api_url=args.api_url or m01.API_URL,
+                app_url=args.app_url or m01.APP_URL,
+                store=args.store,
+                headless=args.headless,
+                fetch=fetch,
+            ),
+            args.host,
+            args.port,
+        )
+    else:
+        print(json.dumps(request(args.cmd, args.host, args.port)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Multi-leg PrizePicks entry optimizer.
+
+Searches 2- to 6-leg entries over a priced board (pricing.price columns) and
+returns the top-k by expected return under pricing.PAYOUTS. Each leg is
+taken on its Fair_Side at Fair_Prob, and legs are treated as independent.
+
+The search is a depth-first branch-and-bound. Legs are sorted by
+probability, and an entry's EV only grows with each leg's probability, so a
+partial entry is bounded by its EV with the open slots filled by the
+next-best remaining legs. Once that bound can't beat the current k-th best
+entry, no later leg at that depth can either, and the loop stops there.
+
+Constraints: at most one leg per player (so never both sides of a prop), at
+most `max_per_team` legs from one team, and legs from at least MIN_TEAMS
+teams, as PrizePicks requires. Team rules only apply when the board has a
+Team column.
+
+Large slates can be split across a process pool by first leg; every worker
+prunes against its own top-k and the results are merged.
+
+Usage: python entry_optimizer.py [board] [top_k] [workers]
+"""
+import heapq
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pricing import PAYOUTS
+
+TOP_K = 10
+MIN_TEAMS = 2
+
+# ---------- Legs ----------
+def legs_from_board(board: pd.DataFrame, min_prob: float = 0.0) -> pd.DataFrame:
+    """Priced rows usable as legs, most likely first."""
+    legs = board[board["Fair_Prob"].notna() & (board["Fair_Prob"] > min_prob)]
+    return legs.sort_values("Fair_Prob", ascending=False, kind="stable")
+
+def _extend(dist: list, p: float) -> list:
+    """Hit-count distribution after adding one independent leg that hits with probability p."""
+    q = 1.0 - p
+    out = [0.0] * (len(dist) + 1)
+    for h, d in enumerate(dist):
+        out[h] += d * q
+        out[h + 1] += d * p
+    return out
+
+def _ev(dist: list, payout: dict) -> float:
+    return sum(dist[h] * mult for h, mult in payout.items() if h < len(dist)) - 1.0
+
+# ---------- Search ----------
+class _Search:
+    """Top-k branch-and-bound over one sorted leg list, shared by every tier searched."""
+
+    def __init__(self, prob, player, team, k: int, min_teams: int, max_per_team: int):
+        self.prob = [float(p) for p in prob]
+        self.player = list(player)
+        self.team = list(team) if team is not None else None
+        self.k = k
+        self.min_teams = min_teams
+        self.max_per_team = max_per_team
+        self.heap = []  # (ev, tier, legs) min-heap of the best k so far
+        self.nodes = 0
+
+    def floor(self) -> float:
+        return self.heap[0][0] if len(self.heap) == self.k else -np.inf
+
+    def bound(self, dist: list, start: int, need: int, payout: dict) -> float:
+        for j in range(start, start + need):
+            dist = _extend(dist, self.prob[j])
+        return _ev(dist, payout)
+
+    def run(self, tier: str, firsts=None):
+        legs, payout = PAYOUTS[tier]
+        if len(self.prob) < legs:
+            return
+        firsts = range(len(self.prob) - legs + 1) if firsts is None else firsts
+        for i in firsts:
+            if i > len(self.prob) - legs:
+                break
+            if self.bound([1.0], i, legs, payout) <= self.floor():
+                break
+            self._dfs(tier, legs, payout, i + 1, [i], _extend([1.0], self.prob[i]))
+
+    def _dfs(self, tier, legs, payout, start, chosen, dist):
+        self.nodes += 1
+        need = legs - len(chosen)
+        if need == 0:
+            if self.team is not None and len({self.team[c] for c in chosen}) < self.min_teams:
+                return
+            ev = _ev(dist, payout)
+            item = (ev, tier, tuple(chosen))
+            if len(self.heap) < self.k:
+                heapq.heappush(self.heap, item)
+            elif ev > self.heap[0][0]:
+                heapq.heapreplace(self.heap, item)
+            return
+
+        players = {self.player[c] for c in chosen}
+        for i in range(start, len(self.prob) - need + 1):
+            # Bounds only shrink as i grows (legs are sorted), so the first miss ends this depth
+            if self.bound(dist, i, need, payout) <= self.floor():
+                break
+            if self.player[i] in players:
+                continue
+            if self.team is not None and sum(self.team[c] == self.team[i] for c in chosen) >= self.max_per_team:
+                continue
+            self._dfs(tier, legs, payout, i + 1, chosen + [i], _extend(dist, self.prob[i]))
+
+# Worker-process state for the pool path (set once per worker by the initializer)
+_WORKER = None
+
+def _init_worker(prob, player, team, k, min_teams, max_per_team):
+    global _WORKER
+    _WORKER = (prob, player, team, k, min_teams, max_per_team)
+
+def _run_shard(tiers, shard: int, shards: int):
+    search = _Search(*_WORKER)
+    for tier in tiers:
+        search.run(tier, firsts=range(shard, len(search.prob), shards))
+    return search.heap, search.nodes
+
+def optimize(board: pd.DataFrame, tiers=tuple(PAYOUTS), top_k: int = TOP_K, max_per_team: int = None,
+             min_teams: int = MIN_TEAMS, workers: int = 1) -> pd.DataFrame:
+    """Top `top_k` entries across `tiers` for a priced board, best EV first."""
+    legs = legs_from_board(board)
+    # A leg with no team on record only counts as its own player's team
+    team = legs["Team"].fillna(legs["Player"]).tolist() if "Team" in legs.columns else None
+    max_per_team = max_per_team or max(PAYOUTS[t][0] for t in tiers)
+    args = (legs["Fair_Prob"].tolist(), legs["Player"].tolist(), team, top_k, min_teams, max_per_team)
+
+    if workers <= 1:
+        search = _Search(*args)
+        for tier in tiers:
+            search.run(tier)
+        found = search.heap
+    else:
+        # Round-robin first legs so every shard gets some of the promising top of the list
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=args) as pool:
+            parts = list(pool.map(_run_shard, [tiers] * workers, range(workers), [workers] * workers))
+        found = heapq.nlargest(top_k, (item for heap, _ in parts for item in heap))
+    return entries_frame(legs, sorted(found, reverse=True))
+
+def entries_frame(legs: pd.DataFrame, found) -> pd.DataFrame:
+    """One row per entry: tier, EV, chance every leg hits, and the picks."""
+    rows = []
+    for ev, tier, chosen in found:
+        picked = legs.iloc[list(chosen)]
+        rows.append({
+            "Tier": tier,
+            "Legs": len(chosen),
+            "EV": ev,
+            "Hit_All": float(np.prod(picked["Fair_Prob"].to_numpy())),
+            "Picks": " | ".join(
+                f"{r.Player} {r.Fair_Side} {r.PrizePicks_Line:g} {str(r.Prop).title()}"
+                for r in picked.itertuples(index=False)
+            ),
+            "Rows": list(picked.index),
+        })
+    return pd.DataFrame(rows, columns=["Tier", "Legs", "EV", "Hit_All", "Picks", "Rows"])
+
+if __name__ == "__main__":
+    import time
+
+    from value_board import VALUE_BOARD
+
+    path = sys.argv[1] if len(sys.argv) > 1 else VALUE_BOARD
+    top_k = int(sys.argv[2]) if len(sys.argv) > 2 else TOP_K
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    board = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    if "Fair_Prob" not in board.columns:
+        from pricing import price
+        board = price(board)
+    t0 = time.perf_counter()
+    best = optimize(board, top_k=top_k, workers=min(workers, os.cpu_count() or 1))
+    print(f"✅ Top {len(best)} entries from {len(legs_from_board(board))} legs in {time.perf_counter() - t0:.2f}s")
+    for r in best.itertuples(index=False):
+        print(f"{r.Tier:>3}  EV {r.EV:+.3f}  all-hit {r.Hit_All:.3f}  {r.Picks}")
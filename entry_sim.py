@@ -0,0 +1,232 @@
+"""Correlation-aware Monte Carlo pricing of PrizePicks entries.
+
+Legs that share a team (or a player) move together: a QB's passing yards
+and his receivers' yards rise and fall with the same game script. Pricing
+such an entry as a product of independent probabilities is wrong.
+Outcomes are sampled through a Gaussian copula: each leg has a latent
+standard normal whose pairwise correlations come from PLAYER_RHO / TEAM_RHO
+(by prop group). A leg hits when its latent falls on the picked side of the
+threshold that reproduces its Fair_Prob. Every leg keeps its no-vig
+probability; only the joint behaviour changes.
+
+One seeded draw produces a shared sims x legs hit matrix. Any number of
+candidate entries are scored against it. For a game-sized leg set, the
+sampled hit patterns are histogrammed once and superset-summed. An entry's
+hit-count distribution then comes from its own <= 64 leg subsets by
+inclusion-exclusion. Wider leg sets count hits with one matrix product per
+block of games.
+
+Usage: python entry_sim.py [board] [sims] [seed]
+"""
+import sys
+from math import comb
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from pricing import PAYOUTS
+
+SIMS = 200_000
+SEED = 7
+BATCH = 1 << 16  # simulated games per block; bounds memory, not results
+PATTERN_MAX_LEGS = 22  # up to here entries are scored from a 2^legs pattern table
+
+# Prop -> group used to pick a correlation
+PROP_GROUPS = {
+    "PASSING YARDS": "pass",
+    "PASS ATTEMPTS": "pass",
+    "PASS COMPLETIONS": "pass",
+    "RUSHING YARDS": "rush",
+    "RUSH ATTEMPTS": "rush",
+    "RECEIVING YARDS": "rec",
+    "RECEPTIONS": "rec",
+    "RECEIVING + RUSH YARDS": "rec",
+    "KICKING POINTS": "kick",
+    "FIELD GOALS": "kick",
+}
+GROUPS = ["pass", "rush", "rec", "kick", "other"]
+
+# Latent correlation between two legs of the same player, by prop group (symmetric)
+PLAYER_RHO = {
+    ("pass", "pass"): 0.7,
+    ("rush", "rush"): 0.7,
+    ("rec", "rec"): 0.7,
+    ("kick", "kick"): 0.7,
+    ("pass", "rush"): 0.1,
+    ("rush", "rec"): 0.3,
+}
+PLAYER_DEFAULT = 0.2
+# ... and between teammates
+TEAM_RHO = {
+    ("pass", "pass"): 0.6,
+    ("pass", "rec"): 0.35,
+    ("pass", "kick"): 0.15,
+    ("rec", "rec"): -0.05,
+    ("rush", "rec"): -0.05,
+    ("pass", "rush"): -0.1,
+    ("rush", "rush"): -0.15,
+    ("rush", "kick"): 0.1,
+    ("rec", "kick"): 0.1,
+}
+TEAM_DEFAULT = 0.0
+
+# ---------- Correlation ----------
+def _rho_table(rules: dict, default: float) -> np.ndarray:
+    table = np.full((len(GROUPS), len(GROUPS)), default)
+    for (a, b), rho in rules.items():
+        i, j = GROUPS.index(a), GROUPS.index(b)
+        table[i, j] = table[j, i] = rho
+    return table
+
+def correlation_matrix(legs: pd.DataFrame) -> np.ndarray:
+    """Latent correlation between every pair of legs (same player, then same team; else 0)."""
+    group = legs["Prop"].str.upper().map(PROP_GROUPS).fillna("other").map(GROUPS.index).to_numpy()
+    player = pd.factorize(legs["Player"])[0]
+    gi, gj = group[:, None], group[None, :]
+    same_player = player[:, None] == player[None, :]
+
+    corr = np.where(same_player, _rho_table(PLAYER_RHO, PLAYER_DEFAULT)[gi, gj], 0.0)
+    if "Team" in legs.columns:
+        team = pd.factorize(legs["Team"])[0]  # unknown team (-1) is nobody's teammate
+        teammates = (team[:, None] == team[None, :]) & (team[:, None] >= 0) & ~same_player
+        corr = np.where(teammates, _rho_table(TEAM_RHO, TEAM_DEFAULT)[gi, gj], corr)
+    np.fill_diagonal(corr, 1.0)
+    return corr
+
+def nearest_correlation(corr: np.ndarray, floor: float = 1e-6) -> np.ndarray:
+    """Clip negative eigenvalues and rescale to a unit diagonal, so Cholesky always succeeds."""
+    vals, vecs = np.linalg.eigh((corr + corr.T) / 2)
+    if vals.min() >= floor:
+        return corr
+    fixed = (vecs * np.maximum(vals, floor)) @ vecs.T
+    d = np.sqrt(np.diag(fixed))
+    return fixed / d[:, None] / d[None, :]
+
+# ---------- Simulation ----------
+class EntrySimulator:
+    def __init__(self, legs: pd.DataFrame, corr: np.ndarray = None, sims: int = SIMS,
+                 seed: int = SEED, batch: int = BATCH):
+        """`legs`: priced rows (Player, Prop, Fair_Side, Fair_Prob, optional Team)."""
+        self.legs = legs
+        self.sims = sims
+        self.seed = seed
+        self.batch = batch
+        prob = legs["Fair_Prob"].to_numpy(dtype=float)
+        self.threshold = np.array([NormalDist().inv_cdf(min(max(p, 1e-9), 1 - 1e-9)) for p in prob])
+
+        # Over legs hit on the high side of their latent: flip them so every hit is latent < threshold
+        corr = correlation_matrix(legs) if corr is None else corr
+        sign = np.where(legs["Fair_Side"].to_numpy() == "Over", -1.0, 1.0)
+        self.chol = np.linalg.cholesky(nearest_correlation(corr * sign[:, None] * sign[None, :]))
+        self.hits = self.sample()
+        self._superset = None
+
+    def sample(self) -> np.ndarray:
+        """sims x legs boolean hit matrix from one seeded stream (same result for any batch size)."""
+        rng = np.random.default_rng(self.seed)
+        n = len(self.threshold)
+        hits = np.empty((self.sims, n), dtype=bool)
+        chol_t = self.chol.T.astype(np.float32)
+        threshold = self.threshold.astype(np.float32)
+        for start in range(0, self.sims, self.batch):
+            stop = min(start + self.batch, self.sims)
+            z = rng.standard_normal((stop - start, n), dtype=np.float32) @ chol_t
+            np.less(z, threshold, out=hits[start:stop])
+        return hits
+
+    def hit_rates(self) -> np.ndarray:
+        """Simulated marginal hit rate per leg (should match Fair_Prob)."""
+        return self.hits.mean(axis=0)
+
+    def evaluate(self, entries, tiers) -> pd.DataFrame:
+        """EV and all-hit rate per entry; `entries` are leg-position tuples, `tiers` one tier or one per entry."""
+        entries = [tuple(int(x) for x in e) for e in entries]
+        tiers = [tiers] * len(entries) if isinstance(tiers, str) else list(tiers)
+        payout = np.zeros((len(entries), 7))  # payout[e, hits], 0..6 hits
+        for e, tier in enumerate(tiers):
+            for hits, mult in PAYOUTS[tier][1].items():
+                payout[e, hits] = mult
+        if len(self.threshold) <= PATTERN_MAX_LEGS:
+            dist = self._count_dist_patterns(entries)
+        else:
+            dist = self._count_dist_blocks(entries)
+        size = np.array([len(e) for e in entries], dtype=np.int64)
+        return pd.DataFrame({
+            "Tier": tiers,
+            "Sim_EV": (dist * payout).sum(axis=1) - 1.0,
+            "Sim_Hit_All": dist[np.arange(len(entries)), size],
+        })
+
+    def _superset_freq(self) -> np.ndarray:
+        """F[mask] = share of games in which every leg in `mask` hit (superset-sum of the pattern histogram)."""
+        if self._superset is None:
+            n = len(self.threshold)
+            packed = np.packbits(self.hits, axis=1, bitorder="little")
+            codes = np.zeros(self.sims, dtype=np.int64)
+            for byte in range(packed.shape[1]):
+                codes |= packed[:, byte].astype(np.int64) << (8 * byte)
+            freq = np.bincount(codes, minlength=1 << n).astype(float) / self.sims
+            for bit in range(n):
+                view = freq.reshape(-1, 2, 1 << bit)
+                view[:, 0, :] += view[:, 1, :]
+            self._superset = freq
+        return self._superset
+
+    def _count_dist_patterns(self, entries) -> np.ndarray:
+        """P(k of an entry's legs hit), k = 0..6, by inclusion-exclusion over each entry's leg subsets."""
+        freq = self._superset_freq()
+        dist = np.zeros((len(entries), 7))
+        by_size = {}
+        for e, legs in enumerate(entries):
+            by_size.setdefault(len(legs), []).append(e)
+        for s, rows in by_size.items():
+            legs = np.array([entries[e] for e in rows], dtype=np.int64)  # (m, s)
+            subset = (np.arange(1 << s)[:, None] >> np.arange(s)) & 1     # (2^s, s)
+            masks = subset @ (np.int64(1) << legs).T                      # (2^s, m)
+            all_of = freq[masks]                                          # P(every leg of U hit)
+            u = subset.sum(axis=1)
+            for k in range(s + 1):
+                # P(exactly k hit) = sum over U with |U| >= k of (-1)^(|U|-k) C(|U|, k) P(all of U hit)
+                coef = np.where(u >= k, (-1.0) ** (u - k) * np.array([comb(int(x), k) for x in u]), 0.0)
+                dist[rows, k] = coef @ all_of
+        return np.clip(dist, 0.0, 1.0)
+
+    def _count_dist_blocks(self, entries) -> np.ndarray:
+        """Same as _count_dist_patterns for wide leg sets: hit counts via one matrix product per block."""
+        m, n = len(entries), len(self.threshold)
+        member = np.zeros((n, m), dtype=np.float32)
+        for e, legs in enumerate(entries):
+            member[list(legs), e] = 1.0
+        dist = np.zeros((m, 7))
+        rows = max(1024, (1 << 24) // max(m, 1))
+        for start in range(0, self.sims, rows):
+            counts = self.hits[start:start + rows].astype(np.float32) @ member  # hits per (game, entry)
+            for k in range(7):
+                dist[:, k] += (counts == k).sum(axis=0)
+        return dist / self.sims
+
+def simulate_entries(board: pd.DataFrame, entries: pd.DataFrame, sims: int = SIMS, seed: int = SEED) -> pd.DataFrame:
+    """entry_optimizer results plus Sim_EV / Sim_Hit_All with same-team and same-player correlation."""
+    if entries.empty:
+        return entries.assign(Sim_EV=pd.Series(dtype=float), Sim_Hit_All=pd.Series(dtype=float))
+    rows = pd.Index(pd.unique(np.concatenate([np.asarray(r) for r in entries["Rows"]])))
+    sim = EntrySimulator(board.loc[rows], sims=sims, seed=seed)
+    scored = sim.evaluate([rows.get_indexer(r) for r in entries["Rows"]], entries["Tier"])
+    return entries.assign(Sim_EV=scored["Sim_EV"].to_numpy(), Sim_Hit_All=scored["Sim_Hit_All"].to_numpy())
+
+if __name__ == "__main__":
+    from entry_optimizer import optimize
+    from value_board import VALUE_BOARD
+
+    path = sys.argv[1] if len(sys.argv) > 1 else VALUE_BOARD
+    sims = int(sys.argv[2]) if len(sys.argv) > 2 else SIMS
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else SEED
+    board = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    if "Fair_Prob" not in board.columns:
+        from pricing import price
+        board = price(board)
+    best = simulate_entries(board, optimize(board), sims=sims, seed=seed)
+    print(f"✅ {len(best)} entries, {sims} simulated games each (seed {seed})")
+    for r in best.itertuples(index=False):
+        print(f"{r.Tier:>3}  EV {r.EV:+.3f} independent / {r.Sim_EV:+.3f} correlated  {r.Picks}")
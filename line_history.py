@@ -0,0 +1,309 @@
+"""Line-movement history across PrizePicks board snapshots.
+
+Append-only store under line_history/: every ingest appends one Parquet
+segment holding only *changes* - a projection_id's line appearing, moving,
+or leaving the board (pp_line = NaN) - keyed by (player_clean, prop_clean),
+projection_id and captured_at. manifest.json lists every ingested pull, so
+re-ingesting is a no-op. Minute-level polling stays small because an
+unchanged line costs nothing.
+
+LineHistory.load() builds an in-memory index: rows sorted by (prop key,
+projection_id, time) in flat NumPy arrays plus a dict from prop key to its
+row range, so a single-prop query is a dict lookup and an array slice.
+
+Usage:
+    python line_history.py ingest            # every pp_nfl_board_*.csv + board_store snapshot
+    python line_history.py movers [N]
+    python line_history.py history "Josh Allen" "Pass Yards"
+"""
+import glob
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from board_store import format_stamp, list_snapshots, parse_stamp, read_snapshot
+from normalize import clean_player, clean_players, clean_prop, clean_props
+
+HISTORY_DIR = Path("line_history")
+MANIFEST = "manifest.json"
+STATE = "state.parquet"  # latest line per projection_id, so an ingest never rereads the segments
+COMPACT_AFTER = 64  # segments; merged into one file beyond this
+
+COLUMNS = ["player_clean", "prop_clean", "projection_id", "captured_at", "pp_line"]
+
+# ---------- Sources ----------
+def board_sources(folder: str = ".") -> list[tuple[pd.Timestamp, str]]:
+    """(captured_at, path) of every saved board: pp_nfl_board_*.csv and board_store snapshots."""
+    found = []
+    for f in glob.glob(str(Path(folder) / "pp_nfl_board_*UTC.csv")):
+        ts = parse_stamp(Path(f).stem[len("pp_nfl_board_"):])
+        if ts is not None:
+            found.append((ts, f))
+    for row in list_snapshots().itertuples():
+        found.append((row.captured_at, str(row.path)))
+    return sorted(found)
+
+def _read_board(path: str) -> pd.DataFrame:
+    df = read_snapshot(path) if str(path).endswith(".parquet") else pd.read_csv(path)
+    if "projection_id" not in df.columns:
+        raise ValueError(f"{path} has no projection_id column")
+    out = pd.DataFrame({
+        "player_clean": clean_players(df["player"]),
+        "prop_clean": clean_props(df["prop"]),
+        "projection_id": pd.to_numeric(df["projection_id"], errors="coerce"),
+        "pp_line": pd.to_numeric(df["pp_line"], errors="coerce"),
+    }).dropna(subset=["projection_id", "pp_line"])
+    out["projection_id"] = out["projection_id"].astype(np.int64)
+    return out.drop_duplicates("projection_id", keep="last")
+
+# ---------- Store ----------
+def _load_manifest(root: Path) -> dict:
+    try:
+        return json.loads((root / MANIFEST).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"pulls": []}
+
+def _segments(root: Path) -> list[Path]:
+    return sorted(root.glob("changes_*.parquet"))
+
+def read_changes(root: Path = HISTORY_DIR) -> pd.DataFrame:
+    segs = _segments(Path(root))
+    if not segs:
+        return pd.DataFrame({c: pd.Series(dtype=t) for c, t in zip(
+            COLUMNS, ["object", "object", "int64", "datetime64[ns, UTC]", "float64"])})
+    changes = pd.concat([pd.read_parquet(s) for s in segs], ignore_index=True)
+    # A compact() interrupted after its replace leaves rows in two segments
+    return changes.drop_duplicates(["projection_id", "captured_at"], keep="last", ignore_index=True)
+
+def _read_state(root: Path) -> pd.DataFrame:
+    """Latest line per projection_id; rebuilt from the segments if state.parquet is missing."""
+    path = root / STATE
+    if path.exists():
+        return pd.read_parquet(path)
+    changes = read_changes(root)
+    return changes.sort_values("captured_at", kind="stable").drop_duplicates("projection_id", keep="last")
+
+def _write_state(root: Path, state: dict, meta: dict):
+    pids = list(state)
+    tmp = root / (STATE + ".tmp")
+    pd.DataFrame({
+        "player_clean": [meta[p][0] for p in pids],
+        "prop_clean": [meta[p][1] for p in pids],
+        "projection_id": np.array(pids, dtype=np.int64),
+        "pp_line": np.array([state[p] for p in pids], dtype=float),
+    }).to_parquet(tmp, index=False)
+    os.replace(tmp, root / STATE)
+
+def ingest(sources=None, root: Path = HISTORY_DIR) -> int:
+    """Append the changes in every not-yet-ingested snapshot, oldest first; returns pulls added."""
+    root = Path(root)
+    sources = board_sources() if sources is None else sources
+    manifest = _load_manifest(root)
+    seen = {p["source"] for p in manifest["pulls"]}
+    head = pd.Timestamp(manifest["pulls"][-1]["captured_at"]) if manifest["pulls"] else None
+
+    todo = []
+    for captured_at, path in sorted(sources, key=lambda s: s[0]):
+        name = Path(path).name
+        if name in seen:
+            continue
+        if head is not None and captured_at <= head:
+            print(f"⚠️ {name} is older than the history head ({head}), skipped (store is append-only)")
+            continue
+        todo.append((captured_at, path, name))
+    if not todo:
+        print("📈 Line history up to date")
+        return 0
+
+    # Last known line per projection_id (NaN = currently off the board)
+    last = _read_state(root)
+    state = dict(zip(last["projection_id"], last["pp_line"]))
+    meta = {pid: (pl, pr) for pid, pl, pr in zip(last["projection_id"], last["player_clean"], last["prop_clean"])}
+
+    rows = []
+    for captured_at, path, name in todo:
+        board = _read_board(path)
+        on_board = set()
+        for pid, player, prop, line in zip(board["projection_id"], board["player_clean"],
+                                           board["prop_clean"], board["pp_line"]):
+            on_board.add(pid)
+            meta[pid] = (player, prop)
+            if state.get(pid) != line:  # new, moved, or back on the board (NaN != line)
+                rows.append((player, prop, pid, captured_at, line))
+                state[pid] = line
+        for pid, line in state.items():
+            if pid not in on_board and not np.isnan(line):
+                rows.append((*meta[pid], pid, captured_at, np.nan))
+                state[pid] = np.nan
+        manifest["pulls"].append({"source": name, "captured_at": captured_at.isoformat()})
+
+    root.mkdir(exist_ok=True)
+    seg = pd.DataFrame(rows, columns=COLUMNS)
+    seg["projection_id"] = seg["projection_id"].astype(np.int64)
+    seg["captured_at"] = pd.to_datetime(seg["captured_at"], utc=True)
+    seg_path = root / f"changes_{format_stamp(todo[-1][0])}.parquet"
+    tmp = seg_path.with_suffix(".tmp")
+    seg.to_parquet(tmp, index=False)
+    os.replace(tmp, seg_path)
+    _write_state(root, state, meta)
+    tmp = root / (MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1))
+    os.replace(tmp, root / MANIFEST)
+    if len(_segments(root)) > COMPACT_AFTER:
+        compact(root)
+    print(f"📈 Ingested {len(todo)} pulls, {len(seg)} line changes → {seg_path}")
+    return len(todo)
+
+def compact(root: Path = HISTORY_DIR) -> Path:
+    """Merge all segments into one (same rows, fewer files).
+
+    The merged file replaces the newest segment before the older ones are
+    removed, so a crash in between only leaves duplicates (dropped on read).
+    """
+    root = Path(root)
+    segs = _segments(root)
+    merged = read_changes(root)
+    out = segs[-1]
+    tmp = out.with_suffix(".tmp")
+    merged.to_parquet(tmp, index=False)
+    os.replace(tmp, out)
+    for s in segs[:-1]:
+        s.unlink()
+    return out
+
+# ---------- Query index ----------
+class LineHistory:
+    def __init__(self, changes: pd.DataFrame, pulls=()):
+        df = changes.sort_values(["player_clean", "prop_clean", "projection_id", "captured_at"], kind="stable")
+        self.ts = df["captured_at"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        self.pid = df["projection_id"].to_numpy(dtype=np.int64)
+        self.line = df["pp_line"].to_numpy(dtype=float)
+        self.pulls = np.sort(np.asarray(pd.to_datetime(list(pulls), utc=True).asi8, dtype=np.int64))
+
+        players = df["player_clean"].to_numpy()
+        props = df["prop_clean"].to_numpy()
+        if len(df):
+            starts = np.flatnonzero(np.r_[True, (players[1:] != players[:-1]) | (props[1:] != props[:-1])])
+            ends = np.r_[starts[1:], len(df)]
+        else:
+            starts = ends = np.array([], dtype=np.int64)
+        self.key_list = [(players[s], props[s]) for s in starts]
+        self.key_code = np.repeat(np.arange(len(starts)), ends - starts)
+        self.keys = {k: (s, e) for k, s, e in zip(self.key_list, starts, ends)}
+
+    @classmethod
+    def load(cls, root: Path = HISTORY_DIR) -> "LineHistory":
+        root = Path(root)
+        pulls = [p["captured_at"] for p in _load_manifest(root)["pulls"]]
+        return cls(read_changes(root), pulls)
+
+    @staticmethod
+    def key(player, prop) -> tuple:
+        return clean_player(player), clean_prop(prop)
+
+    def series(self, player, prop):
+        """(ts_ns, projection_id, line) array views for one prop, by projection_id then time."""
+        s, e = self.keys.get(self.key(player, prop), (0, 0))
+        return self.ts[s:e], self.pid[s:e], self.line[s:e]
+
+    def history(self, player, prop) -> pd.DataFrame:
+        ts, pid, line = self.series(player, prop)
+        order = np.argsort(ts, kind="stable")
+        return pd.DataFrame({
+            "captured_at": pd.DatetimeIndex(ts[order].view("datetime64[ns]")).tz_localize("UTC"),
+            "projection_id": pid[order],
+            "pp_line": line[order],
+        })
+
+    def line_at(self, player, prop, when) -> dict:
+        """{projection_id: line} on the board at `when` (naive times are UTC)."""
+        ts, pid, line = self.series(player, prop)
+        starts, ends = _run_bounds(pid)
+        idx = _last_at_or_before(ts, starts, ends, _utc(when).value)
+        hit = idx >= 0
+        vals = line[idx[hit]]
+        ids = pid[idx[hit]]
+        keep = ~np.isnan(vals)
+        return dict(zip(ids[keep].tolist(), vals[keep].tolist()))
+
+    def trend(self, player, prop, line: float, points: int = 20) -> list:
+        """Recent line values of the projection_id now posted closest to `line` (for sparklines)."""
+        ts, pid, lines = self.series(player, prop)
+        best, best_gap = None, np.inf
+        for s, e in _runs(pid):
+            cur = lines[e - 1]
+            gap = abs(cur - line) if not np.isnan(cur) else np.inf
+            if gap < best_gap:
+                best, best_gap = (s, e), gap
+        if best is None:
+            return []
+        vals = lines[best[0]:best[1]]
+        return vals[~np.isnan(vals)][-points:].tolist()
+
+    def movers(self, since=None, limit: int = 20) -> pd.DataFrame:
+        """Largest absolute line moves per projection_id between `since` (default: previous pull) and now."""
+        if since is None:
+            if len(self.pulls) < 2:
+                return pd.DataFrame(columns=["player_clean", "prop_clean", "projection_id",
+                                             "line_before", "line_now", "delta"])
+            t0 = self.pulls[-2]
+        else:
+            t0 = _utc(since).value
+        # Rows are grouped by projection_id; last row overall vs last row at or before t0
+        run_start, run_end = _run_bounds(self.pid)
+        run_end = run_end - 1
+        now = self.line[run_end]
+        before_idx = _last_at_or_before(self.ts, run_start, run_end + 1, t0)
+        before = np.where(before_idx >= 0, self.line[np.maximum(before_idx, 0)], np.nan)
+        delta = now - before
+        moved = ~np.isnan(delta) & (delta != 0)
+        idx = np.flatnonzero(moved)
+        idx = idx[np.argsort(-np.abs(delta[idx]), kind="stable")][:limit]
+        ends = run_end[idx]
+        keys = [self.key_list[c] for c in self.key_code[ends]]
+        return pd.DataFrame({
+            "player_clean": [k[0] for k in keys],
+            "prop_clean": [k[1] for k in keys],
+            "projection_id": self.pid[ends],
+            "line_before": before[idx],
+            "line_now": now[idx],
+            "delta": delta[idx],
+        })
+
+def _run_bounds(pid: np.ndarray):
+    """start/end (exclusive) arrays of each projection_id run."""
+    if not len(pid):
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    cuts = np.flatnonzero(pid[1:] != pid[:-1]) + 1
+    return np.r_[0, cuts], np.r_[cuts, len(pid)]
+
+def _runs(pid: np.ndarray):
+    """(start, end) of each projection_id run in a key's slice."""
+    return zip(*_run_bounds(pid))
+
+def _last_at_or_before(ts: np.ndarray, starts: np.ndarray, ends: np.ndarray, t: int) -> np.ndarray:
+    """Per run, index of the last row with ts <= t (runs are time-sorted), or -1."""
+    if not len(starts):
+        return np.array([], dtype=np.int64)
+    cum = np.r_[0, np.cumsum(ts <= t)]
+    counts = cum[ends] - cum[starts]
+    return np.where(counts > 0, starts + counts - 1, -1)
+
+def _utc(value) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "ingest"
+    if cmd == "ingest":
+        ingest()
+    elif cmd == "movers":
+        print(LineHistory.load().movers(limit=int(sys.argv[2]) if len(sys.argv) > 2 else 20).to_string(index=False))
+    elif cmd == "history":
+        print(LineHistory.load().history(sys.argv[2], sys.argv[3]).to_string(index=False))
+    else:
+        sys.exit(f"unknown command {cmd!r} (ingest | movers [N] | history PLAYER PROP)")
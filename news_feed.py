@@ -0,0 +1,149 @@
+"""Process-wide news cache for the Sports News page.
+
+One background thread refreshes every feed on a TTL, all feeds
+concurrently, with conditional GET (ETag / Last-Modified) so unchanged
+feeds cost a 304. Pages read the last good merged copy from memory and
+never wait on the network; a failed refresh keeps the previous items.
+Feeds may be URLs or local files (handy for testing).
+
+Usage: python news_feed.py [feed_url_or_path ...]
+"""
+import calendar
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import feedparser
+import requests
+
+FEEDS = ["https://www.cbssports.com/rss/headlines/nfl/"]
+TTL = 5 * 60  # seconds between refreshes
+TIMEOUT = 10  # seconds per request
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+def entry_to_item(entry) -> dict:
+    """Flatten one feedparser entry to what the news cards render."""
+    title = entry.title
+    published = getattr(entry, "published", "")
+    # Remove " +0000" timezone suffix if present
+    published = published.replace(" +0000", "")
+    # Try to find image (media_content, media_thumbnail, or enclosure)
+    img_url = None
+    for attr, key in (("media_content", "url"), ("media_thumbnail", "url"), ("enclosures", "href")):
+        if img_url or not hasattr(entry, attr):
+            continue
+        try:
+            img_url = getattr(entry, attr)[0].get(key)
+        except Exception:
+            pass
+    return {
+        "title": title,
+        "link": entry.link,
+        "published": published,
+        "published_ts": calendar.timegm(entry.published_parsed) if entry.get("published_parsed") else 0.0,
+        "summary": getattr(entry, "summary", "") or title,
+        "img_url": img_url,
+    }
+
+class NewsCache:
+    def __init__(self, feeds=FEEDS, ttl: float = TTL):
+        self.feeds = list(feeds)
+        self.ttl = ttl
+        self.items: list = []
+        self.refreshed_at = None
+        self.errors: dict = {}
+        self._per_feed = {f: {"items": [], "etag": None, "modified": None} for f in self.feeds}
+        self.session = requests.Session()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ---------- Fetch ----------
+    def _fetch(self, feed: str):
+        if not feed.startswith(("http://", "https://")):
+            d = feedparser.parse(feed)  # local file
+            return {"items": [entry_to_item(e) for e in d.entries], "etag": None, "modified": None}
+
+        state = self._per_feed[feed]
+        headers = dict(HEADERS)
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["modified"]:
+            headers["If-Modified-Since"] = state["modified"]
+        resp = self.session.get(feed, headers=headers, timeout=TIMEOUT)
+        if resp.status_code == 304:
+            return None  # unchanged, keep what we have
+        resp.raise_for_status()
+
+        d = feedparser.parse(resp.content)
+        if d.bozo and not d.entries:
+            raise ValueError(f"unparseable feed: {d.get('bozo_exception')}")
+        return {
+            "items": [entry_to_item(e) for e in d.entries],
+            "etag": resp.headers.get("ETag"),
+            "modified": resp.headers.get("Last-Modified"),
+        }
+
+    def refresh(self) -> list:
+        """Fetch all feeds concurrently and swap in the merged, de-duplicated items."""
+        with ThreadPoolExecutor(max_workers=max(len(self.feeds), 1)) as pool:
+            results = list(pool.map(self._safe_fetch, self.feeds))
+
+        errors = {}
+        for feed, (fresh, err) in zip(self.feeds, results):
+            if err is not None:
+                errors[feed] = err
+            elif fresh is not None:
+                self._per_feed[feed] = fresh
+
+        merged, seen = [], set()
+        for feed in self.feeds:
+            for item in self._per_feed[feed]["items"]:
+                if item["link"] not in seen:
+                    seen.add(item["link"])
+                    merged.append(item)
+        if len(self.feeds) > 1:
+            merged.sort(key=lambda it: it["published_ts"], reverse=True)
+
+        with self._lock:
+            self.items = merged
+            self.errors = errors
+            self.refreshed_at = time.time()
+        return merged
+
+    def _safe_fetch(self, feed: str):
+        try:
+            return self._fetch(feed), None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+
+    # ---------- Background refresh ----------
+    def start(self) -> "NewsCache":
+        """Fill the cache once, then keep refreshing it every `ttl` seconds in a daemon thread."""
+        if self._thread is None:
+            self.refresh()
+            self._thread = threading.Thread(target=self._loop, name="news-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def _loop(self):
+        while not self._stop.wait(self.ttl):
+            self.refresh()
+
+    def stop(self):
+        self._stop.set()
+
+    def latest(self, limit: int = 8) -> list:
+        with self._lock:
+            return self.items[:limit]
+
+if __name__ == "__main__":
+    cache = NewsCache(sys.argv[1:] or FEEDS)
+    t0 = time.perf_counter()
+    items = cache.refresh()
+    print(f"📰 {len(items)} items from {len(cache.feeds)} feeds in {time.perf_counter() - t0:.2f}s")
+    for feed, err in cache.errors.items():
+        print(f"⚠️ {feed}: {err}")
+    for it in items[:10]:
+        print(f"- {it['published']}  {it['title']}  ({it['link']})")
@@ -0,0 +1,92 @@
+import pandas as pd
+from functools import lru_cache
+
+# Props the pipeline knows how to price / project
+SUPPORTED_PROPS = {
+    "PASSING YARDS",
+    "PASS ATTEMPTS",
+    "PASS COMPLETIONS",
+    "RUSHING YARDS",
+    "RUSH ATTEMPTS",
+    "RECEIVING YARDS",
+    "RECEPTIONS",
+    "RECEIVING + RUSH YARDS",
+    "KICKING POINTS",
+    "FIELD GOALS",
+}
+
+# Canonical prop names for PrizePicks stat types and sportsbook market keys
+PROP_MAP = {
+    # Passing
+    "PASS YARDS": "PASSING YARDS",
+    "PASSING YARDS": "PASSING YARDS",
+    "PLAYER_PASS_YDS": "PASSING YARDS",
+    "PASS ATT": "PASS ATTEMPTS",
+    "PASS ATTEMPTS": "PASS ATTEMPTS",
+    "PLAYER_PASS_ATTEMPTS": "PASS ATTEMPTS",
+    "PLAYER_PASS_ATT": "PASS ATTEMPTS",
+    "PASS COMP": "PASS COMPLETIONS",
+    "PASS COMPLETIONS": "PASS COMPLETIONS",
+    "PLAYER_PASS_COMPLETIONS": "PASS COMPLETIONS",
+    "PLAYER_PASS_COMP": "PASS COMPLETIONS",
+    # Rushing
+    "RUSH YARDS": "RUSHING YARDS",
+    "RUSHING YARDS": "RUSHING YARDS",
+    "PLAYER_RUSH_YDS": "RUSHING YARDS",
+    "RUSH ATT": "RUSH ATTEMPTS",
+    "RUSH ATTEMPTS": "RUSH ATTEMPTS",
+    "PLAYER_RUSH_ATTEMPTS": "RUSH ATTEMPTS",
+    "PLAYER_RUSH_ATT": "RUSH ATTEMPTS",
+    # Receiving
+    "RECEIVING YARDS": "RECEIVING YARDS",
+    "PLAYER_RECEPTION_YDS": "RECEIVING YARDS",
+    "PLAYER_RECEIV_YDS": "RECEIVING YARDS",
+    "RECEPTIONS": "RECEPTIONS",
+    "PLAYER_RECEPTIONS": "RECEPTIONS",
+    # Combo
+    "RECEIVING + RUSH YARDS": "RECEIVING + RUSH YARDS",
+    "RUSH+REC YDS": "RECEIVING + RUSH YARDS",
+    "PLAYER_RUSH_RECEPTION_YDS": "RECEIVING + RUSH YARDS",
+    # Kicking
+    "KICKING POINTS": "KICKING POINTS",
+    "PLAYER_KICKING_POINTS": "KICKING POINTS",
+    "FIELD GOALS": "FIELD GOALS",
+    "PLAYER_FIELD_GOALS": "FIELD GOALS",
+}
+
+# ---------- Scalar cleaners (cached) ----------
+@lru_cache(maxsize=65536)
+def _clean_player(name: str) -> str:
+    s = (
+        name.upper()
+        .replace(".", "")
+        .replace("-", " ")
+        .replace("'", "")
+        .replace(",", " ")
+    )
+    # collapse multiple spaces
+    return " ".join(s.split())
+
+@lru_cache(maxsize=4096)
+def _clean_prop(raw: str) -> str:
+    n = raw.upper().strip()
+    return PROP_MAP.get(n, n)
+
+def clean_player(name) -> str:
+    return _clean_player(str(name))
+
+def clean_prop(raw) -> str:
+    return _clean_prop(str(raw))
+
+# ---------- Column cleaners ----------
+def _map_unique(values: pd.Series, fn) -> pd.Series:
+    """Apply `fn` once per distinct value and broadcast back through the factor codes."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    cleaned = pd.Index([fn(u) for u in uniques], dtype=object)
+    return pd.Series(cleaned.take(codes), index=values.index, name=values.name)
+
+def clean_players(values: pd.Series) -> pd.Series:
+    return _map_unique(values, clean_player)
+
+def clean_props(values: pd.Series) -> pd.Series:
+    return _map_unique(values, clean_prop)
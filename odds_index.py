@@ -0,0 +1,245 @@
+"""Per-book odds index: every book's Over/Under price at every line.
+
+Sportsbook odds are keyed by (player_clean, prop_clean, Line, Book) and
+stored as two dense float arrays, lines x books, with NaN where a book does
+not quote that side. Keys are sorted like summarize_lines' groups. Every
+question is then a reduction across the book axis:
+
+    most_favored()   min American odds per side (what the matcher uses)
+    best_price()     highest payout per side and the book offering it
+    consensus()      mean no-vig probability across books quoting both sides
+    disagreements()  (line, book) pairs whose no-vig price strays from consensus
+    ladder()         LineLadder of consensus probabilities for off-market lines
+
+The index is built once per odds load in 02_classify_and_merge and saved
+next to the board (nfl_odds_index.parquet) for the app to read.
+
+Usage: python odds_index.py [player]
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pricing import DEFAULT_METHOD, american_to_prob, devig
+
+ODDS_INDEX = "nfl_odds_index.parquet"
+KEYS = ["player_clean", "prop_clean", "Line"]
+DISAGREE_TOL = 0.03  # no-vig probability points from consensus
+LINE_SPAN = 1e6  # ladder codes are spaced wider than any line, so code * span + line sorts like (code, line)
+
+class OddsIndex:
+    def __init__(self, keys: pd.DataFrame, books: list, over: np.ndarray, under: np.ndarray,
+                 integer_odds: bool = False):
+        self.keys = keys.reset_index(drop=True)
+        self.books = list(books)
+        self.over = over
+        self.under = under
+        self.integer_odds = integer_odds
+        self._by_player = None
+
+    # ---------- Build / persist ----------
+    @classmethod
+    def build(cls, odds: pd.DataFrame) -> "OddsIndex":
+        """Index a load_odds() frame (one row per book, side and line)."""
+        label = odds["Label"].astype(str).str.upper().to_numpy()
+        price = odds["Odds"].to_numpy(dtype=float)
+        side = np.select([label == "OVER", label == "UNDER"], [0, 1], default=-1)
+        return cls._from_long(odds, side, price, price, pd.api.types.is_integer_dtype(odds["Odds"]))
+
+    @classmethod
+    def load(cls, path=ODDS_INDEX) -> "OddsIndex":
+        """Rebuild the arrays from a saved index (one row per quoted line and book)."""
+        long = pd.read_parquet(path)
+        over = long["Over_Odds"].to_numpy(dtype=float)
+        under = long["Under_Odds"].to_numpy(dtype=float)
+        return cls._from_long(long, np.full(len(long), 2), over, under,
+                              bool(long.attrs.get("integer_odds", False)))
+
+    @classmethod
+    def _from_long(cls, long, side, over_price, under_price, integer_odds) -> "OddsIndex":
+        """side: 0 = Over row, 1 = Under row, 2 = row carries both prices, -1 = ignore."""
+        groups = long.groupby(KEYS, sort=True)
+        line = groups.ngroup().to_numpy()
+        keys = groups.size().reset_index()[KEYS]
+        if "Player" in long.columns:
+            keys["Player"] = groups["Player"].first().to_numpy()
+        book, books = pd.factorize(long["Book"], sort=True)
+
+        shape = (len(keys), len(books))
+        over = np.full(shape, np.nan)
+        under = np.full(shape, np.nan)
+        # Repeated quotes from one book keep its most favored (min) price
+        keyed = line >= 0
+        o = keyed & ((side == 0) | (side == 2))
+        u = keyed & ((side == 1) | (side == 2))
+        np.fmin.at(over, (line[o], book[o]), over_price[o])
+        np.fmin.at(under, (line[u], book[u]), under_price[u])
+        return cls(keys, books, over, under, integer_odds)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long form: one row per (line, book) quoting at least one side."""
+        line, book = np.nonzero(~(np.isnan(self.over) & np.isnan(self.under)))
+        long = self.keys.iloc[line].reset_index(drop=True)
+        long["Book"] = np.asarray(self.books, dtype=object)[book]
+        long["Over_Odds"] = self.over[line, book]
+        long["Under_Odds"] = self.under[line, book]
+        return long
+
+    def save(self, path=ODDS_INDEX) -> Path:
+        path = Path(path)
+        long = self.to_frame()
+        long.attrs["integer_odds"] = self.integer_odds
+        tmp = path.with_suffix(".tmp")
+        long.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        return path
+
+    # ---------- Queries ----------
+    def most_favored(self) -> pd.DataFrame:
+        """summarize_lines' frame: min Over/Under odds per line and which side is favored."""
+        over = _nanreduce(np.fmin, self.over)
+        under = _nanreduce(np.fmin, self.under)
+        out = self.keys[KEYS].copy()
+        out["Over_Odds"] = over
+        out["Under_Odds"] = under
+        out["Over_Favored"] = over < under
+        out["Under_Favored"] = under < over
+        if self.integer_odds:
+            out["Over_Odds"] = out["Over_Odds"].astype("Int64")
+            out["Under_Odds"] = out["Under_Odds"].astype("Int64")
+        return out
+
+    def best_price(self) -> pd.DataFrame:
+        """Highest-paying American odds per side and the book quoting it."""
+        out = pd.DataFrame(index=self.keys.index)
+        names = np.asarray(self.books + [""], dtype=object)
+        for side, prices in (("Over", self.over), ("Under", self.under)):
+            quoted = ~np.isnan(prices).all(axis=1)
+            col = np.where(quoted, np.argmax(np.where(np.isnan(prices), -np.inf, prices), axis=1), len(self.books))
+            out[f"Best_{side}"] = _nanreduce(np.fmax, prices)
+            out[f"Best_{side}_Book"] = names[col]
+        return out
+
+    def fair(self, method: str = DEFAULT_METHOD):
+        """(fair_over, fair_under) per line and book; NaN unless the book quotes both sides."""
+        return devig(american_to_prob(self.over), american_to_prob(self.under), method)
+
+    def consensus(self, method: str = DEFAULT_METHOD) -> pd.DataFrame:
+        """Mean no-vig probability across the books quoting both sides, and its spread."""
+        fair_over, _ = self.fair(method)
+        both = ~np.isnan(fair_over)
+        n = both.sum(axis=1)
+        with np.errstate(invalid="ignore"):
+            mean = np.where(both, fair_over, 0.0).sum(axis=1) / n
+        spread = _nanreduce(np.fmax, fair_over) - _nanreduce(np.fmin, fair_over)
+        return pd.DataFrame({
+            "Books": n,
+            "Consensus_Over": mean,
+            "Consensus_Under": 1.0 - mean,
+            "Spread": spread,
+        }, index=self.keys.index)
+
+    def summary(self, method: str = DEFAULT_METHOD) -> pd.DataFrame:
+        """most_favored() plus best price and consensus columns, one row per line."""
+        return pd.concat([self.most_favored(), self.best_price(), self.consensus(method)], axis=1)
+
+    def disagreements(self, tol: float = DISAGREE_TOL, method: str = DEFAULT_METHOD) -> pd.DataFrame:
+        """Books whose no-vig Over probability is more than `tol` from the line's consensus."""
+        fair_over, _ = self.fair(method)
+        mean = self.consensus(method)["Consensus_Over"].to_numpy()
+        dev = fair_over - mean[:, None]
+        line, book = np.nonzero(np.abs(np.nan_to_num(dev)) > tol)
+        out = self.keys.iloc[line].reset_index(drop=True)
+        out["Book"] = np.asarray(self.books, dtype=object)[book]
+        out["Over_Odds"] = self.over[line, book]
+        out["Under_Odds"] = self.under[line, book]
+        out["Fair_Over"] = fair_over[line, book]
+        out["Consensus_Over"] = mean[line]
+        out["Deviation"] = dev[line, book]
+        return out.sort_values("Deviation", key=np.abs, ascending=False, kind="stable").reset_index(drop=True)
+
+    def player_lines(self, player_clean: str) -> pd.DataFrame:
+        """Every book's price on every line of one player (player_clean id), long form."""
+        if self._by_player is None:
+            self._by_player = self.keys.groupby("player_clean", sort=False).indices
+        rows = self._by_player.get(player_clean)
+        if rows is None:
+            return self.to_frame().iloc[:0]
+        sub = OddsIndex(self.keys.iloc[rows], self.books, self.over[rows], self.under[rows], self.integer_odds)
+        return sub.to_frame()
+
+    def ladder(self, method: str = DEFAULT_METHOD) -> "LineLadder":
+        """Every line's consensus no-vig Over probability, searchable per (player, prop)."""
+        return LineLadder.build(self.keys, self.consensus(method)["Consensus_Over"].to_numpy())
+
+class LineLadder:
+    """Alt-line ladders: sorted book lines per (player, prop) and their fair Over probability.
+
+    All ladders share one flat array ordered by (player, prop) then line, so a
+    whole board is bracketed by a single searchsorted. A PrizePicks line gets
+    the probability of an identical book line, or one linearly interpolated
+    between the two book lines around it; lines outside the ladder get NaN.
+    """
+
+    def __init__(self, pairs: pd.MultiIndex, code: np.ndarray, line: np.ndarray, prob: np.ndarray):
+        self.pairs = pairs
+        self.code = code
+        self.line = line
+        self.prob = prob
+        self._flat = code * LINE_SPAN + line
+
+    @classmethod
+    def build(cls, keys: pd.DataFrame, prob: np.ndarray) -> "LineLadder":
+        """`keys` sorted by (player_clean, prop_clean, Line), as OddsIndex.keys is."""
+        keep = ~np.isnan(prob)
+        keys = keys[keep]
+        code, pairs = pd.factorize(pd.MultiIndex.from_frame(keys[["player_clean", "prop_clean"]]))
+        return cls(pairs, code.astype(float), keys["Line"].to_numpy(dtype=float), prob[keep])
+
+    def lookup(self, player_clean, prop_clean, line):
+        """(prob, low_line, high_line) per query row; low == high for an exact book line."""
+        line = np.asarray(line, dtype=float)
+        nan = np.full(len(line), np.nan)
+        if not len(self.line) or not len(line):
+            return nan, nan.copy(), nan.copy()
+        g = self.pairs.get_indexer(pd.MultiIndex.from_arrays([np.asarray(player_clean), np.asarray(prop_clean)]))
+        q = g * LINE_SPAN + line
+
+        pos = np.searchsorted(self._flat, q)
+        hi = np.minimum(pos, len(self._flat) - 1)
+        lo = np.maximum(pos - 1, 0)
+        known = (g >= 0) & ~np.isnan(line)
+        exact = known & (self._flat[hi] == q)
+        inside = known & ~exact & (pos > 0) & (pos < len(self._flat)) & (self.code[lo] == g) & (self.code[hi] == g)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            w = (line - self.line[lo]) / (self.line[hi] - self.line[lo])
+            between = self.prob[lo] + w * (self.prob[hi] - self.prob[lo])
+        prob = np.where(exact, self.prob[hi], np.where(inside, between, nan))
+        low = np.where(exact, self.line[hi], np.where(inside, self.line[lo], nan))
+        high = np.where(exact | inside, self.line[hi], nan)
+        return prob, low, high
+
+def _nanreduce(ufunc, a: np.ndarray) -> np.ndarray:
+    """Row-wise fmin/fmax that stays NaN for all-NaN rows (and for zero books)."""
+    if a.shape[1] == 0:
+        return np.full(a.shape[0], np.nan)
+    return ufunc.reduce(a, axis=1)
+
+if __name__ == "__main__":
+    from player_index import PlayerIndex, canonical_name
+    from stage_loader import load_stage
+
+    if os.path.exists(ODDS_INDEX):
+        index = OddsIndex.load()
+    else:
+        odds = load_stage("02_classify_and_merge.py").load_odds(".")
+        index = OddsIndex.build(odds.assign(player_clean=PlayerIndex.build(odds["Player"]).resolve(odds["Player"])))
+    print(f"✅ {len(index.keys)} lines x {len(index.books)} books: {', '.join(index.books)}")
+    if len(sys.argv) > 1:
+        print(index.player_lines(canonical_name(sys.argv[1])).to_string(index=False))
+    else:
+        print(index.disagreements().head(15).to_string(index=False))
@@ -0,0 +1,86 @@
+"""Archive of raw /projections responses and offline board replay.
+
+Every captured payload is kept gzip-compressed as
+    raw_payloads/date=YYYY-MM-DD/projections_<YYYY-MM-DD_HHMMSS[.ffffff]UTC>.json.gz
+(board_store's stamp, so a replayed board keeps its original name) so boards
+can be rebuilt after a parser/cleaner fix without a browser:
+    python 01_pull_prizepicks_nfl.py --replay [files or dirs] [--store parquet]
+"""
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from board_store import format_stamp, parse_stamp
+
+ARCHIVE_DIR = Path("raw_payloads")
+
+def payload_path(captured_at: datetime, root: Path = ARCHIVE_DIR) -> Path:
+    stamp = format_stamp(captured_at)
+    return Path(root) / f"date={captured_at:%Y-%m-%d}" / f"projections_{stamp}.json.gz"
+
+def archive_payload(raw, captured_at: Optional[datetime] = None, root: Path = ARCHIVE_DIR) -> Path:
+    """Write the raw response body (str or bytes) gzip-compressed; returns the file path."""
+    if captured_at is None:
+        captured_at = datetime.now(timezone.utc)
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    path = payload_path(captured_at, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with gzip.open(tmp, "wb", compresslevel=6) as f:
+        f.write(raw)
+    os.replace(tmp, path)
+    return path
+
+def read_payload(path) -> bytes:
+    with gzip.open(path, "rb") as f:
+        return f.read()
+
+def captured_at_of(path) -> datetime:
+    """Capture time encoded in an archived payload's file name."""
+    stem = Path(path).name[len("projections_"):-len(".json.gz")]
+    ts = parse_stamp(stem)
+    if ts is None:
+        raise ValueError(f"Not an archived payload name: {path}")
+    return ts.to_pydatetime()
+
+def list_payloads(sources) -> list[Path]:
+    """Expand files and directories into archived payload paths, oldest first."""
+    found = []
+    for src in sources:
+        src = Path(src)
+        if src.is_dir():
+            found.extend(src.rglob("projections_*.json.gz"))
+        elif src.exists():
+            found.append(src)
+    return sorted(set(found), key=captured_at_of)
+
+# ---------- Replay ----------
+def replay_one(path, store: str = "csv", out_dir: str = ".") -> tuple[str, int, str]:
+    """Re-parse one archived payload into a board stamped with its original capture time."""
+    from board_parser import parse_projections
+    from board_store import save_board
+
+    board = parse_projections(read_payload(path))
+    if board.empty:
+        return str(path), 0, ""
+    out = save_board(board, store=store, captured_at=captured_at_of(path), out_dir=Path(out_dir))
+    return str(path), len(board), str(out)
+
+def replay(sources, store: str = "csv", out_dir: str = ".", workers: Optional[int] = None) -> list:
+    """Rebuild boards for every archived payload under `sources`, in parallel processes."""
+    paths = list_payloads(sources)
+    if not paths:
+        print("❌ No archived payloads found to replay.")
+        return []
+    print(f"🔁 Replaying {len(paths)} payload(s)...")
+    if len(paths) == 1 or workers == 1:
+        results = [replay_one(p, store, out_dir) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(replay_one, paths, [store] * len(paths), [out_dir] * len(paths)))
+    print(f"✅ Rebuilt {sum(1 for _, n, _ in results if n)} board(s), {sum(n for _, n, _ in results)} lines")
+    return results
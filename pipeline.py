@@ -0,0 +1,188 @@
+"""Run the NFL pipeline as a DAG of cached stages.
+
+    pull ──────────┬─> history ───────────────────┐
+                   ├─> classify ──┐               │
+    (odds CSVs) ───┘              ├─> merge ──> value_board ──> entries
+    scrape ───────────────────────┘
+
+Each stage declares its input and output files. Before running, a stage's
+inputs (plus its own script) are content-hashed; if the fingerprint matches
+the last successful run and the outputs still exist, the stage is skipped.
+Stages with no pending dependencies run concurrently.
+
+Source stages (pull, scrape) have no file inputs, so they only run when their
+output is missing or when forced:  python pipeline.py --force pull
+
+03_match_projections.py is not a stage. It is the alternative to merge for
+hand-dropped projection CSVs in ./projections (and what board_delta runs),
+and it writes the same nfl_regular_with_proj.csv, so the two cannot share a
+DAG. Run it by hand in place of merge, then: python pipeline.py
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from stage_loader import ROOT
+
+CACHE_FILE = ROOT / ".pipeline_cache.json"
+
+def _latest_board() -> list[str]:
+    files = glob.glob(str(ROOT / "pp_nfl_board_*.csv"))
+    files += glob.glob(str(ROOT / "board_store" / "date=*" / "board_*.parquet"))
+    return [max(files, key=os.path.getctime)] if files else []
+
+def _odds_files() -> list[str]:
+    return sorted(glob.glob(str(ROOT / "NFL - *.csv")))
+
+def _files(*names: str) -> Callable[[], list[str]]:
+    return lambda: [str(ROOT / n) for n in names]
+
+@dataclass
+class Stage:
+    name: str
+    script: str
+    deps: list[str] = field(default_factory=list)
+    inputs: Callable[[], list[str]] = lambda: []
+    outputs: Callable[[], list[str]] = lambda: []
+
+STAGES = [
+    Stage("pull", "01_pull_prizepicks_nfl.py", outputs=_latest_board),
+    Stage("scrape", "03_scrape_projections.py",
+          outputs=_files("fantasypros_week1_projections_clean.csv")),
+    Stage("classify", "02_classify_and_merge.py", deps=["pull"],
+          inputs=lambda: _latest_board() + _odds_files() + _files(
+              "normalize.py", "player_index.py", "pricing.py", "odds_index.py", "board_schema.py")(),
+          outputs=_files("nfl_regular.csv", "nfl_odds_index.parquet")),
+    Stage("merge", "04_nfl_merge.py", deps=["classify", "scrape"],
+          inputs=_files("nfl_regular.csv", "fantasypros_week1_projections_clean.csv",
+                        "normalize.py", "player_index.py", "board_schema.py"),
+          outputs=_files("nfl_regular_with_proj.csv")),
+    Stage("history", "line_history.py", deps=["pull"],
+          inputs=_latest_board,
+          outputs=_files("line_history/manifest.json")),
+    Stage("value_board", "value_board.py", deps=["merge", "history"],
+          inputs=_files("nfl_regular_with_proj.csv", "value_rules.json", "value_rules.py",
+                        "normalize.py", "pricing.py", "line_history/manifest.json"),
+          outputs=_files("nfl_value_board.parquet")),
+    Stage("entries", "best_entries.py", deps=["value_board"],
+          inputs=_files("nfl_value_board.parquet", "entry_optimizer.py", "entry_sim.py", "pricing.py"),
+          outputs=_files("nfl_best_entries.parquet")),
+]
+
+# ---------- Fingerprints ----------
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def fingerprint(stage: Stage) -> str:
+    """Hash of the stage script plus the name and content of every input file."""
+    h = hashlib.sha256()
+    for path in [str(ROOT / stage.script)] + sorted(stage.inputs()):
+        h.update(os.path.basename(path).encode())
+        # A not-yet-built input (dry run) still gets a stable, distinct fingerprint
+        h.update((file_digest(path) if os.path.exists(path) else "missing").encode())
+    return h.hexdigest()
+
+def load_cache(path: Path = CACHE_FILE) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_cache(cache: dict, path: Path = CACHE_FILE):
+    Path(path).write_text(json.dumps(cache, indent=2))
+
+# ---------- Runner ----------
+def run_stage(stage: Stage) -> None:
+    print(f"▶️  {stage.name}: python {stage.script}")
+    subprocess.run([sys.executable, stage.script], cwd=ROOT, check=True)
+
+def needs_run(stage: Stage, cache: dict, force: set) -> tuple[bool, str]:
+    if stage.name in force:
+        return True, "forced"
+    outputs = stage.outputs()
+    if not outputs or not all(os.path.exists(p) for p in outputs):
+        return True, "output missing"
+    if not stage.deps and not stage.inputs():
+        return False, "source output present"
+    fp = fingerprint(stage)
+    if cache.get(stage.name) != fp:
+        return True, "inputs changed"
+    return False, "inputs unchanged"
+
+def run(stages=STAGES, force=(), dry_run: bool = False, runner=run_stage, cache_file: Path = CACHE_FILE) -> dict:
+    """Run the DAG; returns {stage name: 'ran' | 'skipped' | 'failed' | 'blocked'}.
+
+    A dry run reports 'would_run' for stages it would have run (their
+    dependents are then planned as if those stages had run).
+    """
+    by_name = {s.name: s for s in stages}
+    force = set(force)
+    cache = load_cache(cache_file)
+    status: dict[str, str] = {}
+    pending = dict(by_name)
+    running = {}
+
+    def ready(s: Stage) -> bool:
+        return all(status.get(d) in ("ran", "skipped", "would_run") for d in s.deps)
+
+    def blocked(s: Stage) -> bool:
+        return any(status.get(d) in ("failed", "blocked") for d in s.deps)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(stages))) as pool:
+        while pending or running:
+            for name, s in list(pending.items()):
+                if blocked(s):
+                    status[name] = "blocked"
+                    del pending[name]
+                elif ready(s):
+                    del pending[name]
+                    go, why = needs_run(s, cache, force)
+                    if not go or dry_run:
+                        status[name] = "skipped" if not go else "would_run"
+                        print(f"{'⏭️ ' if not go else '📝'} {name}: {why}{' (dry run)' if dry_run and go else ''}")
+                        continue
+                    print(f"🔄 {name}: {why}")
+                    running[pool.submit(runner, s)] = s
+            if not running:
+                if pending and not any(ready(s) or blocked(s) for s in pending.values()):
+                    raise ValueError(f"Unresolvable stage dependencies: {sorted(pending)}")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                s = running.pop(fut)
+                try:
+                    fut.result()
+                except Exception as e:
+                    status[s.name] = "failed"
+                    print(f"❌ {s.name} failed: {e}")
+                    continue
+                status[s.name] = "ran"
+                if s.deps or s.inputs():
+                    cache[s.name] = fingerprint(s)
+                save_cache(cache, cache_file)
+
+    return status
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the NFL pipeline, skipping stages whose inputs are unchanged.")
+    parser.add_argument("--force", nargs="*", default=[], choices=[s.name for s in STAGES],
+                        help="stages to run even if cached")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would run")
+    args = parser.parse_args()
+    result = run(force=args.force, dry_run=args.dry_run)
+    print("Summary: " + ", ".join(f"{k}={v}" for k, v in result.items()))
+    if "failed" in result.values():
+        sys.exit(1)
@@ -0,0 +1,128 @@
+"""Player identity index: canonical ids plus an alias table for O(1) name joins.
+
+Canonical id = cleaned name (normalize.clean_player) with a trailing
+generational suffix ("SR", "JR", "II", ...) and a trailing NFL team code
+("JALEN HURTS PHI") removed. The alias table maps the canonical form, the raw
+cleaned form and the first/last flip ("BROWN AJ") of every reference name to
+its id; lookups try the query's cleaned and stripped forms in order.
+
+Indexes built from a file are persisted under .player_index/ keyed by the
+file's content hash, so they are built once per projections file.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from normalize import clean_player
+
+INDEX_DIR = Path(".player_index")
+INDEX_VERSION = 1
+
+SUFFIXES = {"JR", "SR", "II", "III", "IV", "V"}
+NFL_TEAMS = {
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB",
+    "HOU", "IND", "JAC", "JAX", "KC", "LA", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO",
+    "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS", "WSH",
+}
+
+def canonical_name(name) -> str:
+    """Cleaned name without a trailing team code or generational suffix."""
+    parts = clean_player(name).split()
+    if len(parts) > 2 and parts[-1] in NFL_TEAMS:
+        parts = parts[:-1]
+    if len(parts) > 2 and parts[-1] in SUFFIXES:
+        parts = parts[:-1]
+    return " ".join(parts)
+
+def flip(name: str) -> str:
+    """'AJ BROWN' <-> 'BROWN AJ' (first token moved to the end)."""
+    parts = name.split()
+    return " ".join(parts[1:] + parts[:1]) if len(parts) >= 2 else name
+
+def lookup_keys(name) -> list[str]:
+    cleaned = clean_player(name)
+    canon = canonical_name(name)
+    return [cleaned, canon] if canon != cleaned else [cleaned]
+
+class PlayerIndex:
+    def __init__(self, aliases: dict, ids: list, build_seconds: float = 0.0):
+        self.aliases = aliases
+        self.ids = ids
+        self.build_seconds = build_seconds
+
+    @classmethod
+    def build(cls, names) -> "PlayerIndex":
+        """Index the distinct names of a reference source (e.g. a projections file)."""
+        t0 = time.perf_counter()
+        uniques = pd.Series(names).dropna().unique()
+        pairs = [(clean_player(n), canonical_name(n)) for n in uniques]
+
+        # Priority: canonical form, then raw cleaned form, then first/last flips
+        aliases = {}
+        for _, canon in pairs:
+            aliases.setdefault(canon, canon)
+        for cleaned, canon in pairs:
+            aliases.setdefault(cleaned, canon)
+        for cleaned, canon in pairs:
+            aliases.setdefault(flip(canon), canon)
+            aliases.setdefault(flip(cleaned), canon)
+
+        ids = sorted({canon for _, canon in pairs})
+        return cls(aliases, ids, time.perf_counter() - t0)
+
+    @classmethod
+    def for_file(cls, path, name_column: str, index_dir: Path = INDEX_DIR) -> "PlayerIndex":
+        """Index built from `name_column` of a CSV, cached on disk by the file's content hash."""
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+        cache = Path(index_dir) / f"{Path(path).stem}_{name_column}_{digest}.json"
+        if cache.exists():
+            data = json.loads(cache.read_text())
+            if data.get("version") == INDEX_VERSION:
+                return cls(data["aliases"], data["ids"], data["build_seconds"])
+
+        idx = cls.build(pd.read_csv(path, usecols=[name_column])[name_column])
+        cache.parent.mkdir(exist_ok=True)
+        cache.write_text(json.dumps({
+            "version": INDEX_VERSION,
+            "source": str(path),
+            "build_seconds": idx.build_seconds,
+            "ids": idx.ids,
+            "aliases": idx.aliases,
+        }))
+        return idx
+
+    def lookup(self, name) -> Optional[str]:
+        for key in lookup_keys(name):
+            pid = self.aliases.get(key)
+            if pid is not None:
+                return pid
+        return None
+
+    def resolve(self, names: pd.Series) -> pd.Series:
+        """Canonical id per name (None when unknown); each distinct name is looked up once."""
+        codes, uniques = pd.factorize(names)
+        # Trailing None so NaN names (code -1) resolve to None too
+        ids = pd.Index([self.lookup(u) for u in uniques] + [None], dtype=object)
+        return pd.Series(ids.take(codes), index=names.index, name="player_id")
+
+    def report(self, resolved: pd.Series, label: str = "players") -> dict:
+        """Match-rate and build-time metrics for one resolve() result."""
+        total = int(resolved.size)
+        matched = int(resolved.notna().sum())
+        stats = {
+            "label": label,
+            "matched": matched,
+            "total": total,
+            "match_rate": matched / total if total else 0.0,
+            "index_ids": len(self.ids),
+            "index_aliases": len(self.aliases),
+            "build_ms": round(self.build_seconds * 1000, 2),
+        }
+        print(f"🪪 {label}: matched {matched}/{total} ({stats['match_rate']:.1%}) "
+              f"against {stats['index_ids']} ids / {stats['index_aliases']} aliases, "
+              f"index build {stats['build_ms']} ms")
+        return stats
@@ -0,0 +1,84 @@
+"""Trigram index for the Player Search box.
+
+Narrows the player universe to a small candidate set (shared trigrams, or
+token prefixes for 1-2 character queries) before any edit-distance scoring,
+so each keystroke scores a few dozen names instead of every player.
+
+Candidates are an approximation: WRatio also rewards fuzzy in-word matches
+that share no trigram with the query. Lists up to FULL_SCAN_MAX players are
+therefore still scored in full, which is exactly the old behaviour. A daily
+board has ~165 searchable players: a full scan there costs 0.5 ms p50 / 1 ms
+p99 per keystroke, while the narrowed top 5 agrees with it on only 91% of
+typed prefixes, so the index only takes over for season-sized lists (1000
+players: 3.2 -> 0.3 ms p50; benchmarks/bench_player_search.py).
+"""
+from bisect import bisect_left
+from collections import Counter
+
+from thefuzz import process, utils
+
+MAX_CANDIDATES = 64
+FULL_SCAN_MAX = 500
+MIN_SCORE = 60  # same threshold the page has always used
+LIMIT = 5
+
+def normalize(name: str) -> str:
+    """The same processing thefuzz applies before scoring (punctuation -> spaces, lowercase)."""
+    return " ".join(utils.full_process(str(name)).split())
+
+def trigrams(text: str) -> set:
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class PlayerSearchIndex:
+    def __init__(self, players):
+        self.players = list(players)
+        self._exact = {}
+        self._postings: dict[str, list[int]] = {}
+        tokens = []
+        for i, p in enumerate(self.players):
+            norm = normalize(p)
+            self._exact.setdefault(str(p).strip().lower(), p)
+            for g in trigrams(norm):
+                self._postings.setdefault(g, []).append(i)
+            tokens.extend((tok, i) for tok in norm.split())
+        # Sorted (token, player) pairs for prefix lookups on very short queries
+        tokens.sort()
+        self._tokens = [t for t, _ in tokens]
+        self._token_ids = [i for _, i in tokens]
+
+    def exact(self, query: str):
+        """Case-insensitive exact match, or None."""
+        return self._exact.get(query.strip().lower())
+
+    def candidates(self, query: str, limit: int = MAX_CANDIDATES) -> list:
+        norm = normalize(query)
+        if not norm:
+            return []
+        if len(norm.replace(" ", "")) < 3:
+            # Too short for trigrams: players with a name token starting with the query
+            prefix = norm.split()[-1]
+            lo = bisect_left(self._tokens, prefix)
+            hits = []
+            for tok, i in zip(self._tokens[lo:], self._token_ids[lo:]):
+                if not tok.startswith(prefix) or len(hits) >= limit:
+                    break
+                hits.append(i)
+            return [self.players[i] for i in sorted(set(hits))]
+
+        counts = Counter()
+        for g in trigrams(norm):
+            counts.update(self._postings.get(g, ()))
+        # Back in list order so score ties break exactly as process.extract does over the full list
+        return [self.players[i] for i in sorted(i for i, _ in counts.most_common(limit))]
+
+    def search(self, query: str, limit: int = LIMIT, min_score: int = MIN_SCORE) -> list:
+        """Top `limit` fuzzy matches scoring above `min_score` (thefuzz WRatio), best first."""
+        cands = self.players if len(self.players) <= FULL_SCAN_MAX else self.candidates(query)
+        if not cands:
+            return []
+        matches = process.extract(query, cands, limit=limit)
+        return [m[0] for m in matches if m[1] > min_score]
@@ -0,0 +1,147 @@
+"""No-vig fair probabilities and PrizePicks entry EV, vectorized over a board.
+
+American Over/Under odds become implied probabilities, and the book's
+margin (vig) is removed with one of three methods:
+
+    multiplicative  p / (p_over + p_under)
+    additive        p - (p_over + p_under - 1) / 2
+    power           p ** k, with k solved so both sides sum to 1
+
+The pick side is the side with the higher fair probability. EV_<tier> is the
+expected return per unit staked on a PrizePicks entry of that tier, made
+of legs as likely as this one. Rows missing either side's odds get NaN,
+unless they carry a Ladder_Over probability from the alt-line ladder.
+
+Usage: python pricing.py [csv] [multiplicative|additive|power]
+"""
+import sys
+from math import comb
+
+import numpy as np
+import pandas as pd
+
+METHODS = ("multiplicative", "additive", "power")
+DEFAULT_METHOD = "power"
+
+# tier -> (legs, {hits: payout multiplier})
+PAYOUTS = {
+    "2P": (2, {2: 3.0}),
+    "3P": (3, {3: 6.0}),
+    "4P": (4, {4: 10.0}),
+    "5P": (5, {5: 20.0}),
+    "6P": (6, {6: 37.5}),
+    "3F": (3, {3: 3.0, 2: 1.0}),
+    "4F": (4, {4: 6.0, 3: 1.5}),
+    "5F": (5, {5: 10.0, 4: 2.0, 3: 0.4}),
+    "6F": (6, {6: 25.0, 5: 2.0, 4: 0.4}),
+}
+PRICE_COLUMNS = ["Fair_Over", "Fair_Under", "Vig", "Fair_Side", "Fair_Prob",
+                 *(f"EV_{t}" for t in PAYOUTS), "EV", "EV_Tier"]
+
+# ---------- Odds ----------
+def american_to_prob(odds) -> np.ndarray:
+    """Implied probability of American odds; NaN for missing or invalid (|odds| < 100) prices."""
+    o = np.asarray(odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = np.where(o < 0, -o / (100.0 - o), 100.0 / (o + 100.0))
+    return np.where(np.abs(o) >= 100, p, np.nan)
+
+def prob_to_american(p) -> np.ndarray:
+    """American odds whose implied probability is p (no vig); NaN outside (0, 1)."""
+    p = np.asarray(p, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        odds = np.where(p >= 0.5, -100.0 * p / (1.0 - p), 100.0 * (1.0 - p) / p)
+    return np.where((p > 0) & (p < 1), odds, np.nan)
+
+def devig(p_over, p_under, method: str = DEFAULT_METHOD):
+    """(fair_over, fair_under) with the margin removed; each pair sums to 1."""
+    a = np.asarray(p_over, dtype=float)
+    b = np.asarray(p_under, dtype=float)
+    if method == "multiplicative":
+        total = a + b
+        return a / total, b / total
+    if method == "additive":
+        half = (a + b - 1.0) / 2.0
+        fa = np.clip(a - half, 0.0, 1.0)
+        return fa, 1.0 - fa
+    if method == "power":
+        k = _power_exponent(a, b)
+        fa = a ** k
+        return fa, 1.0 - fa
+    raise ValueError(f"Unknown de-vig method {method!r}; expected one of {METHODS}")
+
+def _power_exponent(a: np.ndarray, b: np.ndarray, iters: int = 30, tol: float = 1e-12) -> np.ndarray:
+    """k with a**k + b**k == 1, by Newton's method from k=1 (f is convex and decreasing)."""
+    k = np.ones_like(a)
+    la, lb = np.log(a), np.log(b)
+    live = np.isfinite(la) & np.isfinite(lb)
+    for _ in range(iters):
+        ak, bk = np.exp(k * la), np.exp(k * lb)
+        f = ak + bk - 1.0
+        step = np.where(live, f / (ak * la + bk * lb), 0.0)
+        k = k - step
+        if not np.any(np.abs(step) > tol):
+            break
+    return np.where(live, k, np.nan)
+
+# ---------- Entry EV ----------
+def entry_ev(p, legs: int, payout: dict) -> np.ndarray:
+    """Expected return per unit staked on a `legs`-pick entry whose legs each hit with probability p."""
+    p = np.asarray(p, dtype=float)
+    q = 1.0 - p
+    ret = np.zeros_like(p)
+    for hits, mult in payout.items():
+        ret += comb(legs, hits) * p ** hits * q ** (legs - hits) * mult
+    return ret - 1.0
+
+def breakeven_prob(tier: str) -> float:
+    """Per-leg win probability at which an entry of `tier` has zero EV."""
+    legs, payout = PAYOUTS[tier]
+    lo, hi = 0.0, 1.0
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        lo, hi = (mid, hi) if entry_ev(mid, legs, payout) < 0 else (lo, mid)
+    return (lo + hi) / 2
+
+# ---------- Board ----------
+def price(df: pd.DataFrame, method: str = DEFAULT_METHOD, tiers=PAYOUTS) -> pd.DataFrame:
+    """`df` plus Fair_Over, Fair_Under, Vig, Fair_Side, Fair_Prob, EV_<tier> and the best EV/EV_Tier."""
+    p_over = american_to_prob(pd.to_numeric(df["Over_Odds"], errors="coerce"))
+    p_under = american_to_prob(pd.to_numeric(df["Under_Odds"], errors="coerce"))
+    fair_over, fair_under = devig(p_over, p_under, method)
+    if "Ladder_Over" in df.columns:
+        # Rows matched off the alt-line ladder carry a fair probability but no odds
+        ladder = pd.to_numeric(df["Ladder_Over"], errors="coerce").to_numpy(dtype=float)
+        fill = np.isnan(fair_over) & ~np.isnan(ladder)
+        fair_over = np.where(fill, ladder, fair_over)
+        fair_under = np.where(fill, 1.0 - ladder, fair_under)
+
+    over_side = fair_over >= fair_under
+    fair_prob = np.where(over_side, fair_over, fair_under)
+    cols = {
+        "Fair_Over": fair_over,
+        "Fair_Under": fair_under,
+        "Vig": p_over + p_under - 1.0,
+        "Fair_Side": np.where(np.isnan(fair_prob), "", np.where(over_side, "Over", "Under")),
+        "Fair_Prob": fair_prob,
+    }
+    names = list(tiers)
+    evs = np.column_stack([entry_ev(fair_prob, *tiers[t]) for t in names])
+    for j, t in enumerate(names):
+        cols[f"EV_{t}"] = evs[:, j]
+
+    has = ~np.isnan(fair_prob)
+    best = np.argmax(np.where(np.isnan(evs), -np.inf, evs), axis=1)
+    cols["EV"] = np.where(has, evs[np.arange(len(df)), best], np.nan)
+    cols["EV_Tier"] = np.where(has, np.array(names, dtype=object)[best], "")
+    return df.assign(**cols)
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "nfl_regular.csv"
+    method = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_METHOD
+    board = price(pd.read_csv(path), method)
+    print(f"✅ Priced {len(board)} rows from {path} ({method})")
+    print("Break-even per leg: " + ", ".join(f"{t} {breakeven_prob(t):.3f}" for t in PAYOUTS))
+    top = board.dropna(subset=["EV"]).sort_values("EV", ascending=False).head(10)
+    print(top[["Player", "Prop", "PrizePicks_Line", "Over_Odds", "Under_Odds",
+               "Fair_Side", "Fair_Prob", "EV_Tier", "EV"]].to_string(index=False))
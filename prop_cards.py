@@ -0,0 +1,75 @@
+"""Prop bubble cards, rendered as one HTML fragment per page.
+
+Each card's HTML is memoized on its displayed content (the same prop on
+the same line renders once per process), and a page of cards goes to the
+browser as a single st.markdown delta instead of one per card. Long lists
+are paginated.
+"""
+from functools import lru_cache
+
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZE = 25
+SPARK_W, SPARK_H = 120, 28
+
+def sparkline_svg(points: tuple) -> str:
+    """Inline SVG polyline of a line's recent values; empty for fewer than 2 points."""
+    if len(points) < 2:
+        return ""
+    lo, hi = min(points), max(points)
+    span = (hi - lo) or 1.0
+    step = SPARK_W / (len(points) - 1)
+    coords = " ".join(
+        f"{i * step:.1f},{SPARK_H - 2 - (p - lo) / span * (SPARK_H - 4):.1f}" for i, p in enumerate(points)
+    )
+    return (
+        f'<svg class="line-spark" width="{SPARK_W}" height="{SPARK_H}" viewBox="0 0 {SPARK_W} {SPARK_H}">'
+        f'<polyline fill="none" stroke="#b388ff" stroke-width="2" points="{coords}"/></svg>'
+    )
+
+@lru_cache(maxsize=8192)
+def card_html(title: str, line: str, proj: str, over: str, under: str,
+              edge_pct: float, edge_text: str, badge: str, trend: tuple = ()) -> str:
+    badge_html = f'<div class="badge-recommended">{badge}</div>' if badge else ""
+    return (
+        f'<div class="prop-bubble">'
+        f'<strong>{title}</strong>'
+        f'<div class="prop-details">'
+        f'<div><span class="label">PP Line</span><span>{line}</span></div>'
+        f'<div><span class="label">Projection</span><span>{proj}</span></div>'
+        f'<div><span class="label">Odds</span><span>Over {over} / Under {under}</span></div>'
+        f'</div>'
+        f'<div class="edge-meter">'
+        f'<div class="edge-meter-fill" style="width:{edge_pct:g}%;"></div>'
+        f'<div class="edge-meter-text">{edge_text}</div>'
+        f'</div>'
+        f'{sparkline_svg(trend)}'
+        f'{badge_html}'
+        f'</div>'
+    )
+
+def cards_html(rows: pd.DataFrame, titles, badges) -> str:
+    """One fragment for value-board `rows`; `titles`/`badges` are per-row strings."""
+    return "\n".join(
+        card_html(title, r.Line_Fmt, r.Proj_Fmt, r.Over_Fmt, r.Under_Fmt,
+                  float(r.Edge_Pct), f"{abs(r.Edge):.1f}", badge, _trend(r))
+        for r, title, badge in zip(rows.itertuples(index=False), titles, badges)
+    )
+
+def _trend(row) -> tuple:
+    trend = getattr(row, "Line_Trend", None)
+    return tuple(float(x) for x in trend) if trend is not None else ()
+
+def render_cards(rows: pd.DataFrame, title_fn, badge_fn, key: str, page_size: int = PAGE_SIZE):
+    """Render `rows` as cards, `page_size` per page; title_fn/badge_fn map the page's frame to strings."""
+    pages = max(1, -(-len(rows) // page_size))
+    page = 1
+    if pages > 1:
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1,
+                               key=f"{key}_page")
+    start = (page - 1) * page_size
+    chunk = rows.iloc[start:start + page_size]
+    st.markdown(cards_html(chunk, title_fn(chunk), badge_fn(chunk)), unsafe_allow_html=True)
+    if pages > 1:
+        st.caption(f"Showing {start + 1}–{start + len(chunk)} of {len(rows)}")
@@ -0,0 +1,20 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+def load_stage(filename: str):
+    """Import a numbered pipeline script (e.g. '02_classify_and_merge.py') as a module.
+
+    The numbered names aren't valid identifiers, so a plain `import` can't reach them.
+    """
+    path = ROOT / filename
+    name = "stage_" + path.stem
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
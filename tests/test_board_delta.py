@@ -0,0 +1,67 @@
+"""A delta run must leave the same outputs a full rebuild of the new board would."""
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+import board_delta
+from conftest import ROOT
+
+BOARD = ROOT / "pp_nfl_board_2025-09-08_200548UTC.csv"
+
+def _projections(board: pd.DataFrame, folder):
+    folder.mkdir()
+    proj = pd.DataFrame({"player": board["player"], "prop": board["prop"], "projection": board["pp_line"] + 3.0})
+    proj = proj.drop_duplicates(["player", "prop"])
+    proj.to_csv(folder / "week1.csv", index=False)
+
+def _outputs(folder, names=("nfl_regular.csv",)):
+    out = []
+    for name in names:
+        df = pd.read_csv(folder / name)
+        out.append(df.sort_values(["projection_id", "Prop"], kind="stable").reset_index(drop=True))
+    return out
+
+def _run(board, folder, proj):
+    return board_delta.run(
+        str(board),
+        odds_folder=str(ROOT),
+        projections_folder=str(proj),
+        regular_csv=str(folder / "nfl_regular.csv"),
+        out_csv=str(folder / "nfl_regular_with_proj.csv"),
+        state_file=folder / "state.json",
+    )
+
+def test_delta_matches_full_rebuild(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # 02 saves the odds index and 03 its player index in the cwd
+    prev = pd.read_csv(BOARD)
+    curr = prev.copy()
+    curr.loc[curr.index[::3], "pp_line"] += 1.0  # move a third of the lines
+    curr = curr.drop(curr.index[1:30:7])         # ... and pull a few
+    prev_csv, curr_csv = tmp_path / "prev.csv", tmp_path / "curr.csv"
+    prev.to_csv(prev_csv, index=False)
+    curr.to_csv(curr_csv, index=False)
+    _projections(prev, tmp_path / "projections")
+
+    delta_dir, full_dir = tmp_path / "delta", tmp_path / "full"
+    delta_dir.mkdir()
+    full_dir.mkdir()
+    assert _run(prev_csv, delta_dir, tmp_path / "projections").empty  # no state yet: full run
+    diff = _run(curr_csv, delta_dir, tmp_path / "projections")
+    assert (diff["change"] == board_delta.LINE_MOVED).any()
+    assert _run(curr_csv, full_dir, tmp_path / "projections").empty
+
+    names = ("nfl_regular.csv", "nfl_regular_with_proj.csv")
+    for delta, full in zip(_outputs(delta_dir, names), _outputs(full_dir, names)):
+        assert list(delta.columns) == list(full.columns)
+        assert {"Team", "Best_Over", "Ladder_Over", "Fair_Prob"} <= set(delta.columns)
+        pdt.assert_frame_equal(delta, full)
+
+def test_rejects_frames_and_missing_projections(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    state = tmp_path / "state.json"
+    with pytest.raises(TypeError):
+        board_delta.run(pd.read_csv(BOARD), projections_folder=str(tmp_path), state_file=state)
+    with pytest.raises(FileNotFoundError, match="No projection CSVs"):
+        board_delta.run(str(BOARD), odds_folder=str(ROOT), projections_folder=str(tmp_path / "none"),
+                        regular_csv=str(tmp_path / "r.csv"), out_csv=str(tmp_path / "o.csv"), state_file=state)
+    assert not (tmp_path / "r.csv").exists() and not state.exists()  # failed before doing any work
@@ -0,0 +1,97 @@
+"""capture_daemon's JSON-line socket protocol, pulling from a local fixture API."""
+import json
+import socket
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+import capture_daemon
+
+PAYLOAD = json.dumps({
+    "data": [
+        {"type": "projection", "id": str(pid),
+         "attributes": {"stat_type": prop, "line_score": line, "start_time": "2025-09-07T13:00:00-04:00"},
+         "relationships": {"league": {"data": {"type": "league", "id": league}},
+                           "new_player": {"data": {"type": "new_player", "id": player}}}}
+        for pid, league, player, prop, line in [
+            (101, "9", "p1", "Pass Yards", 245.5),
+            (102, "9", "p2", "Receiving Yards", 71.5),
+            (103, "7", "p3", "Points", 24.5),
+        ]
+    ],
+    "included": [
+        {"type": "league", "id": "9", "attributes": {"name": "NFL"}},
+        {"type": "league", "id": "7", "attributes": {"name": "NBA"}},
+        {"type": "new_player", "id": "p1", "attributes": {"name": "Jalen Hurts", "team": "PHI"}},
+        {"type": "new_player", "id": "p2", "attributes": {"name": "A.J. Brown", "team": "PHI"}},
+        {"type": "new_player", "id": "p3", "attributes": {"name": "Jalen Brunson", "team": "NYK"}},
+    ],
+}).encode()
+
+class _Api(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.hits += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def api():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Api)
+    httpd.hits = 0
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _wait_ready(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return capture_daemon.request("ping", port=port, timeout=1)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+def _http_get(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        return resp.read()
+
+def test_ping_pull_stop(api, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # boards and raw payload archives land in the cwd
+    port = _free_port()
+    host, api_port = api.server_address
+    argv = ["serve", "--port", str(port), "--api-url", f"http://{host}:{api_port}/projections"]
+    daemon = threading.Thread(target=capture_daemon.main, args=(argv,), kwargs={"fetch": _http_get})
+    daemon.start()
+
+    assert _wait_ready(port) == {"ok": True}
+    reply = capture_daemon.request("pull", port=port)
+    assert reply["ok"] and reply["rows"] == 2
+    assert api.hits == 1
+
+    board = pd.read_csv(reply["path"])
+    assert sorted(board["player"]) == ["A.J. Brown", "Jalen Hurts"]  # NBA row dropped
+    assert set(board["projection_id"]) == {101, 102}
+    assert board.set_index("projection_id").loc[101, "pp_line"] == 245.5
+    assert list(tmp_path.glob("pp_nfl_board_*.csv")) == [tmp_path / reply["path"]]
+
+    assert capture_daemon.request("bogus", port=port)["ok"] is False
+    assert capture_daemon.request("stop", port=port) == {"ok": True}
+    daemon.join(timeout=5)
+    assert not daemon.is_alive()
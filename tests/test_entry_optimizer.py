@@ -0,0 +1,59 @@
+"""entry_optimizer's branch-and-bound against brute force on a small board."""
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from entry_optimizer import MIN_TEAMS, optimize
+from pricing import PAYOUTS
+
+def _board(seed: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    players = [f"Player {i}" for i in range(9)]
+    # Odd players carry two props, so the one-leg-per-player rule has something to reject
+    props = ("RECEPTIONS", "RECEIVING YARDS")
+    rows = [(p, f"T{i % 3}", prop) for i, p in enumerate(players) for prop in props[: 1 + i % 2]]
+    board = pd.DataFrame(rows, columns=["Player", "Team", "Prop"])
+    board["Fair_Prob"] = rng.uniform(0.5, 0.72, len(board))
+    board["Fair_Side"] = "Over"
+    board["PrizePicks_Line"] = 10.5
+    return board
+
+def _entry_ev(probs, payout) -> float:
+    """Expected return by enumerating every hit/miss outcome."""
+    ev = 0.0
+    for hits in product((0, 1), repeat=len(probs)):
+        chance = 1.0
+        for p, h in zip(probs, hits):
+            chance *= p if h else 1 - p
+        ev += chance * payout.get(sum(hits), 0.0)
+    return ev - 1.0
+
+def _brute_force(board, tiers, top_k, max_per_team):
+    prob, player, team = board["Fair_Prob"].tolist(), board["Player"].tolist(), board["Team"].tolist()
+    found = []
+    for tier in tiers:
+        legs, payout = PAYOUTS[tier]
+        for rows in combinations(range(len(board)), legs):
+            teams = [team[r] for r in rows]
+            if len({player[r] for r in rows}) < legs or len(set(teams)) < MIN_TEAMS:
+                continue
+            if max(teams.count(t) for t in teams) > max_per_team:
+                continue
+            found.append((_entry_ev([prob[r] for r in rows], payout), tier, frozenset(board.index[list(rows)])))
+    return sorted(found, key=lambda f: f[0], reverse=True)[:top_k]
+
+@pytest.mark.parametrize("max_per_team", [6, 2])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_top_k_matches_brute_force(max_per_team, workers):
+    board = _board()
+    tiers = ("2P", "3P", "4P", "3F", "5F")
+    best = optimize(board, tiers=tiers, top_k=8, max_per_team=max_per_team, workers=workers)
+    expected = _brute_force(board, tiers, 8, max_per_team)
+
+    np.testing.assert_allclose(best["EV"], [ev for ev, _, _ in expected], rtol=1e-9)
+    assert [(t, frozenset(r)) for t, r in zip(best["Tier"], best["Rows"])] == [(t, r) for _, t, r in expected]
+
+def test_no_entry_when_board_is_too_small():
+    assert optimize(_board().head(1), tiers=("2P",)).empty
@@ -0,0 +1,47 @@
+"""entry_sim: marginals, and the two hit-count paths agreeing on one sample."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from entry_sim import EntrySimulator
+from pricing import PAYOUTS, entry_ev
+
+SIMS = 200_000
+
+def _legs(n: int = 12, seed: int = 2) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    props = ["PASSING YARDS", "RECEIVING YARDS", "RECEPTIONS", "RUSHING YARDS"]
+    return pd.DataFrame({
+        "Player": [f"Player {i // 2}" for i in range(n)],  # two legs per player
+        "Team": [f"T{i % 3}" for i in range(n)],
+        "Prop": [props[i % len(props)] for i in range(n)],
+        "Fair_Side": rng.choice(["Over", "Under"], n),
+        "Fair_Prob": rng.uniform(0.45, 0.75, n),
+    })
+
+def test_marginals_match_fair_prob():
+    legs = _legs()
+    rates = EntrySimulator(legs, sims=SIMS, seed=11).hit_rates()
+    p = legs["Fair_Prob"].to_numpy()
+    # Correlation moves the joint behaviour only; each leg keeps its probability (within 5 standard errors)
+    np.testing.assert_allclose(rates, p, atol=5 * np.sqrt(p * (1 - p) / SIMS).max())
+
+def test_pattern_and_block_paths_agree():
+    sim = EntrySimulator(_legs(), sims=50_000, seed=5)
+    rng = np.random.default_rng(1)
+    entries = [tuple(rng.choice(12, size, replace=False)) for size in (2, 3, 4, 5, 6) for _ in range(20)]
+    np.testing.assert_allclose(sim._count_dist_patterns(entries), sim._count_dist_blocks(entries), atol=1e-12)
+
+def test_sample_is_independent_of_batch_size():
+    legs = _legs()
+    a = EntrySimulator(legs, sims=30_000, seed=3, batch=1 << 16).hits
+    b = EntrySimulator(legs, sims=30_000, seed=3, batch=4096).hits
+    assert np.array_equal(a, b)
+
+@pytest.mark.parametrize("tier", ["3P", "5F"])
+def test_uncorrelated_legs_price_like_independent_ev(tier):
+    legs = _legs().iloc[:PAYOUTS[tier][0]]
+    legs = legs.assign(Fair_Prob=0.6)
+    sim = EntrySimulator(legs, corr=np.eye(len(legs)), sims=SIMS, seed=9)
+    sim_ev = sim.evaluate([tuple(range(len(legs)))], tier)["Sim_EV"].iloc[0]
+    assert sim_ev == pytest.approx(float(entry_ev(0.6, *PAYOUTS[tier])), abs=0.03)
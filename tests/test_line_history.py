@@ -0,0 +1,72 @@
+"""line_history queries against the boards they were ingested from."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from line_history import LineHistory, ingest
+
+START = pd.Timestamp("2025-09-07 12:00", tz="UTC")
+KEYS = [("Ja'Marr Chase", "Receiving Yards"), ("Ja'Marr Chase", "Receptions"), ("Joe Burrow", "Pass Yards")]
+
+def _boards(pulls: int = 16, seed: int = 8) -> list:
+    """(captured_at, board) per pull: two projection_ids per prop whose lines wander, drop off and return."""
+    rng = np.random.default_rng(seed)
+    base = {pid: 10.5 + 20 * k for k in range(len(KEYS)) for pid in (100 + 2 * k, 101 + 2 * k)}
+    boards = []
+    for i in range(pulls):
+        rows = []
+        for k, (player, prop) in enumerate(KEYS):
+            for pid in (100 + 2 * k, 101 + 2 * k):
+                base[pid] += rng.choice([-1.0, 0.0, 0.0, 1.0])
+                if rng.random() < 0.15:
+                    continue  # pulled from this board
+                rows.append({"projection_id": pid, "player": player, "prop": prop, "pp_line": base[pid]})
+        boards.append((START + pd.Timedelta(minutes=5 * i), pd.DataFrame(rows)))
+    return boards
+
+@pytest.fixture(scope="module")
+def loaded(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("line_history")
+    boards = _boards()
+    sources = []
+    for ts, board in boards:
+        path = tmp / f"pp_nfl_board_{ts:%Y-%m-%d_%H%M%S}UTC.csv"
+        board.to_csv(path, index=False)
+        sources.append((ts, str(path)))
+    # Two ingests, so the history spans more than one segment
+    ingest(sources[:7], root=tmp / "history")
+    ingest(sources, root=tmp / "history")
+    return LineHistory.load(tmp / "history"), boards
+
+def _board_at(boards, when):
+    on = [b for ts, b in boards if ts <= when]
+    return on[-1] if on else pd.DataFrame(columns=["projection_id", "player", "prop", "pp_line"])
+
+def test_line_at_matches_the_board_on_screen(loaded):
+    history, boards = loaded
+    times = [ts for ts, _ in boards] + [ts + pd.Timedelta(minutes=2) for ts, _ in boards]
+    times += [START - pd.Timedelta(minutes=1)]
+    for when in times:
+        board = _board_at(boards, when)
+        for player, prop in KEYS:
+            rows = board[(board["player"] == player) & (board["prop"] == prop)]
+            expected = dict(zip(rows["projection_id"].tolist(), rows["pp_line"].tolist()))
+            assert history.line_at(player, prop, when) == expected, (player, prop, when)
+
+def test_line_at_takes_naive_times_as_utc(loaded):
+    history, boards = loaded
+    when = boards[3][0]
+    assert history.line_at(*KEYS[0], when.tz_localize(None)) == history.line_at(*KEYS[0], when)
+
+@pytest.mark.parametrize("since_pull", [None, 0, 5, 14])
+def test_movers_match_board_diff(loaded, since_pull):
+    history, boards = loaded
+    since = boards[-2][0] if since_pull is None else boards[since_pull][0]
+    now = boards[-1][1].set_index("projection_id")["pp_line"]
+    before = _board_at(boards, since).set_index("projection_id")["pp_line"]
+    delta = (now - before.reindex(now.index)).dropna()
+    delta = delta[delta != 0]
+
+    got = history.movers(since=None if since_pull is None else since, limit=100)
+    assert sorted(zip(got["projection_id"], got["delta"])) == sorted(delta.items())
+    assert (got["delta"].abs().diff().dropna() <= 0).all()  # biggest move first
@@ -0,0 +1,55 @@
+"""odds_index.LineLadder against a plain per-row interpolation."""
+import numpy as np
+import pandas as pd
+
+from odds_index import LineLadder
+
+def _ladders(seed: int = 3):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for p in range(12):
+        for prop in ("RECEIVING YARDS", "RECEPTIONS"):
+            lines = np.sort(rng.choice(np.arange(0.5, 120.5, 1.0), rng.integers(1, 6), replace=False))
+            probs = np.sort(rng.uniform(0.2, 0.8, len(lines)))[::-1]  # Over gets less likely as the line rises
+            rows += [(f"PLAYER {p}", prop, line, prob) for line, prob in zip(lines, probs)]
+    keys = pd.DataFrame(rows, columns=["player_clean", "prop_clean", "Line", "prob"])
+    return keys.sort_values(["player_clean", "prop_clean", "Line"], ignore_index=True)
+
+def _reference(keys, player, prop, line):
+    """(prob, low, high) for one query, the slow way."""
+    ladder = keys[(keys["player_clean"] == player) & (keys["prop_clean"] == prop)]
+    lines, probs = ladder["Line"].to_numpy(), ladder["prob"].to_numpy()
+    if line in lines:
+        i = int(np.flatnonzero(lines == line)[0])
+        return probs[i], line, line
+    if not len(lines) or np.isnan(line) or line < lines[0] or line > lines[-1]:
+        return np.nan, np.nan, np.nan
+    hi = int(np.searchsorted(lines, line))
+    return np.interp(line, lines, probs), lines[hi - 1], lines[hi]
+
+def test_lookup_matches_per_row_interpolation():
+    keys = _ladders()
+    ladder = LineLadder.build(keys[["player_clean", "prop_clean", "Line"]], keys["prob"].to_numpy())
+    rng = np.random.default_rng(9)
+    n = 2000
+    q = pd.DataFrame({
+        "player": [f"PLAYER {i}" for i in rng.integers(0, 14, n)],  # 12 and 13 have no ladder
+        "prop": rng.choice(["RECEIVING YARDS", "RECEPTIONS"], n),
+        "line": rng.choice(np.arange(0.0, 121.0, 0.5), n),
+    })
+    q.loc[::97, "line"] = np.nan
+
+    prob, low, high = ladder.lookup(q["player"], q["prop"], q["line"])
+    expected = np.array([_reference(keys, *row) for row in q.itertuples(index=False)])
+    np.testing.assert_allclose(prob, expected[:, 0], equal_nan=True)
+    np.testing.assert_array_equal(low, expected[:, 1])
+    np.testing.assert_array_equal(high, expected[:, 2])
+    # The sample exercises exact, interpolated and out-of-ladder lines
+    assert (low == high).any() and (low < high).any() and np.isnan(prob).any()
+
+def test_nan_probabilities_are_dropped_from_the_ladder():
+    keys = pd.DataFrame({"player_clean": ["A"] * 3, "prop_clean": ["RECEPTIONS"] * 3, "Line": [2.5, 3.5, 4.5]})
+    ladder = LineLadder.build(keys, np.array([0.6, np.nan, 0.4]))
+    prob, low, high = ladder.lookup(["A"], ["RECEPTIONS"], [3.5])
+    np.testing.assert_allclose(prob, [0.5])
+    assert (low[0], high[0]) == (2.5, 4.5)
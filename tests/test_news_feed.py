@@ -0,0 +1,23 @@
+"""NewsCache.refresh over local feed files."""
+from news_feed import NewsCache
+
+def _rss(path, items):
+    entries = "".join(
+        f"<item><title>{title}</title><link>{link}</link><pubDate>{date}</pubDate></item>"
+        for title, link, date in items
+    )
+    path.write_text(f"<?xml version='1.0'?><rss version='2.0'><channel><title>t</title>{entries}</channel></rss>")
+    return str(path)
+
+def test_refresh_without_feeds():
+    cache = NewsCache(feeds=[])
+    assert cache.refresh() == []
+    assert cache.errors == {} and cache.refreshed_at is not None
+
+def test_refresh_merges_feeds_newest_first_without_duplicates(tmp_path):
+    a = _rss(tmp_path / "a.xml", [("A1", "https://x/1", "Thu, 11 Sep 2025 17:24:00 +0000"),
+                                  ("A2", "https://x/2", "Thu, 11 Sep 2025 12:00:00 +0000")])
+    b = _rss(tmp_path / "b.xml", [("B1", "https://x/3", "Thu, 11 Sep 2025 15:00:00 +0000"),
+                                  ("A1 again", "https://x/1", "Thu, 11 Sep 2025 17:24:00 +0000")])
+    items = NewsCache(feeds=[a, b]).refresh()
+    assert [it["title"] for it in items] == ["A1", "B1", "A2"]
@@ -0,0 +1,72 @@
+"""OddsIndex reductions against plain groupbys over the long odds frame."""
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from odds_index import KEYS, OddsIndex
+from pricing import american_to_prob, devig
+
+BOOKS = ["draftkings", "fanduel", "betmgm", "caesars"]
+
+def _odds(seed: int = 6) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for p in range(6):
+        for prop in ("RECEPTIONS", "RECEIVING YARDS"):
+            for line in rng.choice(np.arange(2.5, 9.5), 3, replace=False):
+                for book in rng.choice(BOOKS, rng.integers(1, 5), replace=False):
+                    over = int(rng.choice([-1, 1]) * rng.integers(100, 200))
+                    for label, odds in (("Over", over), ("Under", -over if abs(over) > 105 else -115)):
+                        if rng.random() < 0.1:
+                            continue  # book quotes one side only
+                        rows.append((f"PLAYER {p}", prop, float(line), book, label, odds))
+    odds = pd.DataFrame(rows, columns=[*KEYS, "Book", "Label", "Odds"])
+    # A repeated quote from one book: the index keeps its most favored (min) price
+    dup = odds[odds["Odds"] < 0].iloc[[0]]
+    dup = dup.assign(Odds=dup["Odds"] - 25)
+    return pd.concat([odds, dup], ignore_index=True)
+
+def _per_book(odds: pd.DataFrame) -> pd.DataFrame:
+    wide = odds.pivot_table(index=[*KEYS, "Book"], columns="Label", values="Odds", aggfunc="min")
+    return wide.reindex(columns=["Over", "Under"]).reset_index()
+
+def test_most_favored_and_best_price_match_groupby():
+    odds = _odds()
+    index = OddsIndex.build(odds)
+    side = odds.pivot_table(index=KEYS, columns="Label", values="Odds", aggfunc="min").reset_index()
+    got = index.most_favored()
+    assert got[KEYS].equals(side[KEYS])
+    pdt.assert_series_equal(got["Over_Odds"].astype(float), side["Over"].astype(float), check_names=False)
+    pdt.assert_series_equal(got["Under_Odds"].astype(float), side["Under"].astype(float), check_names=False)
+
+    best = index.best_price()
+    per_book = _per_book(odds)
+    for label in ("Over", "Under"):
+        top = per_book.dropna(subset=[label]).sort_values(label, ascending=False, kind="stable")
+        top = top.drop_duplicates(KEYS).set_index(KEYS).reindex(pd.MultiIndex.from_frame(side[KEYS]))
+        np.testing.assert_array_equal(best[f"Best_{label}"], top[label].to_numpy(dtype=float))
+        # The named book really offers that price
+        quoted = per_book.set_index([*KEYS, "Book"])[label]
+        named = zip(side[KEYS].itertuples(index=False), best[f"Best_{label}"], best[f"Best_{label}_Book"])
+        for key, price, book in named:
+            if not np.isnan(price):
+                assert quoted[(*key, book)] == price
+
+def test_consensus_is_the_mean_no_vig_price_of_two_sided_books():
+    odds = _odds()
+    index = OddsIndex.build(odds)
+    cons = index.consensus()
+    per_book = _per_book(odds).dropna(subset=["Over", "Under"])
+    per_book["fair"] = devig(american_to_prob(per_book["Over"]), american_to_prob(per_book["Under"]))[0]
+    expected = per_book.groupby(KEYS)["fair"].agg(["mean", "size"])
+    expected = expected.reindex(pd.MultiIndex.from_frame(index.keys[KEYS]))
+
+    np.testing.assert_allclose(cons["Consensus_Over"], expected["mean"], equal_nan=True)
+    np.testing.assert_array_equal(cons["Books"], expected["size"].fillna(0))
+    two_sided = cons["Books"] > 0
+    np.testing.assert_allclose((cons["Consensus_Over"] + cons["Consensus_Under"])[two_sided], 1.0)
+
+def test_save_load_round_trip(tmp_path):
+    index = OddsIndex.build(_odds())
+    path = index.save(tmp_path / "odds_index.parquet")
+    pdt.assert_frame_equal(OddsIndex.load(path).summary(), index.summary())
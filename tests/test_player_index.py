@@ -0,0 +1,64 @@
+"""player_index: suffix, team-code and first/last aliasing."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from player_index import PlayerIndex, canonical_name
+
+REFERENCE = ["Marvin Harrison Jr.", "A.J. Brown", "Jalen Hurts PHI", "Kenneth Walker III", "Josh Allen"]
+
+@pytest.mark.parametrize("name, expected", [
+    ("Marvin Harrison Jr.", "MARVIN HARRISON"),
+    ("Kenneth Walker III", "KENNETH WALKER"),
+    ("Jalen Hurts PHI", "JALEN HURTS"),
+    ("Michael Pittman Jr. IND", "MICHAEL PITTMAN"),  # team code first, then the suffix
+    ("Amon-Ra St. Brown", "AMON RA ST BROWN"),
+    ("Justin Jr", "JUSTIN JR"),  # two-token names keep their last token
+    ("Derek Car", "DEREK CAR"),
+])
+def test_canonical_name(name, expected):
+    assert canonical_name(name) == expected
+
+@pytest.mark.parametrize("query, expected", [
+    ("Marvin Harrison", "MARVIN HARRISON"),          # reference had the suffix
+    ("Marvin Harrison Jr", "MARVIN HARRISON"),
+    ("Marvin Harrison Sr.", "MARVIN HARRISON"),      # any suffix strips to the same id
+    ("Kenneth Walker", "KENNETH WALKER"),
+    ("AJ Brown", "AJ BROWN"),                        # punctuation
+    ("Brown, A.J.", "AJ BROWN"),                     # last, first
+    ("Jalen Hurts", "JALEN HURTS"),                  # reference had a team code
+    ("Jalen Hurts PHI", "JALEN HURTS"),
+    ("Hurts Jalen", "JALEN HURTS"),
+    ("Josh Allen BUF", "JOSH ALLEN"),                # query has a team code
+    ("Allen Josh", "JOSH ALLEN"),
+    ("Josh Allan", None),
+])
+def test_resolve_aliases(query, expected):
+    index = PlayerIndex.build(REFERENCE)
+    assert index.resolve(pd.Series([query])).iloc[0] == expected
+
+def test_resolve_keeps_index_and_maps_missing_names_to_none():
+    index = PlayerIndex.build(REFERENCE)
+    names = pd.Series(["A.J. Brown", np.nan, "Nobody Here", "A.J. Brown"], index=[10, 11, 12, 13])
+    out = index.resolve(names)
+    assert out.index.tolist() == [10, 11, 12, 13]
+    assert out.tolist() == ["AJ BROWN", None, None, "AJ BROWN"]
+    assert index.ids == sorted({canonical_name(n) for n in REFERENCE})
+
+def test_canonical_form_wins_over_another_players_flip():
+    # "ALLEN JOSH" is both a real player's name and Josh Allen's flip; the real player keeps it
+    index = PlayerIndex.build(["Josh Allen", "Allen Josh"])
+    assert index.lookup("Allen Josh") == "ALLEN JOSH"
+    assert index.lookup("Josh Allen") == "JOSH ALLEN"
+
+def test_for_file_is_cached_by_content(tmp_path):
+    src = tmp_path / "proj.csv"
+    pd.DataFrame({"player": REFERENCE}).to_csv(src, index=False)
+    first = PlayerIndex.for_file(src, "player", index_dir=tmp_path / "idx")
+    assert len(list((tmp_path / "idx").glob("*.json"))) == 1
+    again = PlayerIndex.for_file(src, "player", index_dir=tmp_path / "idx")
+    assert again.aliases == first.aliases and again.ids == first.ids
+
+    pd.DataFrame({"player": REFERENCE + ["Puka Nacua"]}).to_csv(src, index=False)
+    changed = PlayerIndex.for_file(src, "player", index_dir=tmp_path / "idx")
+    assert changed.lookup("Nacua Puka") == "PUKA NACUA"
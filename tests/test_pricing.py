@@ -0,0 +1,33 @@
+"""No-vig probabilities from pricing.devig."""
+import numpy as np
+import pytest
+
+from pricing import METHODS, _power_exponent, american_to_prob, devig
+
+OVER = np.array([-110, -120, -150, -250, -400, -1000, 100, 130, -105])
+UNDER = np.array([-110, -100, 120, 190, 300, 600, -130, -160, -125])
+
+@pytest.mark.parametrize("method", METHODS)
+def test_devig_sums_to_one(method):
+    fair_over, fair_under = devig(american_to_prob(OVER), american_to_prob(UNDER), method)
+    np.testing.assert_allclose(fair_over + fair_under, 1.0, atol=1e-12)
+    assert ((fair_over > 0) & (fair_over < 1)).all()
+    # Removing the margin never flips which side is favoured
+    assert (np.sign(fair_over - 0.5) == np.sign(american_to_prob(OVER) - american_to_prob(UNDER))).all()
+
+def test_power_method_converges_on_lopsided_market():
+    a, b = american_to_prob([-2500, -1000]), american_to_prob([1200, 600])
+    k = _power_exponent(a, b, iters=30)
+    np.testing.assert_allclose(a ** k + b ** k, 1.0, atol=1e-12)
+
+    # Reference root by bisection: a**k + b**k is decreasing in k
+    lo, hi = np.ones_like(a), np.full_like(a, 10.0)
+    for _ in range(200):
+        mid = (lo + hi) / 2
+        over = a ** mid + b ** mid > 1
+        lo, hi = np.where(over, mid, lo), np.where(over, hi, mid)
+    np.testing.assert_allclose(k, lo, rtol=1e-9)
+
+def test_missing_side_stays_nan():
+    fair_over, fair_under = devig(american_to_prob([-110, np.nan]), american_to_prob([np.nan, -110]), "power")
+    assert np.isnan(fair_over).all() and np.isnan(fair_under).all()
@@ -0,0 +1,122 @@
+"""fetch_table / scrape_fantasypros against a local FantasyPros stand-in."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas.testing as pdt
+import pytest
+
+from stage_loader import load_stage
+
+scraper = load_stage("03_scrape_projections.py")
+
+def _page(rows) -> str:
+    body = "".join(f"<tr><td>{p}</td><td>{y}</td><td>{td}</td></tr>" for p, y, td in rows)
+    return (
+        "<html><body><table id='ranks'><tr><td>not this one</td></tr></table>"
+        "<table id='data' class='table'><thead>"
+        "<tr><th></th><th colspan='2'>PASSING</th></tr>"
+        "<tr><th>Player</th><th>YDS</th><th>TDS</th></tr>"
+        f"</thead><tbody>{body}</tbody></table></body></html>"
+    )
+
+PAGES = {
+    "/qb": _page([("Jalen Hurts PHI", 218.4, 1.6), ("Lamar Jackson BAL", 235.9, 1.8)]),
+    "/rb": _page([("Saquon Barkley PHI", 12.0, 0.1)]),
+    "/notable": "<html><body><table id='ranks'><tr><td>1</td></tr></table></body></html>",
+}
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        self.server.log.append((path, self.headers.get("If-None-Match")))
+        if path not in PAGES:
+            self.send_error(500)
+            return
+        etag = f'"{hash(PAGES[path]) & 0xffffffff:x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = PAGES[path].encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.log = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def _positions(server, *paths) -> dict:
+    host, port = server.server_address
+    return {p.strip("/").upper(): f"http://{host}:{port}{p}?week={{week}}" for p in paths}
+
+def test_cold_then_conditional_scrape(server, tmp_path):
+    positions = _positions(server, "/qb", "/rb")
+    cold = scraper.scrape_fantasypros(1, cache_dir=tmp_path, positions=positions)
+    assert list(cold.columns) == ["Player", "PASSING YDS", "PASSING TDS", "POS"]
+    assert cold["POS"].tolist() == ["QB", "QB", "RB"]
+    assert all(etag is None for _, etag in server.log)
+
+    server.log.clear()
+    warm = scraper.scrape_fantasypros(1, cache_dir=tmp_path, positions=positions)
+    assert len(server.log) == 2 and all(etag for _, etag in server.log)  # both pages revalidated
+    pdt.assert_frame_equal(warm, cold)
+
+def test_fetch_table_304_reuses_cached_frame(server, tmp_path):
+    url = _positions(server, "/qb")["QB"].format(week=1)
+    session = scraper.make_session(1)
+    first = scraper.fetch_table(session, url, tmp_path)
+    again = scraper.fetch_table(session, url, tmp_path)
+    pdt.assert_frame_equal(again, first)
+    assert [etag is not None for _, etag in server.log] == [False, True]
+
+def test_page_without_data_table(server, tmp_path):
+    url = _positions(server, "/notable")["NOTABLE"].format(week=1)
+    with pytest.raises(ValueError):
+        scraper.fetch_table(scraper.make_session(1), url, tmp_path)
+
+    # ... and in a scrape the position is skipped rather than parsed from another table
+    out = scraper.scrape_fantasypros(1, cache_dir=tmp_path, positions=_positions(server, "/qb", "/notable"))
+    assert set(out["POS"]) == {"QB"}
+
+def test_every_position_failed(server, tmp_path):
+    positions = _positions(server, "/notable", "/missing")
+    out = scraper.scrape_fantasypros(1, cache_dir=tmp_path, positions=positions)
+    assert out.empty
+    assert scraper.scrape_fantasypros(1, cache_dir=tmp_path, positions={}).empty
+
+def test_backfill_resumes_and_retries_only_failed_units(server, tmp_path):
+    store, cache = tmp_path / "store", tmp_path / "cache"
+    broken = {"QB": _positions(server, "/qb")["QB"], "RB": _positions(server, "/missing")["MISSING"]}
+    first = scraper.backfill([2024, 2025], [1, 2], workers=2, delay=0, store_dir=store, cache_dir=cache,
+                             positions=broken)
+    assert first == {"done": 4, "failed": 4, "skipped": 0}
+
+    server.log.clear()
+    fixed = {"QB": broken["QB"], "RB": _positions(server, "/rb")["RB"]}
+    second = scraper.backfill([2024, 2025], [1, 2], workers=2, delay=0, store_dir=store, cache_dir=cache,
+                              positions=fixed)
+    assert second == {"done": 4, "failed": 0, "skipped": 4}
+    assert {path for path, _ in server.log} == {"/rb"}  # finished QB units are never re-requested
+
+    server.log.clear()
+    third = scraper.backfill([2024, 2025], [1, 2], store_dir=store, cache_dir=cache, positions=fixed)
+    assert third == {"done": 0, "failed": 0, "skipped": 8} and server.log == []
+
+    week = scraper.read_projections_store(2025, 2, store_dir=store)
+    assert sorted(week["POS"]) == ["QB", "QB", "RB"]
+    assert set(week["season"]) == {2025} and set(week["week"]) == {2}
+    assert len(scraper.read_projections_store(store_dir=store)) == 12
@@ -0,0 +1,28 @@
+"""value_rules.json must stay reachable from the props PrizePicks actually posts."""
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import ROOT
+from value_rules import RULES_FILE, load_rules, rule_index
+
+BOARD = ROOT / "pp_nfl_board_2025-09-11_183857UTC.csv"
+
+def test_every_rule_selects_a_row_on_the_sample_board():
+    rules = load_rules()["rules"]
+    idx = rule_index(pd.read_csv(BOARD)["prop"], rules)
+    unmatched = [rules.at[i, "props"] for i in range(len(rules)) if not (idx == i).any()]
+    assert unmatched == []
+
+def test_every_shown_category_has_a_rule():
+    config = load_rules()
+    assert set(config["show"]) <= set(config["rules"]["category"])
+
+def test_unknown_prop_name_is_rejected(tmp_path):
+    cfg = json.loads(RULES_FILE.read_text())
+    cfg["rules"][0]["props"] = ["PASS YARD"]
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(cfg))
+    with pytest.raises(ValueError, match="PASS YARD"):
+        load_rules(path)
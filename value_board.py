@@ -0,0 +1,135 @@
+"""Precomputed value board: everything the app renders, computed once per data refresh.
+
+Reads nfl_regular_with_proj.csv and writes nfl_value_board.parquet with, per
+row: signed Edge, the edge-meter fill, the recommended side, the Value Props
+category and its rank within that category (value_rules.json), and the
+display strings for prop, line, projection and odds. The app only reads and
+slices this file.
+
+Usage: python value_board.py [in_csv] [out_parquet]
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from line_history import HISTORY_DIR, LineHistory
+from normalize import _map_unique
+from pricing import price, prob_to_american
+from value_rules import load_rules, score
+
+SOURCE_CSV = "nfl_regular_with_proj.csv"
+VALUE_BOARD = "nfl_value_board.parquet"
+
+# ---------- Display helpers ----------
+def format_odds(odds):
+    try:
+        odds_val = float(odds)
+        odds_int = int(round(odds_val))
+        odds_str = str(odds_int)
+        if odds_int > 0:
+            odds_str = '+' + odds_str
+        return odds_str
+    except (TypeError, ValueError):
+        return odds
+
+def format_number(value) -> str:
+    return f"{value:.1f}" if isinstance(value, (float, int)) else str(value)
+
+def format_odds_column(odds: pd.Series) -> np.ndarray:
+    """format_odds over a whole column ("+110", "-120"), formatting each distinct price once."""
+    return _map_unique(odds, lambda o: str(format_odds(o))).to_numpy(copy=True)
+
+def odds_display(df: pd.DataFrame, side: str) -> np.ndarray:
+    """Formatted book odds; rows matched off the alt-line ladder show their fair price as "≈-120"."""
+    shown = format_odds_column(df[f"{side}_Odds"])
+    if f"Fair_{side}" not in df.columns:
+        return shown
+    implied = df[f"{side}_Odds"].isna().to_numpy() & df[f"Fair_{side}"].notna().to_numpy()
+    if implied.any():
+        fair = pd.Series(prob_to_american(df[f"Fair_{side}"].to_numpy(dtype=float)[implied]))
+        shown[implied] = "≈" + format_odds_column(fair).astype(str)
+    return shown
+
+def recommended_side(over, under, proj, line) -> np.ndarray:
+    """Vectorized determine_recommended: the shorter price, ties broken by projection vs line."""
+    return np.select(
+        [over < under, under < over, proj > line, proj < line],
+        ["Over", "Under", "Over", "Under"],
+        default="",
+    )
+
+# ---------- Build ----------
+def line_trends(df: pd.DataFrame, history: LineHistory) -> list:
+    """Line_Trend per row, looked up once per distinct (player, prop, line)."""
+    keys = list(zip(df["Player"], df["Prop"], df["PrizePicks_Line"]))
+    cache = {}
+    for k in keys:
+        if k not in cache:
+            cache[k] = history.trend(*k) if pd.notna(k[2]) else []
+    return [cache[k] for k in keys]
+
+def load_history(root=HISTORY_DIR):
+    """The line history index, or None when nothing has been ingested yet."""
+    return LineHistory.load(root) if (Path(root) / "manifest.json").exists() else None
+
+def build(df: pd.DataFrame, config: dict = None, history: LineHistory = None) -> pd.DataFrame:
+    config = config or load_rules()
+    if "Fair_Prob" not in df.columns:
+        df = price(df)  # boards merged before pricing existed
+    line = pd.to_numeric(df["PrizePicks_Line"], errors="coerce").to_numpy(dtype=float)
+    proj = pd.to_numeric(df["Projection"], errors="coerce").to_numpy(dtype=float)
+    over = pd.to_numeric(df["Over_Odds"], errors="coerce").to_numpy(dtype=float)
+    under = pd.to_numeric(df["Under_Odds"], errors="coerce").to_numpy(dtype=float)
+    edge = proj - line
+
+    board = df.assign(
+        Edge=edge,
+        Edge_Pct=np.nan_to_num(np.clip(np.abs(edge) * 10, 0, 100), nan=0.0),
+        Recommended=recommended_side(over, under, proj, line),
+        Prop_Title=df["Prop"].str.title(),
+        Line_Fmt=_map_unique(df["PrizePicks_Line"], format_number).to_numpy(),
+        Proj_Fmt=_map_unique(df["Projection"], format_number).to_numpy(),
+        Over_Fmt=odds_display(df, "Over"),
+        Under_Fmt=odds_display(df, "Under"),
+    )
+
+    # Category + rank among qualifying rows (Edge desc, then |Over_Odds| asc)
+    scored = score(df, config).sort_values(["Edge", "Odds_Strength"], ascending=[False, True], kind="stable")
+    rank = scored.groupby("Category", sort=False).cumcount() + 1
+    slot = {cat: i for i, cat in enumerate(config["show"])}
+    board["Value_Category"] = scored["Category"].reindex(board.index)
+    board["Value_Rank"] = rank.reindex(board.index).astype("Int64")
+    board["Value_Slot"] = board["Value_Category"].map(slot).astype("Int64")
+    board["Line_Trend"] = line_trends(df, history) if history is not None else [[] for _ in range(len(df))]
+    return board
+
+def write(board: pd.DataFrame, out_path=VALUE_BOARD) -> Path:
+    out_path = Path(out_path)
+    tmp = out_path.with_suffix(".tmp")
+    board.to_parquet(tmp, index=False)
+    os.replace(tmp, out_path)
+    return out_path
+
+def top_picks(board: pd.DataFrame) -> pd.DataFrame:
+    """Best row of every shown Value Props category, in display order."""
+    top = board[(board["Value_Rank"] == 1) & board["Value_Slot"].notna()]
+    return top.sort_values("Value_Slot")
+
+def all_picks(board: pd.DataFrame) -> pd.DataFrame:
+    """Every qualifying row of the shown categories, biggest edge first."""
+    picks = board[board["Value_Rank"].notna() & board["Value_Slot"].notna()]
+    return picks.sort_values(["Edge", "Value_Rank"], ascending=[False, True], kind="stable")
+
+def main(in_csv: str = SOURCE_CSV, out_path: str = VALUE_BOARD):
+    if not os.path.exists(in_csv):
+        print(f"❌ Missing {in_csv}")
+        sys.exit(1)
+    board = build(pd.read_csv(in_csv), history=load_history())
+    write(board, out_path)
+    print(f"✅ Saved {out_path}: {len(board)} rows, {int(board['Value_Rank'].eq(1).sum())} category leaders")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
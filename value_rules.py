@@ -0,0 +1,99 @@
+"""Value Props rule engine.
+
+Rules live in value_rules.json, evaluated top to bottom; a prop takes the
+first rule whose `props` list its canonical name (normalize.clean_prop, one
+of normalize.SUPPORTED_PROPS), so "PASS YARDS" and "PASSING YARDS" both hit
+the passing-yards rule. A row
+qualifies when its line is >= `min_line`, the `odds` requirement holds
+("any", or "not_both_negative" on Over/Under), and Projection - line is
+>= `min_edge`. The best row (highest edge, then shortest Over price) of
+every category listed in `show` is returned, in `show` order.
+
+Rules are resolved once per distinct prop name, so the per-row work is a
+handful of vectorized comparisons.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from normalize import SUPPORTED_PROPS, clean_prop
+
+RULES_FILE = Path(__file__).with_name("value_rules.json")
+ODDS_REQUIREMENTS = {"any", "not_both_negative"}
+
+def load_rules(path=RULES_FILE) -> dict:
+    """Parse and validate the rule config; returns {"show": [...], "rules": DataFrame}."""
+    cfg = json.loads(Path(path).read_text())
+    rules = pd.DataFrame(cfg["rules"])
+    bad = set(rules["odds"]) - ODDS_REQUIREMENTS
+    if bad:
+        raise ValueError(f"Unknown odds requirement(s) in {path}: {sorted(bad)}")
+    rules["props"] = rules["props"].apply(lambda m: [clean_prop(p) for p in ([m] if isinstance(m, str) else m)])
+    unknown = {p for props in rules["props"] for p in props} - SUPPORTED_PROPS
+    if unknown:
+        raise ValueError(f"Unsupported prop(s) in {path}: {sorted(unknown)}")
+    rules["min_line"] = rules["min_line"].astype(float)
+    rules["min_edge"] = rules["min_edge"].astype(float)
+    return {"show": list(cfg["show"]), "rules": rules.reset_index(drop=True)}
+
+def rule_for(prop: str, rules: pd.DataFrame) -> int:
+    """Index of the first rule listing `prop`'s canonical name, or -1."""
+    if not isinstance(prop, str):
+        return -1
+    prop = clean_prop(prop)
+    for i, props in enumerate(rules["props"]):
+        if prop in props:
+            return i
+    return -1
+
+def rule_index(props: pd.Series, rules: pd.DataFrame) -> np.ndarray:
+    """Rule index per row (-1 for none), resolved once per distinct prop name."""
+    codes, uniques = pd.factorize(props)
+    # Trailing -1 maps NaN props (code -1) to "no rule"
+    per_prop = np.array([rule_for(p, rules) for p in uniques] + [-1], dtype=np.int64)
+    return per_prop[codes]
+
+def score(df: pd.DataFrame, config: dict) -> pd.DataFrame:
+    """All qualifying rows with their Edge, category and Odds_Strength."""
+    rules = config["rules"]
+    rule_idx = rule_index(df["Prop"], rules)
+    has_rule = rule_idx >= 0
+    r = np.where(has_rule, rule_idx, 0)
+
+    line = pd.to_numeric(df["PrizePicks_Line"], errors="coerce").to_numpy(dtype=float)
+    proj = pd.to_numeric(df["Projection"], errors="coerce").to_numpy(dtype=float)
+    over = pd.to_numeric(df["Over_Odds"], errors="coerce").to_numpy(dtype=float)
+    under = pd.to_numeric(df["Under_Odds"], errors="coerce").to_numpy(dtype=float)
+    edge = proj - line
+
+    needs_plus = (rules["odds"] == "not_both_negative").to_numpy()[r]
+    both_negative = (over < 0) & (under < 0)
+    mask = (
+        has_rule
+        & (line >= rules["min_line"].to_numpy()[r])
+        & ~(needs_plus & both_negative)
+        & (proj > line)
+        & (edge >= rules["min_edge"].to_numpy()[r])
+    )
+
+    out = df[mask].assign(
+        Edge=edge[mask],
+        Category=rules["category"].to_numpy()[r[mask]],
+        Odds_Strength=np.nan_to_num(np.abs(over[mask]), nan=9999),
+    )
+    return out
+
+def top_value_props(df: pd.DataFrame, config: dict = None) -> pd.DataFrame:
+    """Best qualifying row per shown category (Edge desc, then |Over_Odds| asc), in `show` order."""
+    config = config or load_rules()
+    scored = score(df, config)
+    scored = scored[scored["Category"].isin(config["show"])]
+    if scored.empty:
+        return scored
+    order = pd.Categorical(scored["Category"], categories=config["show"], ordered=True)
+    ranked = scored.assign(_cat=order).sort_values(
+        ["_cat", "Edge", "Odds_Strength"], ascending=[True, False, True], kind="stable"
+    )
+    return ranked.drop_duplicates("_cat").drop(columns="_cat").reset_index(drop=True)
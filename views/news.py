@@ -0,0 +1,74 @@
+"""Sports News page: latest headlines from the shared feed cache (news_feed.NewsCache)."""
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+from streamlit_autorefresh import st_autorefresh
+
+from news_feed import NewsCache
+
+@st.cache_resource(show_spinner=False)
+def news_cache() -> NewsCache:
+    """One feed cache + refresher thread per process, shared by every session."""
+    return NewsCache().start()
+
+@st.cache_resource(show_spinner=False)
+def news_css() -> str:
+    """assets/news.css as a <style> block, read once per process; only this page sends it."""
+    return f"<style>\n{(Path(__file__).resolve().parent.parent / 'assets' / 'news.css').read_text()}</style>"
+
+def format_rss_date(dt_str):
+    # Example: 'Thu, 11 Sep 2025 17:24:00'
+    # Want: "Sep 11, 2025 – 5:24 PM"
+    try:
+        dt = datetime.strptime(dt_str, "%a, %d %b %Y %H:%M:%S")
+    except Exception:
+        try:
+            dt = datetime.strptime(dt_str, "%a, %d %b %Y %H:%M")
+        except Exception:
+            try:
+                dt = datetime.strptime(dt_str, "%d %b %Y %H:%M:%S")
+            except Exception:
+                return dt_str
+    return dt.strftime("%b %-d, %Y – %-I:%M %p") if hasattr(dt, "strftime") else dt_str
+
+def render():
+    st_autorefresh(interval=5 * 60 * 1000, key="sports_news_autorefresh")
+    st.markdown(news_css(), unsafe_allow_html=True)
+    st.markdown("<div class='section-title'>Latest NFL News</div>", unsafe_allow_html=True)
+
+    # Rendered from the process-wide cache; the network is only touched by its refresher thread
+    news = news_cache()
+    try:
+        rss_items = news.latest(limit=8)
+        if not rss_items and news.errors:
+            raise RuntimeError(news.errors)
+        for item in rss_items:
+            # Format date
+            date_str = format_rss_date(item['published'])
+            # Sanitize summary (truncate if too long)
+            summary = item['summary']
+            if summary and len(summary) > 320:
+                summary = summary[:310] + "..."
+            # Build thumbnail HTML if image exists
+            thumb_html = ""
+            if item.get("img_url"):
+                thumb_html = f'<img src="{item["img_url"]}" class="news-thumb" alt="news image" />'
+            # Render clickable bubble card
+            st.markdown(
+                f"""
+                <a href="{item['link']}" target="_blank" style="text-decoration:none;">
+                <div class="news-bubble">
+                    {thumb_html}
+                    <div class="news-content">
+                        <span class="news-title">{item['title']}</span>
+                        <span class="news-date">{date_str}</span>
+                        <span class="news-summary">{summary}</span>
+                    </div>
+                </div>
+                </a>
+                """,
+                unsafe_allow_html=True
+            )
+    except Exception:
+        st.error("Couldn't fetch News feed right now.")
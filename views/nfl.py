@@ -0,0 +1,220 @@
+"""NFL page: Player Search and Value Props, rendered from the shared value board."""
+import os
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import streamlit as st
+
+import value_board
+from prop_cards import render_cards
+
+if TYPE_CHECKING:
+    from player_search import PlayerSearchIndex
+
+# Frames loaded below are cached once per process and shared by every session;
+# app.py turns on pandas copy-on-write so filters/assigns never touch them.
+
+# ---------- Data ----------
+NFL_FILES = ["nfl_regular_with_proj.csv", "nfl_regular_sample_with_proj.csv", "nfl_regular.csv"]
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def read_board(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """One load per (path, mtime, size), shared read-only across sessions; never mutate the result.
+
+    The pipeline's value board is read as is; a plain CSV is turned into one in-process.
+    """
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return value_board.build(pd.read_csv(path), history=value_board.load_history())
+
+def nfl_source():
+    """(path, mtime_ns, size) of the board to show, or None when there is none."""
+    for fname in NFL_FILES:
+        try:
+            stat = os.stat(fname)
+        except FileNotFoundError:
+            continue
+        # Prefer the precomputed value board unless it is older than the file it was built from
+        if fname == value_board.SOURCE_CSV and os.path.exists(value_board.VALUE_BOARD):
+            vb = os.stat(value_board.VALUE_BOARD)
+            if vb.st_mtime_ns >= stat.st_mtime_ns:
+                fname, stat = value_board.VALUE_BOARD, vb
+        # A new pipeline write changes mtime/size, which is a new cache key
+        return fname, stat.st_mtime_ns, stat.st_size
+    return None
+
+def load_nfl_file():
+    source = nfl_source()
+    return read_board(*source) if source else pd.DataFrame()
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def read_entries(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """The pipeline's best entries (best_entries.py), one load per file version."""
+    return pd.read_parquet(path)
+
+def load_entries() -> pd.DataFrame:
+    """Best entries for the board on screen; empty until the pipeline has built them for it."""
+    from best_entries import BEST_ENTRIES
+    source = nfl_source()
+    try:
+        stat = os.stat(BEST_ENTRIES)
+    except FileNotFoundError:
+        return pd.DataFrame()
+    # Entries older than the board would list picks that are no longer posted
+    if source is None or stat.st_mtime_ns < source[1]:
+        return pd.DataFrame()
+    return read_entries(BEST_ENTRIES, stat.st_mtime_ns, stat.st_size)
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def read_odds_index(path: str, mtime_ns: int, size: int):
+    """The per-book odds index saved by 02_classify_and_merge, one load per file version."""
+    from odds_index import OddsIndex
+    return OddsIndex.load(path)
+
+def load_odds_index():
+    from odds_index import ODDS_INDEX
+    try:
+        stat = os.stat(ODDS_INDEX)
+    except FileNotFoundError:
+        return None
+    return read_odds_index(ODDS_INDEX, stat.st_mtime_ns, stat.st_size)
+
+@st.cache_resource(show_spinner=False)
+def player_search_index(players: tuple) -> "PlayerSearchIndex":
+    """Built once per distinct player list and shared by every session."""
+    from player_search import PlayerSearchIndex  # thefuzz only loads once someone searches
+    return PlayerSearchIndex(players)
+
+# ---------- Sub-pages ----------
+def player_search(df: pd.DataFrame):
+    # ---- Search-only player view (PrizePicks odds only) ----
+    st.markdown("<div class='section-title'>Player Search Results</div>", unsafe_allow_html=True)
+    # Only include players that have PrizePicks odds today (book odds, or a ladder-interpolated fair price)
+    priced = df["Over_Odds"].notna() & df["Under_Odds"].notna()
+    if "Fair_Over" in df.columns:
+        priced |= df["Fair_Over"].notna()
+    active_df = df[priced].dropna(subset=["PrizePicks_Line"])
+    players = sorted(active_df["Player"].dropna().unique())
+
+    # --- Player search input ---
+    search_str = st.text_input(
+        "Search by player",
+        value="",
+        key="nfl_player_search",
+        label_visibility="collapsed",
+        placeholder="Type a player name..."
+    )
+
+    selected_player = None
+    filtered_players = []
+    # Only filter if there is input
+    if search_str.strip():
+        index = player_search_index(tuple(players))
+        # Fuzzy top 5 (score > 60) over trigram-narrowed candidates
+        filtered_players = index.search(search_str)
+        # If exact match (case-insensitive), select that player
+        selected_player = index.exact(search_str)
+        # If not exact match and one fuzzy match, select that player
+        if not selected_player and len(filtered_players) == 1:
+            selected_player = filtered_players[0]
+        # If not exact match and multiple fuzzy matches, show as clickable links
+        elif not selected_player and len(filtered_players) > 1:
+            st.markdown("<div style='margin:10px 0 16px 0; font-size:1.06rem;'>Multiple matches found:</div>", unsafe_allow_html=True)
+            for fp in filtered_players:
+                # Create a link that sets the search box value to this player (simulate selection)
+                st.markdown(
+                    f"<a href='#{fp}' style='color:#b388ff; font-weight:700; text-decoration:none;' "
+                    f"onclick=\"window.parent.document.querySelector('input[id^=nfl_player_search]').value='{fp}';window.parent.document.querySelector('input[id^=nfl_player_search]').dispatchEvent(new Event('input', {{bubbles:true}}));return false;\">{fp}</a>",
+                    unsafe_allow_html=True
+                )
+        elif not selected_player and len(filtered_players) == 0:
+            st.info("No players found matching your search.")
+    # If no input, do not show any player list by default
+
+    # Only show props if a player is selected (not blank)
+    if selected_player:
+        pdata = df[df["Player"] == selected_player]
+
+        # All of the player's cards in one fragment; display fields come from value_board.build
+        render_cards(
+            pdata,
+            title_fn=lambda c: c["Prop_Title"],
+            badge_fn=lambda c: ("Recommended " + c["Recommended"]).where(c["Recommended"] != "", ""),
+            key="player_cards",
+        )
+        book_prices(selected_player)
+
+    # Guidance message below results (always visible)
+    st.markdown(
+        "<div style='text-align:center; color:#aaa; font-size:13px; margin:18px 0;'>"
+        "Want to research your own player? Feel free to search by players and look through all their prop data!"
+        "</div>",
+        unsafe_allow_html=True,
+    )
+
+def book_prices(player: str):
+    """Every book's Over/Under at each of the player's lines, from the shared odds index."""
+    index = load_odds_index()
+    if index is None:
+        return
+    from player_index import canonical_name
+    lines = index.player_lines(canonical_name(player))
+    if lines.empty:
+        return
+    with st.expander(f"Book prices ({len(index.books)} books)"):
+        table = lines.assign(
+            Prop=lines["prop_clean"].str.title(),
+            Over=value_board.format_odds_column(lines["Over_Odds"]),
+            Under=value_board.format_odds_column(lines["Under_Odds"]),
+        )
+        st.dataframe(table[["Prop", "Line", "Book", "Over", "Under"]], hide_index=True, use_container_width=True)
+
+def value_props(df: pd.DataFrame):
+    # ---- Top Value Props: Various prop types and thresholds ----
+    st.markdown("<div class='main-card'>", unsafe_allow_html=True)
+    st.markdown("<div class='section-title'>Top Value Props</div>", unsafe_allow_html=True)
+
+    if not df.empty:
+        # Category leaders were ranked by value_board.build (rules: value_rules.json)
+        show_all = st.toggle("Show all edges ≥ 1.0", key="value_show_all")
+        top = value_board.all_picks(df) if show_all else value_board.top_picks(df)
+        if not top.empty:
+            render_cards(
+                top,
+                title_fn=lambda c: c["Player"] + " - " + c["Prop_Title"],
+                badge_fn=lambda c: ["Recommended Over"] * len(c),
+                key="value_cards",
+            )
+        else:
+            st.info("No value props found for current thresholds and edges.")
+        entries_table()
+    else:
+        st.info("No data available for value props.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+def entries_table():
+    """Best 2-6 leg entries by no-vig EV, with their correlated EV (precomputed by best_entries.py)."""
+    entries = load_entries()
+    if entries.empty:
+        return
+    st.markdown("<div class='section-title'>Best Entries</div>", unsafe_allow_html=True)
+    st.dataframe(
+        entries[["Tier", "EV", "Sim_EV", "Hit_All", "Picks"]],
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "EV": st.column_config.NumberColumn("EV", format="%+.2f"),
+            "Sim_EV": st.column_config.NumberColumn("Correlated EV", format="%+.2f"),
+            "Hit_All": st.column_config.NumberColumn("All hit", format="%.3f"),
+        },
+    )
+
+def render(sub_option: str = "Player Search"):
+    df = load_nfl_file()
+    if df.empty:
+        st.info("No merged NFL file found (expected nfl_regular_with_proj.csv).")
+    elif sub_option == "Player Search":
+        player_search(df)
+    elif sub_option == "Value Props":
+        value_props(df)